@@ -0,0 +1,55 @@
+"""
+Microbenchmark for the query compiler.
+
+Measures the cost of compiling queries with many clauses, both for freshly
+created expressions (cold) and for expressions already compiled once (warm),
+which is the case of a query being executed multiple times.
+
+Usage:
+
+    python benchmarks/compile_expressions.py [clauses] [iterations]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import List
+
+from mongoz import Expression, Q
+
+
+def build_expressions(clauses: int) -> List[Expression]:
+    expressions: List[Expression] = []
+    for index in range(clauses):
+        field = f"field_{index % 10}"
+        if index % 4 == 0:
+            expressions.append(Q.gte(field, index))
+        elif index % 4 == 1:
+            expressions.append(Q.lt(field, index * 10))
+        elif index % 4 == 2:
+            expressions.append(Q.in_(field, [index]))
+        else:
+            expressions.append(Q.or_(Q.eq(field, index), Q.eq(f"{field}_alt", index)))
+    return expressions
+
+
+def main() -> None:
+    clauses = int(sys.argv[1]) if len(sys.argv) > 1 else 25
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    cold = timeit.timeit(
+        lambda: Expression.compile_many(build_expressions(clauses)), number=iterations
+    )
+    build = timeit.timeit(lambda: build_expressions(clauses), number=iterations)
+
+    expressions = build_expressions(clauses)
+    warm = timeit.timeit(lambda: Expression.compile_many(expressions), number=iterations)
+
+    print(f"Clauses: {clauses}, iterations: {iterations}")
+    print(f"Cold compile: {(cold - build) / iterations * 1e6:.2f} µs/query")
+    print(f"Warm compile: {warm / iterations * 1e6:.2f} µs/query")
+
+
+if __name__ == "__main__":
+    main()
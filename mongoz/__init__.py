@@ -4,6 +4,7 @@ from .conf import settings
 from .conf.global_settings import MongozSettings
 from .core.connection.database import Database
 from .core.connection.registry import Registry
+from .core.connection.transactions import Transaction, get_transaction
 from .core.db import fields
 from .core.db.datastructures import Index, IndexType, Order
 from .core.db.documents import Document, EmbeddedDocument
@@ -29,25 +30,44 @@ from .core.db.fields import (
     Time,
 )
 from .core.db.querysets.base import Manager, QuerySet
+from .core.db.querysets.bulk import (
+    BulkWriteResult,
+    Delete,
+    Insert,
+    Update,
+    UpdateResult,
+    Upsert,
+)
+from .core.db.querysets.cache import QueryCache, query_cache
 from .core.db.querysets.expressions import Expression, SortExpression
 from .core.db.querysets.operators import Q
+from .core.db.querysets.session import Session, get_session
+from .core.db.querysets.updates import AddToSet, Inc, Max, Min, Pull, Push
+from .core.db.querysets.writer import BufferedWriter
 from .core.signals import Signal
 from .core.utils.sync import run_sync
 from .exceptions import (
+    BulkWriteError,
     DocumentNotFound,
     ImproperlyConfigured,
     MultipleDocumentsReturned,
+    StaleDocumentError,
 )
 
 __all__ = [
+    "AddToSet",
     "Array",
     "ArrayList",
     "Binary",
     "Boolean",
+    "BufferedWriter",
+    "BulkWriteError",
+    "BulkWriteResult",
     "Database",
     "Date",
     "DateTime",
     "Decimal",
+    "Delete",
     "Document",
     "DocumentNotFound",
     "Double",
@@ -59,24 +79,40 @@ __all__ = [
     "ImproperlyConfigured",
     "Index",
     "IndexType",
+    "Inc",
+    "Insert",
     "Integer",
     "NullableObjectId",
     "ForeignKey",
     "Manager",
+    "Max",
+    "Min",
     "MongozSettings",
     "MultipleDocumentsReturned",
     "Object",
     "ObjectId",
     "Order",
+    "Pull",
+    "Push",
     "Q",
+    "QueryCache",
     "QuerySet",
     "QuerySetManager",
     "Registry",
+    "Session",
     "Signal",
     "SortExpression",
+    "StaleDocumentError",
     "String",
     "Time",
+    "Transaction",
+    "Update",
+    "UpdateResult",
+    "Upsert",
     "UUID",
     "settings",
+    "get_session",
+    "get_transaction",
+    "query_cache",
     "run_sync",
 ]
@@ -26,6 +26,15 @@ class MongozSettings(BaseSettings):
     # Lookup field prefix
     lookup_prefix: str = "lookup_on_"
 
+    # Maximum number of queries kept by the query cache
+    query_cache_maxsize: int = 1024
+
+    # Background signal receivers: the calls waiting in the queue, the tasks
+    # running them and the seconds a call may take before it is cancelled
+    signal_queue_maxsize: int = 1000
+    signal_workers: int = 4
+    signal_timeout: float = 30
+
     filter_operators: ClassVar[Dict[str, str]] = {
         "exact": "eq",
         "neq": "neq",
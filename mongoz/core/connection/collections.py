@@ -1,6 +1,21 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Tuple, Union, cast
+
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+
+from mongoz.exceptions import MongozException
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primarypreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondarypreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
 
 
 class Collection:
@@ -11,3 +26,100 @@ class Collection:
     def __init__(self, name: str, collection: AsyncIOMotorCollection) -> None:
         self._collection: AsyncIOMotorCollection = collection
         self.name = name
+
+
+def to_read_preference(value: Any) -> Any:
+    """
+    Converts the mode name of a read preference (e.g. "secondaryPreferred"
+    or "secondary_preferred") to a pymongo read preference.
+    """
+    if not isinstance(value, str):
+        return value
+
+    read_preference = READ_PREFERENCES.get(value.replace("_", "").lower())
+    if read_preference is None:
+        raise MongozException(detail=f"Invalid read preference: {value}")
+    return read_preference
+
+
+def to_read_concern(value: Union[str, ReadConcern, None]) -> Union[ReadConcern, None]:
+    """
+    Converts the level of a read concern (e.g. "majority") to a pymongo
+    read concern.
+    """
+    if isinstance(value, str):
+        return ReadConcern(value)
+    return value
+
+
+def to_write_concern(value: Any) -> Union[WriteConcern, None]:
+    """
+    Converts a write concern given as the `w` value (e.g. 0, 1 or
+    "majority") or as a dictionary of options (e.g. {"w": 1, "j": True}) to
+    a pymongo write concern.
+    """
+    if value is None or isinstance(value, WriteConcern):
+        return value
+    if isinstance(value, dict):
+        return WriteConcern(**value)
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        return WriteConcern(w=value)
+    raise MongozException(detail=f"Invalid write concern: {value}")
+
+
+def with_options(
+    collection: AsyncIOMotorCollection,
+    read_preference: Any = None,
+    read_concern: Union[ReadConcern, None] = None,
+    write_concern: Union[WriteConcern, None] = None,
+) -> AsyncIOMotorCollection:
+    """
+    Returns the collection handle with the given options, keeping the other
+    options of the collection.
+
+    The handles are built once per collection and set of options and reused
+    by every query. They are kept on the client, hence released with it.
+    """
+    if read_preference is None and read_concern is None and write_concern is None:
+        return collection
+
+    if read_preference is None:
+        read_preference = collection.read_preference
+    if read_concern is None:
+        read_concern = collection.read_concern
+    if write_concern is None:
+        write_concern = collection.write_concern
+
+    # The options are not hashable, hence the repr of each one in the key.
+    key = (
+        collection.full_name,
+        repr(collection.codec_options),
+        repr(write_concern),
+        repr(read_preference),
+        repr(read_concern),
+    )
+    handles = get_handles(collection.database.client)
+    handle = handles.get(key)
+    if handle is None:
+        handle = collection.with_options(
+            read_preference=read_preference,
+            read_concern=read_concern,
+            write_concern=write_concern,
+        )
+        handles[key] = handle
+    return handle
+
+
+def get_handles(client: Any) -> Dict[Tuple[Any, ...], AsyncIOMotorCollection]:
+    """
+    Returns the derived handles of the client by collection and options.
+
+    The clients compare equal by address, hence the cache is an attribute
+    of each one instead of a mapping keyed by client. It is read from the
+    attributes of the instance, the client returning a database for any
+    other name.
+    """
+    handles = vars(client).get("_mongoz_handles")
+    if handles is None:
+        handles = client._mongoz_handles = {}
+    return cast(Dict[Tuple[Any, ...], AsyncIOMotorCollection], handles)
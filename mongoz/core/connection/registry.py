@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Callable, Dict, Sequence, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from mongoz.core.connection.database import Database
+from mongoz.core.connection.transactions import TRANSACTION_RETRIES, Transaction, run_transaction
 
 if TYPE_CHECKING:
     from mongoz import Document
 
+T = TypeVar("T")
+
 
 class Registry:
     """
@@ -60,6 +74,42 @@ class Registry:
         databases = await self._client.list_database_names()
         return list(map(self.get_database, databases))
 
+    def transaction(self, **options: Any) -> Transaction:
+        """
+        Returns a transaction binding a client session to the current
+        context, committed when the block exits and aborted when it raises.
+
+        The options are the `read_concern`, `write_concern`, `read_preference`
+        and `max_commit_time_ms` of the transaction.
+
+        E.g.:
+
+            async with registry.transaction():
+                await Account.objects.filter(name="Alice").update_many(balance=Inc(-10))
+                await Account.objects.filter(name="Bob").update_many(balance=Inc(10))
+        """
+        return Transaction(self._client, **options)
+
+    async def with_transaction(
+        self,
+        func: Callable[[], Awaitable[T]],
+        retries: int = TRANSACTION_RETRIES,
+        **options: Any,
+    ) -> T:
+        """
+        Runs the function in a transaction, running it again in a new one
+        when it fails with a TransientTransactionError, e.g. a write conflict
+        with another transaction.
+
+        E.g.:
+
+            async def transfer() -> None:
+                ...
+
+            await registry.with_transaction(transfer)
+        """
+        return await run_transaction(self._client, func, retries=retries, **options)
+
     async def document_checks(self) -> None:
         """
         Runs the document checks for all the documents in the registry.
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Dict, TypeVar, Union
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from pymongo.errors import PyMongoError
+
+from mongoz.core.connection.collections import (
+    to_read_concern,
+    to_read_preference,
+    to_write_concern,
+)
+from mongoz.exceptions import MongozException
+
+T = TypeVar("T")
+
+# The retries of a transaction failing with a TransientTransactionError, and
+# of its commit failing with an UnknownTransactionCommitResult.
+TRANSACTION_RETRIES = 3
+
+_current_transaction: ContextVar[Union["Transaction", None]] = ContextVar(
+    "mongoz_transaction", default=None
+)
+
+
+def get_transaction() -> Union["Transaction", None]:
+    """
+    Returns the transaction of the current context, if any.
+    """
+    return _current_transaction.get()
+
+
+def get_client_session() -> Union[AsyncIOMotorClientSession, None]:
+    """
+    Returns the client session of the transaction of the current context,
+    passed to every operation of the managers, querysets and documents.
+    """
+    transaction = _current_transaction.get()
+    if transaction is None:
+        return None
+    return transaction.session
+
+
+def check_no_transaction(operation: str) -> None:
+    """
+    Raises for the operations running concurrent queries, as a client session
+    can only be used by one operation at a time.
+    """
+    if _current_transaction.get() is not None:
+        raise MongozException(detail=f"{operation} can't be used in a transaction.")
+
+
+class Transaction:
+    """
+    Multi-document transaction, binding a client session to the current
+    context so every query and write inside the block is part of it.
+
+    The transaction is committed when the block exits and aborted when it
+    raises. Transactions require a replica set or a sharded cluster.
+
+    Usage:
+
+        async with registry.transaction():
+            await Account.objects.filter(name="Alice").update_many(balance=Inc(-10))
+            await Account.objects.filter(name="Bob").update_many(balance=Inc(10))
+    """
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        read_concern: Any = None,
+        write_concern: Any = None,
+        read_preference: Any = None,
+        max_commit_time_ms: Union[int, None] = None,
+    ) -> None:
+        self.client = client
+        self.options: Dict[str, Any] = {
+            "read_concern": to_read_concern(read_concern),
+            "write_concern": to_write_concern(write_concern),
+            "read_preference": to_read_preference(read_preference),
+            "max_commit_time_ms": max_commit_time_ms,
+        }
+        self.session: Union[AsyncIOMotorClientSession, None] = None
+        self._token: Union[Token, None] = None
+
+    async def __aenter__(self) -> "Transaction":
+        if _current_transaction.get() is not None:
+            raise MongozException(detail="Transactions can't be nested.")
+
+        self.session = await self.client.start_session()
+        self.session.start_transaction(**self.options)
+        self._token = _current_transaction.set(self)
+        return self
+
+    async def __aexit__(self, exc_type: Any, *args: Any) -> None:
+        _current_transaction.reset(self._token)
+        self._token = None
+
+        # The stubs of motor declare in_transaction as a method.
+        session: Any = self.session
+        try:
+            if not session.in_transaction:
+                return
+            if exc_type is not None:
+                await session.abort_transaction()
+                return
+            await self._commit()
+        finally:
+            await session.end_session()
+
+    async def abort(self) -> None:
+        """
+        Aborts the transaction, discarding its writes without raising.
+        """
+        session: Any = self.session
+        if session is not None and session.in_transaction:
+            await session.abort_transaction()
+
+    async def _commit(self) -> None:
+        assert self.session is not None
+        for attempt in range(TRANSACTION_RETRIES + 1):
+            try:
+                await self.session.commit_transaction()
+                break
+            except PyMongoError as e:
+                if attempt == TRANSACTION_RETRIES or not e.has_error_label(
+                    "UnknownTransactionCommitResult"
+                ):
+                    raise
+
+        # The queries run outside of the transaction before the commit may
+        # have cached the previous version of the documents it changed.
+        from mongoz.core.db.querysets.cache import query_cache
+
+        query_cache.invalidate()
+
+
+async def run_transaction(
+    client: AsyncIOMotorClient,
+    func: Callable[[], Awaitable[T]],
+    retries: int = TRANSACTION_RETRIES,
+    **options: Any,
+) -> T:
+    """
+    Runs the function in a transaction, running it again in a new
+    transaction, up to `retries` times, when it fails with a
+    TransientTransactionError, e.g. a write conflict.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with Transaction(client, **options):
+                return await func()
+        except PyMongoError as e:
+            if attempt >= retries or not e.has_error_label("TransientTransactionError"):
+                raise
+            attempt += 1
@@ -11,7 +11,6 @@ from typing import (
     Type,
     TypeVar,
     Union,
-    cast,
 )
 
 import bson
@@ -19,14 +18,26 @@ import pydantic
 from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorCollection
 from pydantic import BaseModel
+from pymongo import ReturnDocument
 
-from mongoz.core.connection.collections import Collection
-from mongoz.core.db.documents._internal import ModelDump
+from mongoz.core.connection.collections import Collection, to_write_concern, with_options
+from mongoz.core.connection.transactions import get_client_session
 from mongoz.core.db.documents.document_row import DocumentRow
 from mongoz.core.db.documents.metaclasses import EmbeddedModelMetaClass
 from mongoz.core.db.fields.base import MongozField
+from mongoz.core.db.querysets.bulk import Models, insert_models
+from mongoz.core.db.querysets.cache import query_cache
+from mongoz.core.db.querysets.session import get_session
+from mongoz.core.db.querysets.updates import compile_update
+from mongoz.core.db.querysets.writer import BufferedWriter
 from mongoz.core.utils.hashable import make_hashable
-from mongoz.exceptions import InvalidKeyError, MongozException
+from mongoz.exceptions import (
+    BulkWriteError,
+    DocumentNotFound,
+    InvalidKeyError,
+    MongozException,
+    StaleDocumentError,
+)
 from mongoz.utils.mixins import is_operation_allowed
 
 T = TypeVar("T", bound="Document")
@@ -40,6 +51,7 @@ class Document(DocumentRow):
     async def create(
         self: "Document",
         collection: Union[AsyncIOMotorCollection, None] = None,
+        write_concern: Any = None,
     ) -> "Document":
         """
         Inserts a document.
@@ -50,13 +62,20 @@ class Document(DocumentRow):
 
         data = self.model_dump(exclude={"id"})
         if collection is not None:
-            result = await collection.insert_one(data)
+            result = await self._with_write_concern(collection, write_concern).insert_one(
+                data, session=get_client_session()
+            )
         else:
             if isinstance(self.meta.collection, Collection):
-                result = await self.meta.collection._collection.insert_one(
-                    data
-                )  # noqa
+                result = await self._with_write_concern(
+                    self.meta.collection._collection, write_concern
+                ).insert_one(data, session=get_client_session())
         self.id = result.inserted_id
+        self.take_snapshot()
+
+        session = get_session()
+        if session is not None:
+            session.add(self, collection)
 
         await self.signals.post_save.send(sender=self.__class__, instance=self)
         return self
@@ -64,6 +83,7 @@ class Document(DocumentRow):
     async def update(
         self,
         collection: Union[AsyncIOMotorCollection, None] = None,
+        write_concern: Any = None,
         **kwargs: Any,
     ) -> "Document":
         """
@@ -74,62 +94,153 @@ class Document(DocumentRow):
                 collection = self.meta.from_collection
             elif isinstance(self.meta.collection, Collection):
                 collection = self.meta.collection._collection
-        field_definitions = {
-            name: (annotations, ...)
-            for name, annotations in self.__annotations__.items()
-            if name in kwargs
-        }
-        if field_definitions:
-            pydantic_model: Type[BaseModel] = pydantic.create_model(
-                self.__class__.__name__,
-                __base__=ModelDump,
-                **field_definitions,
-            )
-            model = pydantic_model.model_validate(kwargs)
-            values = model.model_dump()
-
-            # Model data
-            data = self.model_dump(exclude={"id": "_id"})
-            data.update(values)
+        update = compile_update(self.__class__, kwargs, strict=False)
+        if update:
+            # The given values and the ones changed since the document was
+            # loaded, except the fields with update operators.
+            fields = {name for clause in update.values() for name in clause}
+            changes = {
+                name: value
+                for name, value in self.get_changes().items()
+                if name not in fields
+            }
+            if changes:
+                update["$set"] = {**changes, **update.get("$set", {})}
+                fields.update(changes)
+            has_operators = bool(update.keys() - {"$set"})
+            filter_query = self._get_version_filter(update)
 
             await self.signals.pre_update.send(
                 sender=self.__class__, instance=self
             )
-            await collection.update_one({"_id": self.id}, {"$set": data})  # type: ignore
+            handle = self._with_write_concern(collection, write_concern)
+            if not has_operators:
+                result = await handle.update_one(
+                    filter_query, update, session=get_client_session()
+                )
+                self._check_version(result)
+                values = update.get("$set", {})
+            else:
+                # The values of the update operators are only known once
+                # applied, hence reading the updated document back.
+                row = await handle.find_one_and_update(
+                    filter_query,
+                    update,
+                    return_document=ReturnDocument.AFTER,
+                    session=get_client_session(),
+                )
+                if row is None:
+                    if self.meta.version_field is not None:
+                        raise self._stale_error()
+                    raise DocumentNotFound()
+                stored = self.__class__(**row)
+                values = {name: getattr(stored, name) for name in fields}
+            values.update(self._get_next_version(filter_query))
             await self.signals.post_update.send(
                 sender=self.__class__, instance=self
             )
 
-            for k, v in data.items():
+            for k, v in values.items():
                 setattr(self, k, v)
+            self.take_snapshot()
+
+            session = get_session()
+            if session is not None:
+                session.add(self, collection)
         return self
 
     @classmethod
     async def create_many(
         cls: Type["Document"],
-        models: List["Document"],
+        models: Models,
         collection: Union[Collection, AsyncIOMotorCollection, None] = None,
-    ) -> List["Document"]:
+        chunk_size: Union[int, None] = None,
+        ordered: bool = True,
+        concurrency: int = 1,
+        write_concern: Any = None,
+    ) -> Any:
         """
-        Insert many documents
+        Insert many documents.
+
+        The models are inserted in batches of up to `chunk_size` documents,
+        split at the size limits of the server, with up to `concurrency`
+        batches at the same time when not `ordered`. Any iterable or async
+        iterable of models is consumed as the batches are inserted.
+
+        Returns the models for a list or a tuple, otherwise the
+        `BulkWriteResult` with the ids by position of the models. When any
+        model fails, a `BulkWriteError` is raised with the result. The errors
+        of an unacknowledged `write_concern` are not reported.
         """
         is_operation_allowed(cls)
 
-        if not all(isinstance(model, cls) for model in models):
+        if isinstance(models, (list, tuple)) and not all(
+            isinstance(model, cls) for model in models
+        ):
             raise TypeError(f"All models must be of type {cls.__name__}")
 
-        data = (model.model_dump(exclude={"id"}) for model in models)
         if isinstance(collection, Collection):
-            results = await collection._collection.insert_many(data)
-        elif isinstance(collection, AsyncIOMotorCollection):
-            results = await collection.insert_many(data)
-        else:
-            results = await cls.meta.collection._collection.insert_many(data)  # type: ignore
-        for model, inserted_id in zip(
-            models, results.inserted_ids, strict=True
-        ):
-            model.id = inserted_id
-        return models
+            collection = collection._collection
+        elif not isinstance(collection, AsyncIOMotorCollection):
+            collection = cls.meta.collection._collection  # type: ignore
+
+        collection = cls._with_write_concern(collection, write_concern)
+        try:
+            result = await insert_models(
+                collection,
+                cls,
+                models,
+                chunk_size=chunk_size,
+                ordered=ordered,
+                concurrency=concurrency,
+            )
+        finally:
+            query_cache.invalidate(cls.meta.collection.name)  # type: ignore
+
+        if result.errors:
+            raise BulkWriteError(
+                result=result, detail=f"{len(result.errors)} documents failed."
+            )
+        if isinstance(models, (list, tuple)):
+            return models
+        return result
+
+    @classmethod
+    def buffered_writer(
+        cls: Type["Document"],
+        max_batch: int = 1000,
+        max_delay_ms: float = 50,
+        max_pending: Union[int, None] = None,
+        collection: Union[Collection, AsyncIOMotorCollection, None] = None,
+    ) -> BufferedWriter:
+        """
+        Returns a write buffer gathering the inserts of many concurrent tasks
+        into unordered batches of up to `max_batch` documents, written at
+        most `max_delay_ms` after being buffered.
+
+        The writer must be closed, or used as an async context manager, so
+        the buffered documents are written on shutdown.
+
+        E.g.:
+
+            writer = Event.buffered_writer(max_batch=1000, max_delay_ms=50)
+            id = await writer.insert(Event(name="click"))
+            await writer.close()
+        """
+        is_operation_allowed(cls)
+
+        if isinstance(collection, Collection):
+            collection = collection._collection
+        elif not isinstance(collection, AsyncIOMotorCollection):
+            collection = cls.meta.collection._collection  # type: ignore
+
+        return BufferedWriter(
+            cls,
+            cls._with_write_concern(collection),
+            max_batch=max_batch,
+            max_delay_ms=max_delay_ms,
+            max_pending=max_pending,
+        )
 
     @classmethod
     def get_collection(
@@ -358,9 +469,16 @@ class Document(DocumentRow):
                 await cls.drop_index(name, collection)
 
     async def delete(
-        self, collection: Union[AsyncIOMotorCollection, None] = None
-    ) -> int:
-        """Delete the document."""
+        self,
+        collection: Union[AsyncIOMotorCollection, None] = None,
+        write_concern: Any = None,
+    ) -> Union[int, None]:
+        """
+        Delete the document.
+
+        Returns the number of deleted documents, not known (None) when the
+        write concern is unacknowledged.
+        """
         is_operation_allowed(self)
 
         if collection is None:
@@ -372,11 +490,19 @@ class Document(DocumentRow):
             sender=self.__class__, instance=self
         )
 
-        result = await collection.delete_one({"_id": self.id})  # type: ignore
+        result = await self._with_write_concern(collection, write_concern).delete_one(
+            {"_id": self.id}, session=get_client_session()
+        )
+
+        session = get_session()
+        if session is not None:
+            session.discard(self, collection)
         await self.signals.post_delete.send(
             sender=self.__class__, instance=self
         )
-        return cast(int, result.deleted_count)
+        if not result.acknowledged:
+            return None
+        return result.deleted_count
 
     @classmethod
     async def drop_index(
@@ -423,11 +549,15 @@ class Document(DocumentRow):
     async def save(
         self: "Document",
         collection: Union[AsyncIOMotorCollection, None] = None,
+        write_concern: Any = None,
     ) -> "Document":
         """Save the document.
 
         This is equivalent of a single instance update.
 
+        Only the fields changed since the document was loaded or last saved
+        are written and nothing is sent when no field changed.
+
         When saving the document, if an ID is not provided or it is None,
         it will create a new docuemnt. These scenarios happen when for instance
         a copy of the object is needed on save().
@@ -448,19 +578,98 @@ class Document(DocumentRow):
                 collection = self.meta.collection._collection
 
         if not self.id:
-            return await self.create()
+            return await self.create(write_concern=write_concern)
 
         await self.signals.pre_save.send(sender=self.__class__, instance=self)
 
-        await collection.update_one(  # type: ignore
-            {"_id": self.id}, {"$set": self.model_dump(exclude={"id", "_id"})}
-        )
-        for k, v in self.model_dump(exclude={"id"}).items():
-            setattr(self, k, v)
+        # Only the values changed since the document was loaded are written,
+        # skipping the write when nothing changed.
+        changes = self.get_changes()
+        if changes:
+            update = {"$set": changes}
+            filter_query = self._get_version_filter(update)
+            result = await self._with_write_concern(collection, write_concern).update_one(
+                filter_query, update, session=get_client_session()
+            )
+            self._check_version(result)
+            for k, v in self._get_next_version(filter_query).items():
+                setattr(self, k, v)
+            self.take_snapshot()
+
+        session = get_session()
+        if session is not None:
+            session.add(self, collection)
 
         await self.signals.post_save.send(sender=self.__class__, instance=self)
         return self
 
+    def _get_version_filter(self, update: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the filter of the document for the update.
+
+        With a `version_field`, the filter only matches the version the
+        document was loaded with, which the update sets to the next one.
+        """
+        filter_query: Dict[str, Any] = {"_id": self.id}
+        version_field = self.meta.version_field
+        if version_field is None:
+            return filter_query
+
+        for clause in update.values():
+            clause.pop(version_field, None)
+        for operator in [operator for operator, clause in update.items() if not clause]:
+            del update[operator]
+
+        snapshot = self._snapshot
+        if snapshot is not None and version_field in snapshot:
+            version = snapshot[version_field]
+        else:
+            version = getattr(self, version_field)
+        # A document never written with a version may store none, or null,
+        # read as the default.
+        filter_query[version_field] = version if version else {"$in": [0, None]}
+        # Setting the next version, unlike $inc, also works on a null one.
+        update.setdefault("$set", {}).update(self._get_next_version(filter_query))
+        return filter_query
+
+    def _get_next_version(self, filter_query: Dict[str, Any]) -> Dict[str, Any]:
+        version_field = self.meta.version_field
+        if version_field is None:
+            return {}
+        version = filter_query[version_field]
+        return {version_field: version + 1 if isinstance(version, int) else 1}
+
+    def _check_version(self, result: Any) -> None:
+        """
+        Raises a `StaleDocumentError` when the update of a document with a
+        `version_field` matched no document.
+
+        The matches of an unacknowledged update are not known, hence not
+        checked. A stale document is still not overwritten.
+        """
+        if self.meta.version_field is None or not result.acknowledged:
+            return
+        if result.matched_count == 0:
+            raise self._stale_error()
+
+    def _stale_error(self) -> StaleDocumentError:
+        return StaleDocumentError(
+            detail=f"{self.__class__.__name__}(id={self.id}) was changed or deleted "
+            "since it was loaded."
+        )
+
+    @classmethod
+    def _with_write_concern(
+        cls, collection: AsyncIOMotorCollection, write_concern: Any = None
+    ) -> AsyncIOMotorCollection:
+        """
+        Applies the write concern, e.g. 0, 1, "majority" or a pymongo write
+        concern, or the default of the Meta, to the collection.
+        """
+        return with_options(
+            collection, write_concern=to_write_concern(write_concern) or cls.meta.write_concern
+        )
+
     @classmethod
     async def get_document_by_id(
         cls: Type[T], id: Union[str, bson.ObjectId]
@@ -473,6 +682,12 @@ class Document(DocumentRow):
             except InvalidId as e:
                 raise InvalidKeyError(f'"{id}" is not a valid ObjectId') from e
 
+        session = get_session()
+        if session is not None:
+            instance = session.get(cls.meta.collection._collection, id)  # type: ignore
+            if instance is not None:
+                return instance
+
         return await cls.query({"_id": id}).get()
 
     def __repr__(self) -> str:
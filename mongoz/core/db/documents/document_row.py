@@ -3,9 +3,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Sequence, Type, Union, cast
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import PrivateAttr
 
 from mongoz import settings
 from mongoz.core.db.documents.base import MongozBaseModel
+from mongoz.core.db.querysets.session import get_collection, get_session
+from mongoz.core.utils.documents import construct_model, copy_value
 
 if TYPE_CHECKING:  # pragma: no cover
     from mongoz import Document
@@ -16,6 +19,53 @@ class DocumentRow(MongozBaseModel):
     Builds a row for a specific document
     """
 
+    _source_database: Union[str, None] = PrivateAttr(default=None)
+    _snapshot: Union[Dict[str, Any], None] = PrivateAttr(default=None)
+
+    @property
+    def source_database(self) -> Union[str, None]:
+        """
+        The name of the database the document was read from by a query using
+        `across()`.
+        """
+        return self._source_database
+
+    def take_snapshot(self, fields: Union[Sequence[str], None] = None) -> None:
+        """
+        Records the current values as the stored ones, all of them or only
+        the given fields.
+        """
+        if fields is None or self._snapshot is None:
+            self._snapshot = self.model_dump(exclude={"id"})
+        else:
+            self._snapshot.update(self.model_dump(include=set(fields)))
+
+    def take_row_snapshot(self, row: Dict[str, Any]) -> None:
+        """
+        Records the values of the row the document was built from as the
+        stored ones, copying them instead of dumping the document.
+        """
+        snapshot = {name: copy_value(value) for name, value in row.items() if name != "id"}
+        missing = set(self.model_fields) - set(snapshot) - {"id"}
+        if missing:
+            snapshot.update(self.model_dump(include=missing))
+        self._snapshot = snapshot
+
+    def get_changes(self) -> Dict[str, Any]:
+        """
+        Returns the values changed since the document was loaded or last
+        written, or all of them for a document never loaded.
+        """
+        values = self.model_dump(exclude={"id"})
+        snapshot = self._snapshot
+        if snapshot is None:
+            return values
+        return {
+            name: value
+            for name, value in values.items()
+            if name not in snapshot or snapshot[name] != value
+        }
+
     @classmethod
     def from_row(
         cls: "Document",
@@ -25,12 +75,19 @@ class DocumentRow(MongozBaseModel):
         only_fields: Union[Sequence[str], None] = None,
         defer_fields: Union[Sequence[str], None] = None,
         from_collection: Union[AsyncIOMotorCollection, None] = None,
+        trusted: bool = False,
     ) -> Union[Type["Document"], None]:
         """
         Class method to convert a dictionary row result into a Document row type.
+
+        Inside a session, the document already loaded with the same id is
+        returned instead of hydrating a new one. A `trusted` row is not
+        validated, see `construct_model()`.
         :return: Document class.
         """
         item: Dict[str, Any] = {}
+        session = get_session()
+        has_lookups = False
 
         if is_only_fields or is_defer_fields:
             mapping = (
@@ -55,11 +112,20 @@ class DocumentRow(MongozBaseModel):
             model = cast("Type[Document]", cls.proxy_document(**item))
             return model
         else:
+            if session is not None and "_id" in row:
+                collection = get_collection(cls, from_collection)
+                instance = session.get(collection, row["_id"])
+                if instance is not None:
+                    return cast("Type[Document]", instance)
+
+            # Read once, the settings are looked up on every access.
+            lookup_prefix = settings.lookup_prefix
             for column, value in row.items():
                 column = cls.validate_id_field(column)
                 if column not in item:
-                    if settings.lookup_prefix in column:
-                        loopkup_field = column.split(settings.lookup_prefix)[
+                    if lookup_prefix in column:
+                        has_lookups = True
+                        loopkup_field = column.split(lookup_prefix)[
                             -1
                         ]
                         values = []
@@ -79,8 +145,19 @@ class DocumentRow(MongozBaseModel):
                     else:
                         item[column] = value
 
-        model = cast("Type[Document]", cls(**item))  # type: ignore
+        if trusted:
+            model = cast("Type[Document]", construct_model(cls, item))
+        else:
+            model = cast("Type[Document]", cls(**item))  # type: ignore
         model.Meta.from_collection = from_collection
+        # The snapshot copies the row rather than dumping the document again,
+        # except for the looked up documents, which are models.
+        if has_lookups:
+            model.take_snapshot()  # type: ignore
+        else:
+            model.take_row_snapshot(item)  # type: ignore
+        if session is not None and "_id" in row:
+            session.add(model, from_collection)
         return model
 
     @classmethod
@@ -20,7 +20,12 @@ from typing import (
 from motor.motor_asyncio import AsyncIOMotorCollection
 from pydantic._internal._model_construction import ModelMetaclass
 
-from mongoz.core.connection.collections import Collection
+from mongoz.core.connection.collections import (
+    Collection,
+    to_read_concern,
+    to_read_preference,
+    to_write_concern,
+)
 from mongoz.core.connection.database import Database
 from mongoz.core.connection.registry import Registry
 from mongoz.core.db.datastructures import Index
@@ -55,6 +60,12 @@ class MetaInfo:
         "manager",
         "autogenerate_index",
         "from_collection",
+        "batch_size",
+        "read_preference",
+        "read_concern",
+        "version_field",
+        "write_concern",
+        "trusted_reads",
     )
 
     def __init__(self, meta: Any = None, **kwargs: Any) -> None:
@@ -86,6 +97,14 @@ class MetaInfo:
         self.from_collection: Union[AsyncIOMotorCollection, None] = getattr(
             meta, "from_collection", None
         )
+        self.batch_size: Union[int, None] = getattr(meta, "batch_size", None)
+        self.read_preference: Any = to_read_preference(
+            getattr(meta, "read_preference", None)
+        )
+        self.read_concern: Any = to_read_concern(getattr(meta, "read_concern", None))
+        self.version_field: Union[str, None] = getattr(meta, "version_field", None)
+        self.write_concern: Any = to_write_concern(getattr(meta, "write_concern", None))
+        self.trusted_reads: bool = getattr(meta, "trusted_reads", False)
 
     def model_dump(self) -> Dict[Any, Any]:
         return {k: getattr(self, k, None) for k in self.__slots__}
@@ -205,6 +224,12 @@ def _register_document_signals(model_class: Type["Document"]) -> None:
     signals.post_save = Signal()
     signals.post_update = Signal()
     signals.post_delete = Signal()
+    signals.pre_bulk_create = Signal()
+    signals.pre_bulk_update = Signal()
+    signals.pre_bulk_delete = Signal()
+    signals.post_bulk_create = Signal()
+    signals.post_bulk_update = Signal()
+    signals.post_bulk_delete = Signal()
     model_class.meta.signals = signals
 
 
@@ -389,6 +414,21 @@ class BaseModelMeta(ModelMetaclass):
                 # Extend existing indexes.
                 indexes.extend(_check_document_inherited_indexes(bases))
 
+        if (
+            meta.version_field is not None
+            and meta.version_field not in new_class.model_fields
+        ):
+            raise ImproperlyConfigured(
+                f"version_field `{meta.version_field}` is not a field of {name}."
+            )
+        if (
+            meta.version_field is not None
+            and getattr(meta.fields.get(meta.version_field), "field_type", None) is not int
+        ):
+            raise ImproperlyConfigured(
+                f"version_field `{meta.version_field}` of {name} must be an Integer field."
+            )
+
         for _, field in meta.fields.items():
             field.registry = registry
 
@@ -1,5 +1,34 @@
 from .base import Manager, QuerySet
+from .bulk import BulkWriteResult, Delete, Insert, Update, UpdateResult, Upsert
+from .cache import QueryCache, query_cache
 from .expressions import Expression, SortExpression
 from .operators import Q
+from .session import Session, get_session
+from .updates import AddToSet, Inc, Max, Min, Pull, Push, UpdateOperator
+from .writer import BufferedWriter
 
-__all__ = ["Expression", "Q", "QuerySet", "Manager", "SortExpression"]
+__all__ = [
+    "AddToSet",
+    "BufferedWriter",
+    "BulkWriteResult",
+    "Delete",
+    "Expression",
+    "Inc",
+    "Insert",
+    "Max",
+    "Min",
+    "Pull",
+    "Push",
+    "Q",
+    "QueryCache",
+    "QuerySet",
+    "Manager",
+    "Session",
+    "SortExpression",
+    "Update",
+    "UpdateOperator",
+    "UpdateResult",
+    "Upsert",
+    "get_session",
+    "query_cache",
+]
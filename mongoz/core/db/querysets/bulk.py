@@ -0,0 +1,860 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import bson
+import pydantic
+import pymongo
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+
+from mongoz.core.connection.transactions import get_client_session
+from mongoz.core.db.querysets.cache import query_cache
+from mongoz.core.db.querysets.expressions import Expression
+from mongoz.core.db.querysets.session import get_session
+from mongoz.exceptions import BulkWriteError, MongozException, StaleDocumentError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mongoz import Document
+    from mongoz.core.signals import Broadcaster
+
+Filter = Union[Dict[str, Any], Expression, Sequence[Expression]]
+Models = Union[Iterable["Document"], AsyncIterable["Document"]]
+# Awaited with the ids, or the models, of each batch of a bulk operation.
+BatchHook = Union[Callable[[List[Any]], Awaitable[None]], None]
+
+# The number of operations sent in each bulk write.
+BULK_CHUNK_SIZE = 1000
+
+# The results of update_many().
+UPDATE_RETURNING = ("count", "ids", "documents")
+
+# The documents sent in each insert of insert_raw(), split further by the
+# driver at the size limits of the server.
+RAW_CHUNK_SIZE = 10_000
+
+# The documents of each batch of create_many(), the maxWriteBatchSize of the
+# server, split further by the driver at the message size limit.
+MAX_WRITE_BATCH_SIZE = 100_000
+
+ID_KEYS = {"id", "pk"}
+
+# The seconds between the probes of the replication lag of the batched deletes.
+REPLICATION_LAG_INTERVAL = 0.5
+
+# The models validating a subset of the fields, by document and fields.
+_partial_models: Dict[Tuple[Type["Document"], FrozenSet[str]], Type[pydantic.BaseModel]] = {}
+
+
+def filter_expressions(filter: Filter) -> List[Expression]:
+    """
+    Returns the expressions of a raw query, an expression or a list of
+    expressions.
+    """
+    if isinstance(filter, dict):
+        filter = {("_id" if key in ID_KEYS else key): value for key, value in filter.items()}
+        return Expression.unpack(filter)
+    if isinstance(filter, Expression):
+        return [filter]
+    return list(filter)
+
+
+def compile_filter(filter: Filter) -> Dict[str, Any]:
+    """
+    Compiles a raw query, an expression or a list of expressions into the
+    filter of a write operation.
+    """
+    return Expression.compile_many(filter_expressions(filter))
+
+
+def get_partial_model(
+    document: Type["Document"], fields: Iterable[str]
+) -> Type[pydantic.BaseModel]:
+    """
+    Returns the model validating only the given fields of the document.
+
+    The models are built once per document and set of fields, as building a
+    model and its schema costs more than validating the values.
+    """
+    from mongoz.core.db.documents._internal import ModelDump
+
+    key = (document, frozenset(fields))
+    pydantic_model = _partial_models.get(key)
+    if pydantic_model is None:
+        field_definitions: Dict[str, Any] = {
+            name: (document.model_fields[name].annotation, ...) for name in key[1]
+        }
+        pydantic_model = pydantic.create_model(
+            document.__name__,
+            __base__=ModelDump,
+            **field_definitions,
+        )
+        _partial_models[key] = pydantic_model
+    return pydantic_model
+
+
+def validate_values(
+    document: Type["Document"], values: Dict[str, Any], strict: bool = True
+) -> Dict[str, Any]:
+    """
+    Validates a subset of the fields of the document, returning the values
+    to be stored.
+
+    The names that are not fields of the document raise a ValueError or,
+    when not `strict`, are ignored.
+    """
+    names: List[str] = []
+    for name in values:
+        if name in ID_KEYS or name not in document.model_fields:
+            if strict:
+                raise ValueError(f"Invalid field {name} for class {document.__name__}")
+            continue
+        names.append(name)
+
+    if not names:
+        return {}
+
+    pydantic_model = get_partial_model(document, names)
+    return pydantic_model.model_validate({name: values[name] for name in names}).model_dump()
+
+
+def upsert_update(
+    document: Type["Document"],
+    expressions: Sequence[Expression],
+    values: Dict[str, Any],
+    update: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Union[pydantic.ValidationError, None]]:
+    """
+    Adds to the update of an upsert the `$setOnInsert` of the rest of the
+    document to insert. The document is built and validated from the
+    equalities of the filter and the plain `values` the update sets.
+
+    Returns the update and the validation error of the document, when it
+    can't be inserted and only an existing document can be updated. With
+    nothing to update, the error is raised.
+    """
+    data = {
+        expression.key: expression.value
+        for expression in expressions
+        if expression.operator == "$eq"
+    }
+    try:
+        instance = document(**{**data, **values})
+    except pydantic.ValidationError as e:
+        if not update:
+            raise
+        return update, e
+
+    updated = {name.split(".")[0] for clause in update.values() for name in clause}
+    return {**update, "$setOnInsert": instance.model_dump(exclude={"id", *updated})}, None
+
+
+def versioned_update(
+    instance: "Document", values: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Returns the filter and the update setting the values of the document.
+    With a `version_field`, the filter only matches the version the document
+    was loaded with, which the update increments, as `save()` does.
+    """
+    update: Dict[str, Any] = {"$set": values}
+    return instance._get_version_filter(update), update
+
+
+def update_fields_requests(
+    document: Type["Document"], instances: Sequence["Document"], fields: Sequence[str]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Returns the filter and the update of each instance setting only the
+    given fields to the values of that instance, checking and incrementing
+    the version of the documents with a `version_field`.
+    """
+    for name in fields:
+        if name not in document.model_fields or name in ID_KEYS:
+            raise ValueError(f"Invalid field {name} for class {document.__name__}")
+
+    include = set(fields)
+    requests: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    for instance in instances:
+        if not isinstance(instance, document):
+            raise TypeError(f"All models must be of type {document.__name__}")
+        if instance.id is None:
+            raise ValueError("Only documents already stored can be updated.")
+        requests.append(versioned_update(instance, instance.model_dump(include=include)))
+    return requests
+
+
+async def execute_bulk_write(
+    collection: AsyncIOMotorCollection,
+    requests: Sequence[Any],
+    ordered: bool = True,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> "BulkWriteResult":
+    """
+    Sends the requests in bulk writes of up to `chunk_size` requests each,
+    aggregating the results. An ordered bulk write stops at the first error.
+    """
+    result = BulkWriteResult()
+
+    for offset in range(0, len(requests), chunk_size):
+        try:
+            chunk_result = await collection.bulk_write(
+                requests[offset : offset + chunk_size],
+                ordered=ordered,
+                session=get_client_session(),
+            )
+            if not chunk_result.acknowledged:
+                result.acknowledged = False
+                continue
+            result.add(chunk_result.bulk_api_result, offset)
+        except pymongo.errors.BulkWriteError as e:
+            result.add(e.details, offset)
+            if ordered:
+                break
+    return result
+
+
+async def execute_versioned_writes(
+    collection: AsyncIOMotorCollection,
+    instances: Sequence["Document"],
+    updates: Sequence[Tuple[Dict[str, Any], Dict[str, Any]]],
+) -> Tuple["BulkWriteResult", List["Document"]]:
+    """
+    Sends the `versioned_update()` of each instance, setting the next
+    version of the updated ones, and returns the aggregated result with the
+    stale instances, whose update matched no document.
+
+    The updates are sent one by one, as a bulk write only reports the total
+    of the matches, which tells neither which documents are stale nor, read
+    again, whether another writer made the same change. The matches of an
+    unacknowledged write are not checked.
+    """
+    result = BulkWriteResult()
+    stale: List["Document"] = []
+
+    for index, instance in enumerate(instances):
+        filter_query, update = updates[index]
+        try:
+            write_result = await collection.bulk_write(
+                [UpdateOne(filter_query, update)], session=get_client_session()
+            )
+        except pymongo.errors.BulkWriteError as e:
+            result.add(e.details, index)
+            continue
+
+        if not write_result.acknowledged:
+            result.acknowledged = False
+        else:
+            result.add(write_result.bulk_api_result, index)
+            if write_result.matched_count == 0:
+                stale.append(instance)
+                continue
+        for name, value in instance._get_next_version(filter_query).items():
+            setattr(instance, name, value)
+    return result, stale
+
+
+def stale_error(stale: Sequence["Document"]) -> StaleDocumentError:
+    """
+    Returns the error of the stale documents of a bulk write.
+    """
+    if len(stale) == 1:
+        return stale[0]._stale_error()
+    return StaleDocumentError(
+        detail=f"{len(stale)} documents were changed or deleted since they were loaded."
+    )
+
+
+async def update_documents(
+    collection: AsyncIOMotorCollection,
+    document: Type["Document"],
+    instances: Sequence["Document"],
+    fields: Union[Sequence[str], None],
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> "BulkWriteResult":
+    """
+    Writes the given fields of each instance, in unordered bulk writes of up
+    to `chunk_size` updates, or one by one for the documents with a
+    `version_field`, and takes the snapshot of the written fields.
+
+    Raises a `BulkWriteError` for the failed updates and a
+    `StaleDocumentError` for the stale instances.
+    """
+    if not fields:
+        raise MongozException(detail="The fields to update must be given.")
+
+    updates = update_fields_requests(document, instances, fields)
+    snapshot_fields = list(fields)
+    version_field = document.meta.version_field
+    stale: List["Document"] = []
+    if version_field is None:
+        result = await execute_bulk_write(
+            collection,
+            [UpdateOne(filter_query, update) for filter_query, update in updates],
+            ordered=False,
+            chunk_size=chunk_size,
+        )
+    else:
+        result, stale = await execute_versioned_writes(collection, instances, updates)
+        snapshot_fields.append(version_field)
+    query_cache.invalidate(collection.name)
+
+    failed = {error["index"] for error in result.errors}
+    for index, instance in enumerate(instances):
+        if index not in failed and not any(instance is item for item in stale):
+            instance.take_snapshot(snapshot_fields)
+
+    if result.errors:
+        raise BulkWriteError(result=result, detail=f"{len(result.errors)} operations failed.")
+    if stale:
+        raise stale_error(stale)
+    return result
+
+
+def bulk_signals(
+    document: Type["Document"],
+    name: str,
+    expire: Union[Callable[[], None], None] = None,
+    key: str = "ids",
+    **kwargs: Any,
+) -> Tuple[BatchHook, BatchHook]:
+    """
+    Returns the hooks sending the `pre_bulk_<name>` and `post_bulk_<name>`
+    signals of the document with the ids (or the models, as `key`) of each
+    batch, or None for the signals without receivers.
+
+    The `post_bulk_<name>` hook calls `expire` first, so the receivers don't
+    read the cached queries of the documents before the batch.
+    """
+    signals: "Broadcaster" = document.meta.signals  # type: ignore
+    pre_signal = getattr(signals, f"pre_bulk_{name}")
+    post_signal = getattr(signals, f"post_bulk_{name}")
+
+    async def before(batch: List[Any]) -> None:
+        await pre_signal.send(sender=document, **{key: batch}, **kwargs)
+
+    async def after(batch: List[Any]) -> None:
+        if expire is not None:
+            expire()
+        await post_signal.send(sender=document, **{key: batch}, **kwargs)
+
+    return (
+        before if pre_signal.receivers else None,
+        after if post_signal.receivers else None,
+    )
+
+
+async def update_by_ids(
+    collection: AsyncIOMotorCollection,
+    filter_query: Dict[str, Any],
+    update: Dict[str, Any],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    before: BatchHook = None,
+    after: BatchHook = None,
+) -> Tuple[List[Any], "UpdateResult"]:
+    """
+    Applies the update to the documents matching the filter, returning their
+    ids and the counts of the update.
+
+    The ids are read first and only those documents are updated, with one
+    update per chunk of ids sent in a single unordered bulk write, so the
+    ids are exactly the ones of the updated documents. With `before` or
+    `after`, each chunk is sent in its own bulk write, awaiting them with
+    the ids of the chunk.
+    """
+    client_session = get_client_session()
+    ids = [
+        document["_id"]
+        async for document in collection.find(
+            filter_query, {"_id": 1}, session=client_session
+        )
+    ]
+    result = UpdateResult()
+    if not ids or not update:
+        return ids, result
+
+    chunks = [ids[offset : offset + chunk_size] for offset in range(0, len(ids), chunk_size)]
+    requests = [
+        UpdateMany({"$and": [filter_query, {"_id": {"$in": chunk}}]}, update) for chunk in chunks
+    ]
+    batches = [(ids, requests)]
+    if before is not None or after is not None:
+        batches = [(chunk, [requests[index]]) for index, chunk in enumerate(chunks)]
+
+    for batch_ids, batch_requests in batches:
+        if before is not None:
+            await before(batch_ids)
+        bulk_result = await collection.bulk_write(
+            batch_requests, ordered=False, session=client_session
+        )
+        if not bulk_result.acknowledged:
+            result = UpdateResult(None, None, acknowledged=False)
+        elif result.acknowledged:
+            result.matched_count = (result.matched_count or 0) + bulk_result.matched_count
+            result.modified_count = (result.modified_count or 0) + bulk_result.modified_count
+        if after is not None:
+            await after(batch_ids)
+    return ids, result
+
+
+async def replication_lag(collection: AsyncIOMotorCollection) -> float:
+    """
+    Returns the replication lag, in seconds, of the most lagging secondary of
+    the replica set of the collection, or 0 when there are no secondaries.
+    """
+    client = collection.database.client
+    status = await client.admin.command("replSetGetStatus")
+
+    members = status["members"]
+    primaries = [member["optimeDate"] for member in members if member["stateStr"] == "PRIMARY"]
+    secondaries = [
+        member["optimeDate"] for member in members if member["stateStr"] == "SECONDARY"
+    ]
+    if not primaries or not secondaries:
+        return 0.0
+    return max((primaries[0] - optime).total_seconds() for optime in secondaries)
+
+
+async def delete_by_ids(
+    collection: AsyncIOMotorCollection,
+    filter_query: Dict[str, Any],
+    batch_size: int,
+    pause: float = 0,
+    progress: Union[Callable[[int], Any], None] = None,
+    max_lag: Union[float, None] = None,
+    before: BatchHook = None,
+    after: BatchHook = None,
+) -> Union[int, None]:
+    """
+    Deletes the documents matching the filter in batches of up to
+    `batch_size` documents in `_id` order, returning the number of deleted
+    documents, or None when the deletes are unacknowledged.
+
+    Each batch awaits `before` and `after` with its ids. Between the
+    batches, `progress` is called with the number of documents deleted so
+    far, the deletes wait `pause` seconds and, with a `max_lag`, until the
+    secondaries are at most `max_lag` seconds behind.
+    """
+    client_session = get_client_session()
+    deleted: Union[int, None] = 0
+    last_id = None
+
+    while True:
+        query = filter_query
+        if last_id is not None:
+            query = {"$and": [filter_query, {"_id": {"$gt": last_id}}]}
+        cursor = collection.find(query, {"_id": 1}, session=client_session)
+        ids = [document["_id"] async for document in cursor.sort("_id", 1).limit(batch_size)]
+        if not ids:
+            break
+
+        if before is not None:
+            await before(ids)
+        # The filter is applied again for the documents changed meanwhile.
+        result = await collection.delete_many(
+            {"$and": [filter_query, {"_id": {"$in": ids}}]}, session=client_session
+        )
+        if after is not None:
+            await after(ids)
+        if not result.acknowledged:
+            deleted = None
+        elif deleted is not None:
+            deleted += result.deleted_count
+        last_id = ids[-1]
+
+        if progress is not None:
+            outcome = progress(deleted)
+            if inspect.isawaitable(outcome):
+                await outcome
+        if len(ids) < batch_size:
+            break
+
+        if pause:
+            await asyncio.sleep(pause)
+        if max_lag is not None:
+            while await replication_lag(collection) > max_lag:
+                await asyncio.sleep(REPLICATION_LAG_INTERVAL)
+    return deleted
+
+
+async def iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncGenerator[Any, None]:
+    """
+    Iterates an iterable or an async iterable.
+    """
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def chunk_models(
+    document: Type["Document"],
+    models: Models,
+    chunk_size: int = MAX_WRITE_BATCH_SIZE,
+) -> AsyncGenerator[Tuple[List["Document"], List[Dict[str, Any]]], None]:
+    """
+    Consumes the models, yielding batches of up to `chunk_size` models with
+    their data to insert.
+
+    The ids are generated here, as the driver does, so the ids of a batch
+    are known even when some of its documents fail.
+    """
+    chunk: List["Document"] = []
+    data: List[Dict[str, Any]] = []
+
+    async for model in iterate(models):
+        if not isinstance(model, document):
+            raise TypeError(f"All models must be of type {document.__name__}")
+
+        chunk.append(model)
+        data.append({"_id": bson.ObjectId(), **model.model_dump(exclude={"id"})})
+        if len(chunk) >= chunk_size:
+            yield chunk, data
+            chunk, data = [], []
+
+    if chunk:
+        yield chunk, data
+
+
+async def insert_chunks(
+    collection: AsyncIOMotorCollection,
+    chunks: AsyncIterable[Tuple[List[Any], List[Any]]],
+    ordered: bool = True,
+    concurrency: int = 1,
+    on_inserted: Union[Callable[[Any, Any], None], None] = None,
+    before: BatchHook = None,
+    after: BatchHook = None,
+) -> "BulkWriteResult":
+    """
+    Inserts the chunks of (items, data to insert), with up to `concurrency`
+    chunks in flight when not `ordered`, calling `on_inserted` with each
+    inserted item and its id. Each chunk awaits `before` with its items and
+    `after` with the inserted ones.
+
+    Only the chunks in flight are kept in memory. An ordered insert stops at
+    the first error. Any other exception, e.g. a network error or one raised
+    by `before`, stops taking new chunks and is raised once the chunks in
+    flight are done.
+    """
+    result = BulkWriteResult()
+    failures: List[Exception] = []
+    # A client session only runs one operation at a time.
+    client_session = get_client_session()
+    semaphore = asyncio.Semaphore(1 if ordered or client_session is not None else concurrency)
+
+    async def insert(offset: int, chunk: List[Any], data: List[Any]) -> None:
+        try:
+            if before is not None:
+                await before(chunk)
+            try:
+                inserted = await collection.insert_many(
+                    data, ordered=ordered, session=client_session
+                )
+                details: Dict[str, Any] = {"nInserted": len(data)}
+                if not inserted.acknowledged:
+                    result.acknowledged = False
+                    details = {}
+            except pymongo.errors.BulkWriteError as e:
+                details = cast(Dict[str, Any], e.details)
+            result.add(details, offset)
+
+            failed = {error["index"] for error in details.get("writeErrors", [])}
+            executed = min(failed) if ordered and failed else len(chunk)
+            inserted_items = []
+            for index in range(executed):
+                if index in failed:
+                    continue
+                id = data[index].get("_id")
+                result.inserted_ids[offset + index] = id
+                inserted_items.append(chunk[index])
+                if on_inserted is not None:
+                    on_inserted(chunk[index], id)
+            if after is not None and inserted_items:
+                await after(inserted_items)
+        except Exception as e:
+            failures.append(e)
+        finally:
+            semaphore.release()
+
+    tasks: List[asyncio.Future] = []
+    offset = 0
+    try:
+        async for chunk, data in chunks:
+            await semaphore.acquire()
+            if failures or (ordered and result.errors):
+                semaphore.release()
+                break
+
+            tasks.append(asyncio.ensure_future(insert(offset, chunk, data)))
+            offset += len(chunk)
+    finally:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if failures:
+        raise failures[0]
+    return result
+
+
+async def insert_models(
+    collection: AsyncIOMotorCollection,
+    document: Type["Document"],
+    models: Models,
+    chunk_size: Union[int, None] = None,
+    ordered: bool = True,
+    concurrency: int = 1,
+) -> "BulkWriteResult":
+    """
+    Inserts the models in batches, with up to `concurrency` batches in flight
+    when not `ordered`, setting the id of each inserted model.
+
+    The `pre_bulk_create` and `post_bulk_create` signals are sent with the
+    models of each batch.
+    """
+    session = get_session()
+
+    def on_inserted(model: "Document", id: Any) -> None:
+        model.id = id
+        model.take_snapshot()
+        if session is not None:
+            session.add(model, collection)
+
+    chunks = chunk_models(document, models, chunk_size=chunk_size or MAX_WRITE_BATCH_SIZE)
+    before, after = bulk_signals(
+        document,
+        "create",
+        expire=lambda: query_cache.invalidate(collection.name),
+        key="instances",
+    )
+    return await insert_chunks(
+        collection,
+        chunks,
+        ordered=ordered,
+        concurrency=concurrency,
+        on_inserted=on_inserted,
+        before=before,
+        after=after,
+    )
+
+
+async def chunk_documents(
+    document: Type["Document"],
+    documents: Union[Iterable[Any], AsyncIterable[Any]],
+    chunk_size: int = RAW_CHUNK_SIZE,
+    check_fields: bool = False,
+) -> AsyncGenerator[Tuple[List[Any], List[Any]], None]:
+    """
+    Consumes the raw documents, dictionaries or `RawBSONDocument`s, yielding
+    batches of up to `chunk_size` documents to insert as they are.
+
+    The ids of the dictionaries without one are generated here, as the
+    driver does. With `check_fields`, the names that are not fields of the
+    document raise a ValueError.
+    """
+    if check_fields:
+        names = {"_id"} | (document.model_fields.keys() - ID_KEYS)
+
+    chunk: List[Any] = []
+    async for raw in iterate(documents):
+        if check_fields:
+            unknown = raw.keys() - names
+            if unknown:
+                raise ValueError(
+                    f"Invalid fields {', '.join(sorted(unknown))} for class {document.__name__}"
+                )
+        if isinstance(raw, dict) and "_id" not in raw:
+            raw["_id"] = bson.ObjectId()
+
+        chunk.append(raw)
+        if len(chunk) >= chunk_size:
+            yield chunk, chunk
+            chunk = []
+
+    if chunk:
+        yield chunk, chunk
+
+
+class Operation:
+    """
+    Base of the write operations of `Manager.bulk_write()`.
+    """
+
+    def to_request(self, document: Type["Document"]) -> Any:
+        raise NotImplementedError()  # pragma: no cover
+
+
+class Insert(Operation):
+    """
+    Inserts a document. The id of the document is set once inserted.
+
+    E.g.: Insert(Movie(name="Downfall", year=2004))
+    """
+
+    def __init__(self, instance: "Document") -> None:
+        self.instance = instance
+        self.data: Dict[str, Any] = {}
+
+    def to_request(self, document: Type["Document"]) -> InsertOne:
+        if not isinstance(self.instance, document):
+            raise TypeError(f"All models must be of type {document.__name__}")
+
+        self.data = self.instance.model_dump(exclude={"id"})
+        return InsertOne(self.data)
+
+
+class Update(Operation):
+    """
+    Sets the values on the documents matching the filter, all of them unless
+    `many=False`.
+
+    E.g.: Update({"name": "Downfall"}, year=2004)
+    """
+
+    def __init__(self, filter: Filter, many: bool = True, **values: Any) -> None:
+        self.filter = filter
+        self.many = many
+        self.values = values
+
+    def to_request(self, document: Type["Document"]) -> Union[UpdateOne, UpdateMany]:
+        from mongoz.core.db.querysets.updates import compile_update
+
+        update = compile_update(document, self.values)
+        if self.many:
+            return UpdateMany(compile_filter(self.filter), update)
+        return UpdateOne(compile_filter(self.filter), update)
+
+
+class Upsert(Operation):
+    """
+    Sets the values on the document matching the filter, inserting it when
+    no document matches, with the defaults of the other fields, like
+    `update_or_create()`.
+
+    E.g.: Upsert({"name": "Downfall"}, year=2004)
+    """
+
+    def __init__(self, filter: Filter, **values: Any) -> None:
+        self.filter = filter
+        self.values = values
+
+    def to_request(self, document: Type["Document"]) -> UpdateOne:
+        from mongoz.core.db.querysets.updates import UpdateOperator, compile_update
+
+        expressions = filter_expressions(self.filter)
+        values = {
+            name: value
+            for name, value in self.values.items()
+            if not isinstance(value, UpdateOperator)
+        }
+        update, error = upsert_update(
+            document, expressions, values, compile_update(document, self.values)
+        )
+        return UpdateOne(Expression.compile_many(expressions), update, upsert=error is None)
+
+
+class Delete(Operation):
+    """
+    Deletes the documents matching the filter, all of them unless
+    `many=False`.
+
+    E.g.: Delete(Movie.year < 2000)
+    """
+
+    def __init__(self, filter: Filter, many: bool = True) -> None:
+        self.filter = filter
+        self.many = many
+
+    def to_request(self, document: Type["Document"]) -> Union[DeleteOne, DeleteMany]:
+        if self.many:
+            return DeleteMany(compile_filter(self.filter))
+        return DeleteOne(compile_filter(self.filter))
+
+
+class UpdateResult:
+    """
+    The summary of an `update_many()`.
+
+    The counts of an unacknowledged update are not known and are None.
+    """
+
+    def __init__(
+        self,
+        matched_count: Union[int, None] = 0,
+        modified_count: Union[int, None] = 0,
+        acknowledged: bool = True,
+    ) -> None:
+        self.matched_count = matched_count
+        self.modified_count = modified_count
+        self.acknowledged = acknowledged
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(matched_count={self.matched_count}, "
+            f"modified_count={self.modified_count})"
+        )
+
+
+class BulkWriteResult:
+    """
+    The result of all the chunks of a bulk write.
+
+    The indexes of the `inserted_ids`, of the `upserted_ids` and of the
+    `errors` are the positions of the operations (or of the models) given to
+    the bulk write.
+
+    The counts and errors of unacknowledged writes are not known and are not
+    added, with `acknowledged` set to False.
+    """
+
+    def __init__(self) -> None:
+        self.acknowledged = True
+        self.inserted_count = 0
+        self.matched_count = 0
+        self.modified_count = 0
+        self.deleted_count = 0
+        self.upserted_count = 0
+        self.inserted_ids: Dict[int, Any] = {}
+        self.upserted_ids: Dict[int, Any] = {}
+        self.errors: List[Dict[str, Any]] = []
+
+    def add(self, details: Dict[str, Any], offset: int = 0) -> None:
+        """
+        Adds the raw result of a chunk starting at `offset`.
+        """
+        self.inserted_count += details.get("nInserted", 0)
+        self.matched_count += details.get("nMatched", 0)
+        self.modified_count += details.get("nModified", 0)
+        self.deleted_count += details.get("nRemoved", 0)
+        self.upserted_count += details.get("nUpserted", 0)
+
+        for upserted in details.get("upserted", []):
+            self.upserted_ids[upserted["index"] + offset] = upserted["_id"]
+        for error in details.get("writeErrors", []):
+            self.errors.append({**error, "index": error["index"] + offset})
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(inserted_count={self.inserted_count}, "
+            f"matched_count={self.matched_count}, modified_count={self.modified_count}, "
+            f"deleted_count={self.deleted_count}, upserted_count={self.upserted_count}, "
+            f"errors={len(self.errors)})"
+        )
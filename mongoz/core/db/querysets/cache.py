@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Set, Tuple, Type, Union
+
+from mongoz import settings
+
+if TYPE_CHECKING:
+    from mongoz import Document
+
+
+class QueryCache:
+    """
+    Bounded in-process LRU cache for the results of the queries.
+
+    The entries are the raw rows returned by MongoDB, indexed by the name of
+    the collection they were read from, so any write on that collection can
+    invalidate them.
+
+    Usage:
+
+        countries = await Country.objects.cache(ttl=300).filter(active=True)
+    """
+
+    def __init__(self, maxsize: Union[int, None] = None) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[Union[float, None], str, List[Any]]] = (
+            OrderedDict()
+        )
+        self._keys_by_collection: Dict[str, Set[Hashable]] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._watched: Set[Type["Document"]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.query_cache_maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        self._maxsize = value
+        self._evict()
+
+    def get(self, key: Hashable) -> Union[List[Any], None]:
+        """
+        Returns the cached rows of a query or None if not cached or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, collection, rows = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key, collection)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return rows
+
+    def generation(self, collection: str) -> int:
+        """
+        Returns the number of times the collection was invalidated, on its own
+        or with all the others.
+        """
+        return self._epoch + self._generations.get(collection, 0)
+
+    def set(
+        self,
+        key: Hashable,
+        collection: str,
+        rows: List[Any],
+        ttl: Union[float, None] = None,
+        generation: Union[int, None] = None,
+    ) -> None:
+        """
+        Stores the rows of a query for `ttl` seconds (forever if None).
+
+        When the `generation` read before running the query is given, the rows
+        are discarded if the collection was invalidated in the meantime.
+        """
+        if generation is not None and generation != self.generation(collection):
+            return
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, collection, rows)
+        self._entries.move_to_end(key)
+        self._keys_by_collection.setdefault(collection, set()).add(key)
+        self._evict()
+
+    def invalidate(self, collection: Union[str, None] = None) -> None:
+        """
+        Removes all the entries of a collection or everything if no collection
+        is provided.
+        """
+        if collection is None:
+            self._entries.clear()
+            self._keys_by_collection.clear()
+            self._epoch += 1
+            return
+
+        self._generations[collection] = self.generation(collection) + 1
+        for key in self._keys_by_collection.pop(collection, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the counters.
+        """
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss and eviction counters of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def watch(self, document: Type["Document"]) -> None:
+        """
+        Invalidates the cached queries of the document collection on every
+        `post_save`, `post_update` and `post_delete` signal.
+
+        The receivers are connected once the cache is enabled for the
+        document, so no write made in the meantime is missed.
+        """
+        if document in self._watched:
+            return
+
+        signals = document.meta.signals
+        signals.post_save.connect(invalidate_query_cache)  # type: ignore
+        signals.post_update.connect(invalidate_query_cache)  # type: ignore
+        signals.post_delete.connect(invalidate_query_cache)  # type: ignore
+        self._watched.add(document)
+
+    def _remove(self, key: Hashable, collection: str) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_collection.get(collection)
+        if keys is not None:
+            keys.discard(key)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.maxsize:
+            key, (_, collection, _) = next(iter(self._entries.items()))
+            self._remove(key, collection)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+query_cache = QueryCache()
+
+
+async def invalidate_query_cache(sender: Type["Document"], **kwargs: Any) -> None:
+    """
+    Signal receiver invalidating the cached queries of the sender collection.
+    """
+    query_cache.invalidate(sender.meta.collection.name)  # type: ignore
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import heapq
 from datetime import datetime, timedelta
+from functools import cmp_to_key
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterable,
+    Callable,
     Dict,
     Generator,
+    Iterable,
     List,
     Sequence,
     Set,
@@ -18,11 +25,40 @@ from typing import (
 
 import bson
 import pydantic
+import pymongo
 from bson import Code
+from bson.decimal128 import Decimal128
 
 from mongoz import settings
+from mongoz.core.connection.collections import (
+    to_read_concern,
+    to_read_preference,
+    to_write_concern,
+    with_options,
+)
+from mongoz.core.connection.transactions import check_no_transaction, get_client_session
 from mongoz.core.db.datastructures import Order
 from mongoz.core.db.fields import base
+from mongoz.core.db.querysets.bulk import (
+    BULK_CHUNK_SIZE,
+    RAW_CHUNK_SIZE,
+    UPDATE_RETURNING,
+    BulkWriteResult,
+    Insert,
+    Models,
+    Operation,
+    UpdateResult,
+    bulk_signals,
+    chunk_documents,
+    delete_by_ids,
+    execute_bulk_write,
+    insert_chunks,
+    update_by_ids,
+    update_documents,
+    upsert_update,
+    validate_values,
+)
+from mongoz.core.db.querysets.cache import query_cache
 from mongoz.core.db.querysets.core.constants import (
     GREATNESS_EQUALITY,
     LIST_EQUALITY,
@@ -34,9 +70,15 @@ from mongoz.core.db.querysets.core.protocols import (
     MongozDocument,
 )
 from mongoz.core.db.querysets.expressions import Expression, SortExpression
+from mongoz.core.db.querysets.session import get_session
+from mongoz.core.db.querysets.updates import compile_update
+from mongoz.core.utils.concurrency import merge_async_iterables
+from mongoz.core.utils.documents import bson_type_order
 from mongoz.exceptions import (
+    BulkWriteError,
     DocumentNotFound,
     FieldDefinitionError,
+    MongozException,
     MultipleDocumentsReturned,
 )
 from mongoz.protocols.queryset import QuerySetProtocol
@@ -47,6 +89,15 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Document")
 
+# The number of sampled ids per partition of parallel_iter().
+PARTITION_SAMPLES = 20
+# The size of the batches of parallel_iter() without a batch size set.
+PARTITION_BATCH_SIZE = 100
+# The number of databases queried at the same time by across().
+ACROSS_CONCURRENCY = 4
+# The retries of an upsert hitting a unique index, raced by another one.
+UPSERT_RETRIES = 1
+
 
 class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
     def __init__(
@@ -61,9 +112,13 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         lookup_queries: Union[List[Any], None] = None,
     ) -> None:
         self.model_class = model_class  # type: ignore
+        self._read_preference: Any = None
+        self._read_concern: Any = None
 
         if self.model_class:
-            self._collection = self.model_class.meta.collection._collection  # type: ignore
+            self._collection = self._with_options(
+                self.model_class.meta.collection._collection  # type: ignore
+            )
         else:
             self._collection = None
 
@@ -76,6 +131,12 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         self._lookups_on: Union[Dict[str, str], None] = lookups_on
         self._lookup_queries: Union[List[Any], None] = lookup_queries
         self._unwound_fields: Union[Dict[str, Any], None] = unwound_fields
+        self._use_cache: bool = False
+        self._cache_ttl: Union[float, None] = None
+        self._batch_size: Union[int, None] = None
+        self._trusted_reads: Union[bool, None] = None
+        self._databases: Union[List[str], None] = None
+        self._concurrency: int = ACROSS_CONCURRENCY
         self.extra: Dict[str, Any] = {}
 
     def __get__(self, instance: Any, owner: Any) -> "Manager":
@@ -107,24 +168,73 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         database = manager.model_class.meta.registry.get_database(
             database_name
         )
-        manager._collection = database.get_collection(
-            manager._collection.name
-        )._collection
+        manager._collection = manager._with_options(
+            database.get_collection(manager._collection.name)._collection
+        )
+        return manager
+
+    def _with_options(self, collection: Any) -> Any:
+        """
+        Applies the read preference and read concern of the query, or the
+        defaults of the Meta, and the write concern of the Meta to the
+        collection.
+        """
+        meta = self.model_class.meta
+        return with_options(
+            collection,
+            read_preference=self._read_preference or meta.read_preference,
+            read_concern=self._read_concern or meta.read_concern,
+            write_concern=meta.write_concern,
+        )
+
+    def read_preference(self, read_preference: Any) -> "Manager[T]":
+        """
+        Sets the read preference of the query, either a pymongo read
+        preference or the name of the mode, e.g. "secondaryPreferred" or
+        "nearest".
+
+        E.g.: await Movie.objects.read_preference("secondary").filter(year=2004)
+        """
+        manager: "Manager" = self.clone()
+        manager._read_preference = to_read_preference(read_preference)
+        manager._collection = with_options(
+            manager._collection, read_preference=manager._read_preference
+        )
+        return manager
+
+    def read_concern(self, read_concern: Any) -> "Manager[T]":
+        """
+        Sets the read concern of the query, either a pymongo read concern or
+        the level, e.g. "majority".
+        """
+        manager: "Manager" = self.clone()
+        manager._read_concern = to_read_concern(read_concern)
+        manager._collection = with_options(
+            manager._collection, read_concern=manager._read_concern
+        )
         return manager
 
     def clone(self) -> Any:
         manager = self.__class__.__new__(self.__class__)
         manager.model_class = self.model_class
-        manager._filter = self._filter
+        manager._filter = list(self._filter)
         manager._limit_count = self._limit_count
         manager._skip_count = self._skip_count
-        manager._sort = self._sort
+        manager._sort = list(self._sort)
         manager._collection = self._collection
         manager._only_fields = self._only_fields
         manager._defer_fields = self._defer_fields
         manager._lookups_on = self._lookups_on
         manager._lookup_queries = self._lookup_queries
         manager._unwound_fields = self._unwound_fields
+        manager._use_cache = self._use_cache
+        manager._cache_ttl = self._cache_ttl
+        manager._batch_size = self._batch_size
+        manager._trusted_reads = self._trusted_reads
+        manager._read_preference = self._read_preference
+        manager._read_concern = self._read_concern
+        manager._databases = self._databases
+        manager._concurrency = self._concurrency
         manager.extra = self.extra
         return manager
 
@@ -186,8 +296,8 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         Builds the filter query for the given manager.
         """
         clauses = []
-        filter_clauses = self._filter
-        sort_clauses = self._sort
+        filter_clauses = list(self._filter)
+        sort_clauses = list(self._sort)
         lookups_on = {}
         lookup_queries = []
         unwound_fields = {}
@@ -363,27 +473,17 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
 
                 clauses.append(expression)
 
-            if exclude:
-                operator = self.get_operator("not")
-                clauses = [operator(clause.key, clause) for clause in clauses]  # type: ignore
-                filter_clauses += clauses
-            else:
-                filter_clauses += clauses
-
-        manager = cast(
-            "Manager",
-            self.__class__(
-                model_class=self.model_class,
-                filter_by=filter_clauses,
-                sort_by=sort_clauses,
-                only_fields=self._only_fields,
-                defer_fields=self._defer_fields,
-                unwound_fields=unwound_fields,
-                lookups_on=lookups_on,
-                lookup_queries=lookup_queries,
-            ),
-        )
-        manager._collection = self._collection
+        if exclude:
+            operator = self.get_operator("not")
+            clauses = [operator(clause.key, clause) for clause in clauses]  # type: ignore
+        filter_clauses += clauses
+
+        manager: "Manager" = self.clone()
+        manager._filter = filter_clauses
+        manager._sort = sort_clauses
+        manager._unwound_fields = unwound_fields
+        manager._lookups_on = lookups_on
+        manager._lookup_queries = lookup_queries
         return manager
 
     def filter(self, **kwargs: Any) -> "Manager":
@@ -469,20 +569,201 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
             manager._sort.append(key)
         return manager
 
+    def cache(self, ttl: Union[float, None] = None) -> "Manager[T]":
+        """
+        Caches the results of the query in the in-process query cache.
+
+        The cached results are kept for `ttl` seconds (or until evicted if
+        None) and invalidated on any write to the collection made via Mongoz.
+
+        E.g.: await Country.objects.cache(ttl=300).filter(active=True)
+        """
+        manager: "Manager" = self.clone()
+        manager._use_cache = True
+        manager._cache_ttl = ttl
+        query_cache.watch(manager.model_class)
+        return manager
+
+    def batch_size(self, size: int) -> "Manager[T]":
+        """
+        Sets the number of documents returned by MongoDB in each batch of the
+        cursor, overriding the `batch_size` of the Meta.
+
+        Zero uses the default of the server.
+        """
+        manager: "Manager" = self.clone()
+        manager._batch_size = size
+        return manager
+
+    def trusted_reads(self, enabled: bool = True) -> "Manager[T]":
+        """
+        Builds the documents of the query without validating the stored
+        values, overriding the `trusted_reads` of the Meta.
+
+        E.g.: await Event.objects.trusted_reads().filter(year=2024)
+        """
+        manager: "Manager" = self.clone()
+        manager._trusted_reads = enabled
+        return manager
+
+    def _apply_batch_size(self, cursor: Any) -> Any:
+        batch_size = self._batch_size
+        if batch_size is None:
+            batch_size = self.model_class.meta.batch_size
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
     async def none(self) -> "Manager":
         """
         Returns an empty Manager.
         """
         manager = self.__class__(model_class=self.model_class)
-        manager._collection = self.model_class.meta.collection._collection  # type: ignore
         return manager
 
+    def across(
+        self, databases: Sequence[str], concurrency: int = ACROSS_CONCURRENCY
+    ) -> "Manager[T]":
+        """
+        Runs the query in each one of the databases, at most `concurrency` at
+        a time, for instance with a database per tenant.
+
+        Awaiting the query returns the documents of all the databases, merged
+        by the sort of the query (or in the order of the databases), while
+        iterating yields them as they arrive. The `source_database` of each
+        document is the name of the database it was read from.
+
+        E.g.:
+
+            invoices = await Invoice.objects.across(tenants).sort("total", Order.DESCENDING)
+
+            async for invoice in Invoice.objects.filter(paid=False).across(tenants):
+                ...
+        """
+        manager: "Manager" = self.clone()
+        manager._databases = list(databases)
+        manager._concurrency = concurrency
+        return manager
+
+    def _using_one(self, database_name: str) -> "Manager":
+        check_no_transaction("across()")
+        manager: "Manager" = self.using(database_name)
+        manager._databases = None
+        return manager
+
+    def _check_not_across(self) -> None:
+        if self._databases is not None:
+            raise MongozException(detail="across() can only be used for reads.")
+
+    def _expire(self) -> None:
+        """
+        Invalidates the cached queries and the session documents of the
+        collection after a write on many documents.
+        """
+        query_cache.invalidate(self._collection.name)
+        session = get_session()
+        if session is not None:
+            session.expire(self._collection)
+
+    async def _all_across(self) -> List[T]:
+        """
+        Returns the results of the query for all the databases of across().
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+        # The skip only applies to the merged results, so each database
+        # returns up to skip + limit documents.
+        limit_count = self._skip_count + self._limit_count if self._limit_count else 0
+
+        async def query(database_name: str) -> List[T]:
+            manager: "Manager" = self._using_one(database_name)
+            manager._skip_count = 0
+            manager._limit_count = limit_count
+
+            async with semaphore:
+                documents: List[T] = await manager._all()
+            for document in documents:
+                document._source_database = database_name
+            return documents
+
+        results = await asyncio.gather(*[query(name) for name in self._databases])  # type: ignore
+
+        if self._sort:
+            key = cmp_to_key(self._compare_documents)
+            documents = list(heapq.merge(*results, key=key))
+        else:
+            documents = [document for result in results for document in result]
+
+        documents = documents[self._skip_count :]
+        if self._limit_count:
+            documents = documents[: self._limit_count]
+        return documents
+
+    def _compare_documents(self, first: Any, second: Any) -> int:
+        """
+        Compares two documents by the sort of the query, the values of
+        different types in the order of their BSON types like MongoDB does.
+
+        The embedded documents and the arrays are not compared, the documents
+        keep the order of their database.
+        """
+        for expression in self._sort:
+            first_value = self._get_value(first, expression.key)
+            second_value = self._get_value(second, expression.key)
+
+            first_order = bson_type_order(first_value)
+            second_order = bson_type_order(second_value)
+            if first_order != second_order:
+                result = -1 if first_order < second_order else 1
+                return result * int(expression.direction)
+
+            if isinstance(first_value, Decimal128):
+                first_value = first_value.to_decimal()
+            if isinstance(second_value, Decimal128):
+                second_value = second_value.to_decimal()
+            if first_order in (4, 5) or first_value == second_value:
+                continue
+            try:
+                result = -1 if first_value < second_value else 1
+            except TypeError:
+                # For instance naive and aware datetimes.
+                continue
+            return result * int(expression.direction)
+        return 0
+
+    def _get_value(self, document: Any, key: str) -> Any:
+        value = document
+        for name in key.split("."):
+            name = self.model_class.validate_id_field(name)
+            if isinstance(value, dict):
+                value = value.get(name)
+            else:
+                value = getattr(value, name, None)
+        return value
+
+    async def _iter_across(self) -> AsyncGenerator[Any, None]:
+        async def scan(database_name: str) -> AsyncGenerator[Any, None]:
+            documents: AsyncGenerator[Any, None] = self._using_one(database_name).__aiter__()
+            async for document in documents:
+                document._source_database = database_name
+                yield document
+
+        scans = [scan(name) for name in self._databases]  # type: ignore
+        async for document in merge_async_iterables(scans, concurrency=self._concurrency):
+            yield document
+
     async def __aiter__(self) -> AsyncGenerator[T, None]:
+        if self._databases is not None:
+            async for document in self._iter_across():
+                yield document
+            return
+
         filter_query = Expression.compile_many(self._filter)
-        cursor = self._collection.find(filter_query)
+        cursor = self._apply_batch_size(
+            self._collection.find(filter_query, session=get_client_session())
+        )
 
         async for document in cursor:
-            yield self.model_class(**document)
+            yield self._from_row(document)
 
     def __await__(
         self,
@@ -494,6 +775,8 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         Returns all the results for a given collection of a document
         """
         manager: "Manager" = self.clone()
+        if manager._databases is not None:
+            return await manager._all_across()
 
         filter_query = Expression.compile_many(manager._filter)
 
@@ -526,36 +809,176 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         if manager._limit_count:
             pipeline.append({"$limit": manager._limit_count})
 
+        # The reads of a transaction are not cached, they may see its changes.
+        if manager._use_cache and get_client_session() is None:
+            rows = await manager._cached_rows(pipeline)
+            return [manager._from_row(document) for document in rows]
+
         # Execute aggregation
-        cursor = manager._collection.aggregate(pipeline)
-
-        # For only fields
-        is_only_fields = True if manager._only_fields else False
-        is_defer_fields = True if manager._defer_fields else False
-
-        results: List[T] = [
-            manager.model_class.from_row(
-                document,
-                is_only_fields=is_only_fields,
-                only_fields=manager._only_fields,
-                is_defer_fields=is_defer_fields,
-                defer_fields=manager._defer_fields,
-                from_collection=manager._collection,
+        cursor = manager._apply_batch_size(
+            manager._collection.aggregate(pipeline, session=get_client_session())
+        )
+        results: List[T] = [manager._from_row(document) async for document in cursor]
+
+        return results
+
+    def _from_row(self, document: Dict[str, Any]) -> Any:
+        """
+        Builds the document from a row, with the only/defer fields of the query.
+        """
+        trusted = self._trusted_reads
+        if trusted is None:
+            trusted = self.model_class.meta.trusted_reads
+        return self.model_class.from_row(
+            document,
+            is_only_fields=True if self._only_fields else False,
+            only_fields=self._only_fields,
+            is_defer_fields=True if self._defer_fields else False,
+            defer_fields=self._defer_fields,
+            from_collection=self._collection,
+            trusted=trusted,
+        )
+
+    async def _cached_rows(self, pipeline: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Returns the rows of the pipeline from the query cache, executing and
+        caching it on a miss.
+
+        The pipeline contains the compiled filter, sort, skip, limit and lookups
+        and together with the projection of the manager makes the key.
+        """
+        collection_name = self._collection.name
+        # Encoding the pipeline keeps the BSON types apart, e.g. 1 and 1.0.
+        key = (
+            self._collection.full_name,
+            self.model_class.__qualname__,
+            bson.encode({"pipeline": pipeline}, codec_options=self._collection.codec_options),
+            tuple(self._only_fields),
+            tuple(self._defer_fields),
+        )
+
+        rows = query_cache.get(key)
+        if rows is None:
+            generation = query_cache.generation(collection_name)
+            cursor = self._apply_batch_size(
+                self._collection.aggregate(pipeline, session=get_client_session())
+            )
+            rows = [row async for row in cursor]
+            query_cache.set(
+                key, collection_name, rows, ttl=self._cache_ttl, generation=generation
             )
-            async for document in cursor
+
+        # The cached rows are never handed over to avoid changes on them.
+        return copy.deepcopy(rows)
+
+    async def _partition_boundaries(self, partitions: int) -> List[Any]:
+        """
+        Returns up to `partitions - 1` ids splitting the collection in ranges
+        of similar size, estimated from a random sample of the ids.
+
+        The filter is not applied to the sample, a `$match` before the
+        `$sample` would scan every matching document, it is applied inside
+        each range instead.
+        """
+        if partitions <= 1:
+            return []
+
+        pipeline: List[Any] = [
+            # Oversampling makes the ranges more even.
+            {"$sample": {"size": partitions * PARTITION_SAMPLES}},
+            {"$project": {"_id": 1}},
+            {"$sort": {"_id": 1}},
+        ]
+        ids = [
+            row["_id"]
+            async for row in self._collection.aggregate(pipeline, session=get_client_session())
         ]
+        if not ids:
+            return []
 
-        return results
+        boundaries: List[Any] = []
+        for index in range(1, partitions):
+            boundary = ids[len(ids) * index // partitions]
+            if not boundaries or boundaries[-1] != boundary:
+                boundaries.append(boundary)
+        return boundaries
+
+    async def parallel_iter(
+        self, partitions: int = 4, batches: bool = False
+    ) -> AsyncGenerator[Union[T, List[T]], None]:
+        """
+        Scans the matching documents with `partitions` concurrent cursors, each
+        one reading a range of `_id`, yielding the documents (or the batches
+        when `batches=True`) as they arrive.
+
+        The documents are not returned in any particular order.
+
+        E.g.:
+
+            async for movie in Movie.objects.filter(year=2004).parallel_iter(partitions=8):
+                ...
+        """
+        manager: "Manager" = self.clone()
+        check_no_transaction("parallel_iter()")
+        if manager._limit_count or manager._skip_count:
+            raise MongozException(
+                detail="parallel_iter() does not support limit() or skip()."
+            )
+
+        boundaries = await manager._partition_boundaries(partitions)
+        ranges = list(zip([None, *boundaries], [*boundaries, None], strict=True))
+
+        batch_size = manager._batch_size or manager.model_class.meta.batch_size
+        batch_size = batch_size or PARTITION_BATCH_SIZE
+
+        async def scan(lower: Any, upper: Any) -> AsyncGenerator[List[T], None]:
+            expressions = list(manager._filter)
+            if lower is not None:
+                expressions.append(Expression("_id", "$gte", lower))
+            if upper is not None:
+                expressions.append(Expression("_id", "$lt", upper))
+
+            cursor = manager._apply_batch_size(
+                manager._collection.find(
+                    Expression.compile_many(expressions), session=get_client_session()
+                )
+            )
+            batch: List[T] = []
+            async for document in cursor:
+                batch.append(manager._from_row(document))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        scans = [scan(lower, upper) for lower, upper in ranges]
+        async for batch in merge_async_iterables(scans, maxsize=len(scans) * 2):
+            if batches:
+                yield batch
+            else:
+                for document in batch:
+                    yield document
 
     async def count(self, **kwargs: Any) -> int:
         """
         Counts all the documents for a given colletion.
         """
         manager: "Manager" = self.clone()
+        if manager._databases is not None:
+            semaphore = asyncio.Semaphore(manager._concurrency)
+
+            async def count(database_name: str) -> int:
+                async with semaphore:
+                    return await manager._using_one(database_name).count()
+
+            counts = await asyncio.gather(*[count(name) for name in manager._databases])
+            return sum(counts)
 
         filter_query = Expression.compile_many(manager._filter)
         return cast(
-            int, await manager._collection.count_documents(filter_query)
+            int,
+            await manager._collection.count_documents(filter_query, session=get_client_session()),
         )
 
     async def create(self, **kwargs: Any) -> "Document":
@@ -568,13 +991,72 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         )
         return cast("Document", instance)
 
-    async def delete(self) -> int:
-        """Delete documents matching the criteria."""
+    async def delete(
+        self,
+        write_concern: Any = None,
+        batch_size: Union[int, None] = None,
+        pause_ms: float = 0,
+        progress: Union[Callable[[int], Any], None] = None,
+        max_lag_ms: Union[float, None] = None,
+    ) -> Union[int, None]:
+        """
+        Delete documents matching the criteria.
+
+        With a `batch_size`, the documents are deleted in batches of up to
+        `batch_size` documents in `_id` order instead of a single delete.
+        Between the batches, `progress` (a function or a coroutine function)
+        receives the number of documents deleted so far, the deletes wait
+        `pause_ms` and, with `max_lag_ms`, until the replication lag of the
+        secondaries is under it.
+
+        Returns the number of deleted documents, not known (None) when the
+        `write_concern` is unacknowledged, e.g. `write_concern=0`.
+
+        When the document has `pre_bulk_delete` or `post_bulk_delete`
+        receivers, the documents are deleted in batches of `BULK_CHUNK_SIZE`
+        by default, sending the signals with the ids of each batch.
+
+        E.g.:
+
+            await Event.objects.filter(year__lt=2020).delete(batch_size=5000, pause_ms=100)
+        """
         manager: "Manager" = self.clone()
+        manager._check_not_across()
+        if batch_size is None and (pause_ms or progress is not None or max_lag_ms is not None):
+            raise MongozException(
+                detail="pause_ms, progress and max_lag_ms require a batch_size."
+            )
+        if batch_size is not None and batch_size < 1:
+            raise MongozException(detail="batch_size must be greater than 0.")
+
         filter_query = Expression.compile_many(manager._filter)
-        result = await manager._collection.delete_many(filter_query)
+        collection = with_options(
+            manager._collection, write_concern=to_write_concern(write_concern)
+        )
+        before, after = bulk_signals(manager.model_class, "delete", expire=manager._expire)
+        if batch_size is None and (before is not None or after is not None):
+            batch_size = BULK_CHUNK_SIZE
+        if batch_size is not None:
+            try:
+                return await delete_by_ids(
+                    collection,
+                    filter_query,
+                    batch_size,
+                    pause=pause_ms / 1000,
+                    progress=progress,
+                    max_lag=max_lag_ms / 1000 if max_lag_ms is not None else None,
+                    before=before,
+                    after=after,
+                )
+            finally:
+                manager._expire()
+
+        result = await collection.delete_many(filter_query, session=get_client_session())
+        manager._expire()
 
-        return cast(int, result.deleted_count)
+        if not result.acknowledged:
+            return None
+        return result.deleted_count
 
     async def first(self) -> Union[T, None]:
         """
@@ -654,16 +1136,94 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
             {"$setOnInsert": values},
             upsert=True,
             return_document=True,
+            session=get_client_session(),
         )
+        query_cache.invalidate(manager._collection.name)
         return cast(T, manager.model_class(**model))
 
+    async def update_or_create(
+        self, defaults: Union[Dict[str, Any], None] = None, **lookup: Any
+    ) -> T:
+        """
+        Sets the `defaults` on the document matching the lookup, creating it
+        with the lookup and the defaults when none matches, in a single
+        `find_one_and_update` with `upsert=True`.
+
+        When two upserts race and one hits a unique index, it is retried and
+        updates the document created by the other.
+
+        E.g.:
+
+            movie = await Movie.objects.update_or_create(
+                name="Barbie", defaults={"year": 2023}
+            )
+        """
+        manager: "Manager" = self.filter(**lookup) if lookup else self.clone()
+        manager._check_not_across()
+
+        defaults = {
+            (key if isinstance(key, str) else key._name): value
+            for key, value in (defaults or {}).items()
+        }
+        values = validate_values(manager.model_class, defaults)
+
+        # The whole document is only needed, and validated, to be inserted.
+        # When the lookup and the defaults miss required fields only an
+        # existing document can be updated.
+        update, error = upsert_update(
+            manager.model_class,
+            manager._filter,
+            defaults,
+            {"$set": values} if values else {},
+        )
+
+        filter_query = Expression.compile_many(manager._filter)
+        for attempt in range(UPSERT_RETRIES + 1):
+            try:
+                row = await manager._collection.find_one_and_update(
+                    filter_query,
+                    update,
+                    upsert=error is None,
+                    return_document=pymongo.ReturnDocument.AFTER,
+                    session=get_client_session(),
+                )
+                break
+            except pymongo.errors.DuplicateKeyError:
+                if attempt == UPSERT_RETRIES:
+                    raise
+        query_cache.invalidate(manager._collection.name)
+
+        if row is None:
+            raise cast(pydantic.ValidationError, error)
+
+        document = manager.model_class(**row)
+        document.take_snapshot()
+        session = get_session()
+        if session is not None:
+            session.add(document, manager._collection)
+        return cast(T, document)
+
+    async def upsert(self, **values: Any) -> T:
+        """
+        Sets the values on the document matching the query, creating it when
+        none matches, like `update_or_create()`.
+
+        E.g.:
+
+            movie = await Movie.objects.filter(name="Barbie").upsert(year=2023)
+        """
+        manager: "Manager" = self.clone()
+        return await manager.update_or_create(defaults=values)
+
     async def distinct_values(self, key: str) -> List[Any]:
         """
         Returns a list of distinct values filtered by the key.
         """
         manager: "Manager" = self.clone()
         filter_query = Expression.compile_many(manager._filter)
-        values = await manager._collection.find(filter_query).distinct(key=key)
+        values = await manager._collection.find(filter_query, session=get_client_session()).distinct(
+            key=key
+        )
         return cast(List[Any], values)
 
     async def where(self, condition: Union[str, Code]) -> Any:
@@ -679,78 +1239,255 @@ class Manager(QuerySetProtocol, AwaitableQuery[MongozDocument]):
         manager: "Manager" = self.clone()
 
         filter_query = Expression.compile_many(manager._filter)
-        cursor = manager._collection.find(filter_query).where(condition)
-        return [manager.model_class(**document) async for document in cursor]
+        cursor = manager._collection.find(filter_query, session=get_client_session()).where(
+            condition
+        )
+        cursor = manager._apply_batch_size(cursor)
+        return [manager._from_row(document) async for document in cursor]
 
     async def update(self, **kwargs: Any) -> List["Document"]:
         """
         Updates a document
         """
         manager: "Manager" = self.clone()
-        return await manager.update_many(**kwargs)
+        return cast(List["Document"], await manager.update_many(returning="documents", **kwargs))
 
-    async def update_many(self, **kwargs: Any) -> List[T]:
-        """
-        Updates many documents (bulk update)
+    async def update_many(
+        self, returning: str = "count", write_concern: Any = None, **kwargs: Any
+    ) -> Any:
         """
-        from mongoz.core.db.documents._internal import ModelDump
+        Updates many documents (bulk update).
 
-        manager: "Manager" = self.clone()
+        Returns an `UpdateResult` with the counts by default. With
+        `returning="ids"` returns the ids of the updated documents and with
+        `returning="documents"` the updated documents, which requires an
+        acknowledged `write_concern`.
 
-        field_definitions = {
-            name: (annotations, ...)
-            for name, annotations in manager.model_class.__annotations__.items()
-            if name in kwargs
-        }
+        The `pre_bulk_update` and `post_bulk_update` signals are sent with
+        the ids of each chunk of updated documents and the update document.
 
-        if field_definitions:
-            pydantic_model: Type[pydantic.BaseModel] = pydantic.create_model(
-                manager.model_class.__name__,
-                __base__=ModelDump,
-                **field_definitions,
+        E.g.:
+
+            result = await Movie.objects.filter(year=2004).update_many(year=2010)
+            result.modified_count
+        """
+        manager: "Manager" = self.clone()
+        manager._check_not_across()
+        if returning not in UPDATE_RETURNING:
+            raise MongozException(
+                detail=f"Invalid returning: {returning}, expected one of "
+                f"{', '.join(UPDATE_RETURNING)}."
             )
-            model = pydantic_model.model_validate(kwargs)
-            values = model.model_dump()
 
-            filter_query = Expression.compile_many(manager._filter)
-            await manager._collection.update_many(
-                filter_query, {"$set": values}
+        collection = with_options(
+            manager._collection, write_concern=to_write_concern(write_concern)
+        )
+        if returning != "count" and not collection.write_concern.acknowledged:
+            raise MongozException(
+                detail=f"returning={returning} requires an acknowledged write concern."
             )
 
-            _filter = [
-                expression
-                for expression in manager._filter
-                if expression.key not in values
-            ]
-            _filter.extend(
-                [
-                    Expression(key, "$eq", value)
-                    for key, value in values.items()
-                ]
+        update = compile_update(manager.model_class, kwargs, strict=False)
+
+        filter_query = Expression.compile_many(manager._filter)
+        before, after = bulk_signals(
+            manager.model_class, "update", expire=manager._expire, update=update
+        )
+        if returning == "count" and before is None and after is None:
+            if not update:
+                return UpdateResult()
+            result = await collection.update_many(
+                filter_query, update, session=get_client_session()
             )
+            manager._expire()
+            if not result.acknowledged:
+                return UpdateResult(None, None, acknowledged=False)
+            return UpdateResult(result.matched_count, result.modified_count)
 
-            manager._filter = _filter
+        ids, update_result = await update_by_ids(
+            collection, filter_query, update, before=before, after=after
+        )
+        if update:
+            manager._expire()
+        if returning == "count":
+            return update_result
+        if returning == "ids":
+            return ids
+
+        manager._filter = [Expression("_id", "$in", ids)]
         return await manager._all()
 
-    async def create_many(self, models: List["Document"]) -> List["Document"]:
+    async def create_many(
+        self,
+        models: Models,
+        chunk_size: Union[int, None] = None,
+        ordered: bool = True,
+        concurrency: int = 1,
+        write_concern: Any = None,
+    ) -> Any:
         """
         Creates many documents (bulk create).
+
+        E.g.:
+
+            result = await Movie.objects.create_many(
+                read_movies(), chunk_size=5000, ordered=False, concurrency=4
+            )
         """
         manager: "Manager" = self.clone()
+        manager._check_not_across()
         return await manager.model_class.create_many(
-            models=models, collection=manager._collection
+            models=models,
+            collection=manager._collection,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            concurrency=concurrency,
+            write_concern=write_concern,
+        )
+
+    async def insert_raw(
+        self,
+        documents: Union[Iterable[Any], AsyncIterable[Any]],
+        chunk_size: int = RAW_CHUNK_SIZE,
+        ordered: bool = True,
+        concurrency: int = 1,
+        check_fields: bool = False,
+        write_concern: Any = None,
+    ) -> BulkWriteResult:
+        """
+        Inserts raw documents, dictionaries or `RawBSONDocument`s already in
+        the stored format, without validating them nor filling the defaults.
+
+        Any iterable or async iterable is consumed in batches of up to
+        `chunk_size` documents. With `check_fields`, the names that are not
+        fields of the document raise a ValueError.
+
+        Returns the `BulkWriteResult` with the ids by position of the
+        documents. When any document fails, a `BulkWriteError` is raised with
+        the result.
+
+        E.g.:
+
+            result = await Movie.objects.insert_raw(read_rows(), chunk_size=10000)
+        """
+        manager: "Manager" = self.clone()
+        manager._check_not_across()
+        collection = with_options(
+            manager._collection, write_concern=to_write_concern(write_concern)
         )
 
-    async def bulk_create(self, models: List["Document"]) -> List["Document"]:
+        try:
+            result = await insert_chunks(
+                collection,
+                chunk_documents(
+                    manager.model_class,
+                    documents,
+                    chunk_size=chunk_size,
+                    check_fields=check_fields,
+                ),
+                ordered=ordered,
+                concurrency=concurrency,
+            )
+        finally:
+            manager._expire()
+
+        if result.errors:
+            raise BulkWriteError(
+                result=result, detail=f"{len(result.errors)} documents failed."
+            )
+        return result
+
+    async def bulk_create(self, models: Models, **kwargs: Any) -> Any:
         """
         Bulk creates many documents
         """
         manager: "Manager" = self.clone()
-        return await manager.create_many(models=models)
+        return await manager.create_many(models=models, **kwargs)
+
+    async def bulk_update(
+        self,
+        documents: Union[Sequence["Document"], None] = None,
+        fields: Union[Sequence[str], None] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Without documents, sets the values on all the matching documents and
+        returns them, like `update_many(returning="documents")`.
+
+        With documents, writes the given fields of each instance with one
+        update per instance, sent in unordered bulk writes of up to
+        `chunk_size` updates each, and returns the `BulkWriteResult`. The
+        documents with a `version_field` are checked and incremented like
+        `save()` does, raising a `StaleDocumentError` for the stale ones.
+
+        E.g.:
+
+            for movie in movies:
+                movie.year += 1
+            await Movie.objects.bulk_update(movies, fields=["year"])
+        """
+        manager: "Manager" = self.clone()
+        if documents is None:
+            return await manager.update_many(returning="documents", **kwargs)
+
+        manager._check_not_across()
+        return await update_documents(
+            manager._collection, manager.model_class, documents, fields, chunk_size=chunk_size
+        )
+
+    async def bulk_write(
+        self,
+        operations: Sequence[Operation],
+        ordered: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> BulkWriteResult:
+        """
+        Executes the `Insert`, `Update`, `Upsert` and `Delete` operations with
+        bulk writes of up to `chunk_size` operations each.
 
-    async def bulk_update(self, **kwargs: Any) -> List[T]:
+        The values are validated by the fields of the document and the filters
+        compiled like the ones of the queries. With `ordered=True` the
+        operations run in order and stop at the first error, otherwise they
+        all run. A `BulkWriteError` is raised with the aggregated result when
+        any operation fails.
+
+        E.g.:
+
+            await Movie.objects.bulk_write(
+                [
+                    Insert(Movie(name="Boyhood", year=2014)),
+                    Update({"name": "Downfall"}, year=2004),
+                    Upsert(Movie.name == "Barbie", year=2023),
+                    Delete(Movie.year < 2000),
+                ]
+            )
+        """
         manager: "Manager" = self.clone()
-        return await manager.update_many(**kwargs)
+        manager._check_not_across()
+
+        requests = [operation.to_request(manager.model_class) for operation in operations]
+        result = await execute_bulk_write(
+            manager._collection, requests, ordered=ordered, chunk_size=chunk_size
+        )
+
+        manager._expire()
+
+        # The ids of the inserted documents, skipping the ones not executed
+        # after the first error of an ordered bulk write.
+        failed = {error["index"] for error in result.errors}
+        executed = min(failed) if ordered and failed else len(operations)
+        for index, operation in enumerate(operations[:executed]):
+            if isinstance(operation, Insert) and index not in failed:
+                operation.instance.id = operation.data["_id"]
+                operation.instance.take_snapshot()
+                result.inserted_ids[index] = operation.instance.id
+
+        if result.errors:
+            raise BulkWriteError(
+                result=result, detail=f"{len(result.errors)} operations failed."
+            )
+        return result
 
     async def get_document_by_id(
         self, id: Union[str, bson.ObjectId]
@@ -16,13 +16,37 @@ from typing import (
 )
 
 import bson
-import pydantic
 from bson import Code
 
+from mongoz.core.connection.collections import (
+    to_read_concern,
+    to_read_preference,
+    to_write_concern,
+    with_options,
+)
+from mongoz.core.connection.transactions import get_client_session
 from mongoz.core.db.datastructures import Order
 from mongoz.core.db.fields import base
+from mongoz.core.db.querysets.bulk import (
+    BULK_CHUNK_SIZE,
+    UPDATE_RETURNING,
+    Models,
+    UpdateResult,
+    bulk_signals,
+    delete_by_ids,
+    update_by_ids,
+    update_documents,
+)
+from mongoz.core.db.querysets.cache import query_cache
 from mongoz.core.db.querysets.expressions import Expression, SortExpression
-from mongoz.exceptions import DocumentNotFound, FieldDefinitionError, MultipleDocumentsReturned
+from mongoz.core.db.querysets.session import get_session
+from mongoz.core.db.querysets.updates import compile_update
+from mongoz.exceptions import (
+    DocumentNotFound,
+    FieldDefinitionError,
+    MongozException,
+    MultipleDocumentsReturned,
+)
 from mongoz.protocols.queryset import QuerySetProtocol
 
 if TYPE_CHECKING:
@@ -40,13 +64,20 @@ class BaseQuerySet(QuerySetProtocol, Generic[T]):
         defer_fields: Union[str, None] = None,
     ) -> None:
         self.model_class = model_class
-        self._collection = model_class.meta.collection._collection  # type: ignore
+        self._collection: Any = with_options(
+            model_class.meta.collection._collection,  # type: ignore
+            read_preference=model_class.meta.read_preference,
+            read_concern=model_class.meta.read_concern,
+            write_concern=model_class.meta.write_concern,
+        )
         self._filter: List[Expression] = filter_by or []
         self._limit_count = 0
         self._skip_count = 0
         self._sort: List[SortExpression] = []
         self._only_fields = [] if only_fields is None else only_fields
         self._defer_fields = [] if defer_fields is None else defer_fields
+        self._batch_size: Union[int, None] = None
+        self._trusted_reads: bool = model_class.meta.trusted_reads
 
     def validate_only_and_defer(self) -> None:
         if self._only_fields and self._defer_fields:
@@ -79,6 +110,53 @@ class BaseQuerySet(QuerySetProtocol, Generic[T]):
         self._skip_count = count
         return self
 
+    def batch_size(self, size: int) -> "BaseQuerySet[T]":
+        """
+        Sets the number of documents returned by MongoDB in each batch of the
+        cursor, overriding the `batch_size` of the Meta.
+
+        Zero uses the default of the server.
+        """
+        self._batch_size = size
+        return self
+
+    def trusted_reads(self, enabled: bool = True) -> "BaseQuerySet[T]":
+        """
+        Builds the documents of the query without validating the stored
+        values, overriding the `trusted_reads` of the Meta.
+        """
+        self._trusted_reads = enabled
+        return self
+
+    def _apply_batch_size(self, cursor: Any) -> Any:
+        batch_size = self._batch_size
+        if batch_size is None:
+            batch_size = self.model_class.meta.batch_size
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
+    def read_preference(self, read_preference: Any) -> "BaseQuerySet[T]":
+        """
+        Sets the read preference of the query, either a pymongo read
+        preference or the name of the mode, e.g. "secondaryPreferred" or
+        "nearest".
+        """
+        self._collection = with_options(
+            self._collection, read_preference=to_read_preference(read_preference)
+        )
+        return self
+
+    def read_concern(self, read_concern: Any) -> "BaseQuerySet[T]":
+        """
+        Sets the read concern of the query, either a pymongo read concern or
+        the level, e.g. "majority".
+        """
+        self._collection = with_options(
+            self._collection, read_concern=to_read_concern(read_concern)
+        )
+        return self
+
     def only(self, *fields: Sequence[str]) -> "BaseQuerySet[T]":
         """
         Filters by the only fields.
@@ -121,10 +199,12 @@ class BaseQuerySet(QuerySetProtocol, Generic[T]):
 class QuerySet(BaseQuerySet[T]):
     async def __aiter__(self) -> AsyncGenerator[T, None]:
         filter_query = Expression.compile_many(self._filter)
-        cursor = self._collection.find(filter_query)
+        cursor = self._apply_batch_size(
+            self._collection.find(filter_query, session=get_client_session())
+        )
 
         async for document in cursor:
-            yield self.model_class(**document)
+            yield self._from_row(document)
 
     async def none(self) -> "QuerySet[T]":
         """
@@ -137,7 +217,9 @@ class QuerySet(BaseQuerySet[T]):
         Returns all the results for a given collection of a document
         """
         filter_query = Expression.compile_many(self._filter)
-        cursor = self._collection.find(filter_query)
+        cursor = self._apply_batch_size(
+            self._collection.find(filter_query, session=get_client_session())
+        )
 
         if self._sort:
             sort_query = [expr.compile() for expr in self._sort]
@@ -149,36 +231,56 @@ class QuerySet(BaseQuerySet[T]):
         if self._limit_count:
             cursor = cursor.limit(self._limit_count)
 
-        # For only fields
-        is_only_fields = True if self._only_fields else False
-        is_defer_fields = True if self._defer_fields else False
-
-        results: List[T] = [
-            self.model_class.from_row(
-                document,
-                is_only_fields=is_only_fields,
-                only_fields=self._only_fields,
-                is_defer_fields=is_defer_fields,
-                defer_fields=self._defer_fields,
-            )
-            async for document in cursor
-        ]
-
+        results: List[T] = [self._from_row(document) async for document in cursor]
         return results
 
+    def _from_row(self, document: Dict[str, Any]) -> Any:
+        """
+        Builds the document from a row, with the only/defer fields of the query.
+        """
+        return self.model_class.from_row(
+            document,
+            is_only_fields=True if self._only_fields else False,
+            only_fields=self._only_fields,
+            is_defer_fields=True if self._defer_fields else False,
+            defer_fields=self._defer_fields,
+            from_collection=self._collection,
+            trusted=self._trusted_reads,
+        )
+
     async def count(self) -> int:
         """
         Counts all the documents for a given colletion.
         """
 
         filter_query = Expression.compile_many(self._filter)
-        return cast(int, await self._collection.count_documents(filter_query))
+        return cast(
+            int, await self._collection.count_documents(filter_query, session=get_client_session())
+        )
+
+    async def delete(self) -> Union[int, None]:
+        """
+        Delete documents matching the criteria.
 
-    async def delete(self) -> int:
-        """Delete documents matching the criteria."""
+        Returns the number of deleted documents, not known (None) when the
+        `write_concern` of the document is unacknowledged.
+        """
         filter_query = Expression.compile_many(self._filter)
-        result = await self._collection.delete_many(filter_query)
+        before, after = bulk_signals(self.model_class, "delete", expire=self._expire)
+        if before is not None or after is not None:
+            try:
+                deleted = await delete_by_ids(
+                    self._collection, filter_query, BULK_CHUNK_SIZE, before=before, after=after
+                )
+            finally:
+                self._expire()
+            return deleted
 
+        result = await self._collection.delete_many(filter_query, session=get_client_session())
+        self._expire()
+
+        if not result.acknowledged:
+            return None
         return cast(int, result.deleted_count)
 
     async def first(self) -> Union[T, None]:
@@ -239,7 +341,9 @@ class QuerySet(BaseQuerySet[T]):
             {"$setOnInsert": values},
             upsert=True,
             return_document=True,
+            session=get_client_session(),
         )
+        query_cache.invalidate(self._collection.name)
         return self.model_class(**model)
 
     async def distinct_values(self, key: str) -> List[Any]:
@@ -247,7 +351,8 @@ class QuerySet(BaseQuerySet[T]):
         Returns a list of distinct values filtered by the key.
         """
         filter_query = Expression.compile_many(self._filter)
-        values = await self._collection.find(filter_query).distinct(key=key)
+        cursor = self._collection.find(filter_query, session=get_client_session())
+        values = await cursor.distinct(key=key)
         return cast(List[Any], values)
 
     async def where(self, condition: Union[str, Code]) -> Any:
@@ -261,51 +366,107 @@ class QuerySet(BaseQuerySet[T]):
         ), "The where clause must be a string or a bson.Code"
 
         filter_query = Expression.compile_many(self._filter)
-        cursor = self._collection.find(filter_query).where(condition)
-        return [self.model_class(**document) async for document in cursor]
+        cursor = self._collection.find(filter_query, session=get_client_session()).where(condition)
+        cursor = self._apply_batch_size(cursor)
+        return [self._from_row(document) async for document in cursor]
 
-    async def bulk_create(self, models: List["Document"]) -> List["Document"]:
+    async def bulk_create(self, models: Models, **kwargs: Any) -> Any:
         """
         Creates many documents (bulk create).
         """
-        return await self.model_class.create_many(models=models)
+        return await self.model_class.create_many(models=models, **kwargs)
 
     async def update(self, **kwargs: Any) -> List[T]:
         """
         Updates a document
         """
-        return await self.update_many(**kwargs)
+        return await self.update_many(returning="documents", **kwargs)
+
+    async def bulk_update(
+        self,
+        documents: Union[Sequence["Document"], None] = None,
+        fields: Union[Sequence[str], None] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Without documents, sets the values on all the matching documents and
+        returns them, like `update_many(returning="documents")`.
 
-    async def bulk_update(self, **kwargs: Any) -> List[T]:
-        return await self.update_many(**kwargs)
+        With documents, writes the given fields of each instance with one
+        update per instance, sent in unordered bulk writes of up to
+        `chunk_size` updates each, and returns the `BulkWriteResult`. The
+        documents with a `version_field` are checked and incremented like
+        `save()` does, raising a `StaleDocumentError` for the stale ones.
+        """
+        if documents is None:
+            return await self.update_many(returning="documents", **kwargs)
 
-    async def update_many(self, **kwargs: Any) -> List[T]:
-        from mongoz.core.db.documents._internal import ModelDump
+        return await update_documents(
+            self._collection, self.model_class, documents, fields, chunk_size=chunk_size
+        )
 
-        field_definitions = {
-            name: (annotations, ...)
-            for name, annotations in self.model_class.__annotations__.items()
-            if name in kwargs
-        }
+    async def update_many(
+        self, returning: str = "count", write_concern: Any = None, **kwargs: Any
+    ) -> Any:
+        """
+        Updates many documents (bulk update).
+
+        Returns an `UpdateResult` with the counts by default. With
+        `returning="ids"` returns the ids of the updated documents and with
+        `returning="documents"` the updated documents, which requires an
+        acknowledged `write_concern`.
+        """
+        if returning not in UPDATE_RETURNING:
+            raise MongozException(
+                detail=f"Invalid returning: {returning}, expected one of "
+                f"{', '.join(UPDATE_RETURNING)}."
+            )
 
-        if field_definitions:
-            pydantic_model: Type[pydantic.BaseModel] = pydantic.create_model(
-                self.model_class.__name__,
-                __base__=ModelDump,
-                **field_definitions,
+        collection = with_options(self._collection, write_concern=to_write_concern(write_concern))
+        if returning != "count" and not collection.write_concern.acknowledged:
+            raise MongozException(
+                detail=f"returning={returning} requires an acknowledged write concern."
             )
-            model = pydantic_model.model_validate(kwargs)
-            values = model.model_dump()
 
-            filter_query = Expression.compile_many(self._filter)
-            await self._collection.update_many(filter_query, {"$set": values})
+        update = compile_update(self.model_class, kwargs, strict=False)
 
-            _filter = [expression for expression in self._filter if expression.key not in values]
-            _filter.extend([Expression(key, "$eq", value) for key, value in values.items()])
+        filter_query = Expression.compile_many(self._filter)
+        before, after = bulk_signals(self.model_class, "update", expire=self._expire, update=update)
+        if returning == "count" and before is None and after is None:
+            if not update:
+                return UpdateResult()
+            result = await collection.update_many(
+                filter_query, update, session=get_client_session()
+            )
+            self._expire()
+            if not result.acknowledged:
+                return UpdateResult(None, None, acknowledged=False)
+            return UpdateResult(result.matched_count, result.modified_count)
 
-            self._filter = _filter
+        ids, update_result = await update_by_ids(
+            collection, filter_query, update, before=before, after=after
+        )
+        if update:
+            self._expire()
+        if returning == "count":
+            return update_result
+        if returning == "ids":
+            return ids
+
+        self._filter = [Expression("_id", "$in", ids)]
         return await self.all()
 
+    def _expire(self) -> None:
+        """
+        Invalidates the cached queries and the session documents of the
+        collection after a write on many documents.
+        """
+        query_cache.invalidate(self._collection.name)
+        session = get_session()
+        if session is not None:
+            session.expire(self._collection)
+
     async def get_document_by_id(self, id: Union[str, bson.ObjectId]) -> "Document":
         """
         Gets a document by the id.
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-import collections
 import typing
 from typing import TYPE_CHECKING, Any, Dict, List, Union, cast
 
+from pydantic import BaseModel
+
 from mongoz.core.db.datastructures import Order
+from mongoz.core.db.querysets.normalizer import (
+    AND,
+    LOGICAL_OPERATORS,
+    flatten,
+    merge,
+    normalize,
+)
 from mongoz.utils.enums import ExpressionOperator
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -12,6 +20,16 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Expression:
+    """
+    Representation of a single query clause.
+
+    Expressions are treated as immutable, which allows the compiled form of
+    each one to be cached and reused across every execution of the query.
+    Reassigning any of the attributes drops the cached form.
+    """
+
+    _compiled: Union[Dict[str, Any], None] = None
+
     def __init__(
         self,
         key: Union[str, "MongozField"],
@@ -19,11 +37,18 @@ class Expression:
         value: Any,
         options: Union[Any, None] = None,
     ) -> None:
-        self.key = key if isinstance(key, str) else key._name
-        self.operator = operator
+        # Enum members are converted to plain strings, avoiding the mix of
+        # both (with different hashes) in the compiled queries.
+        self.key = str(key) if isinstance(key, str) else key._name
+        self.operator = str(operator)
         self.value = value
         self.options = options
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_compiled":
+            object.__setattr__(self, "_compiled", None)
+
     @property
     def compiled_value(self) -> Any:
         if isinstance(self.value, list):
@@ -32,13 +57,37 @@ class Expression:
             return self.map(self.value)
 
     def map(self, v: Any) -> Any:
-        try:
+        # Embedded documents are the only values needing a conversion.
+        if isinstance(v, BaseModel):
             return v.model_dump()
-        except AttributeError:
-            return v
+        return v
 
     def compile(self) -> Dict[str, Dict[str, Any]]:
-        if self.operator == ExpressionOperator.STARTSWITH:
+        """
+        Returns the compiled BSON fragment of the expression.
+
+        The fragment is computed only once and shared by every query using
+        the expression, so it must not be mutated.
+        """
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+
+    def _compile(self) -> Dict[str, Dict[str, Any]]:
+        # Logical operators need a {"$or": [...]} query and raw queries
+        # unpack them as {"$or": {"$eq": [...]}}.
+        if self.key in LOGICAL_OPERATORS:
+            clauses = [
+                Expression.compile_many([v]) if isinstance(v, Expression) else normalize(v)
+                for v in self.value
+            ]
+            return {self.key: clauses}  # type: ignore
+        elif self.operator == ExpressionOperator.NOT and isinstance(
+            self.value, Expression
+        ):
+            ((_, negated),) = self.value.compile().items()
+            return {self.key: {self.operator: negated}}
+        elif self.operator == ExpressionOperator.STARTSWITH:
             regex_value = f"^{self.compiled_value}"
             return {self.key: {"$regex": regex_value}}
         elif self.operator == ExpressionOperator.ENDSWITH:
@@ -63,31 +112,20 @@ class Expression:
     def compile_many(
         cls, expressions: List["Expression"]
     ) -> Dict[str, Dict[str, Any]]:
-        compiled_dicts: Dict[Any, dict] = collections.defaultdict(dict)
-        compiled_lists: Dict[Any, list] = collections.defaultdict(list)
-
-        for expr in expressions:
-            for key, value in expr.compile().items():
-                # Logical operators need a {"$or": [...]} query
-                if key in ["$and", "$or"]:
-                    list_value = value.get(key, value.get("$eq"))
-                    assert isinstance(list_value, (list, tuple))
-                    values = [
-                        v.compile() if isinstance(v, Expression) else v
-                        for v in list_value
-                    ]
-                    compiled_lists[key] = values
-                else:
-                    values_dict: Dict[str, Any] = {}
-                    for k, v in value.items():
-                        if isinstance(v, Expression) and k in ["$not"]:
-                            values_dict[k] = {v.operator: v.compiled_value}
-                            compiled_dicts[key].update(values_dict)
-                        else:
-                            compiled_dicts[key].update(value)
-        return cast(
-            Dict[str, Dict[str, Any]], {**compiled_dicts, **compiled_lists}
-        )
+        """
+        Compiles a list of expressions into a normalized MongoDB query.
+
+        The expressions are ANDed together and the result goes through the
+        normalizer, merging the ranges of the same field, flattening the nested
+        logical operators and removing the duplicated clauses.
+        """
+        if not expressions:
+            return {}
+
+        # The fragments of logical operators are normalized when compiled,
+        # which means the clauses are merged in a single pass.
+        clauses = flatten(AND, [expr.compile() for expr in expressions])
+        return cast(Dict[str, Dict[str, Any]], merge(clauses, is_normalized=True))
 
     @classmethod
     def unpack(cls, d: Dict[str, Any]) -> "List[Expression]":
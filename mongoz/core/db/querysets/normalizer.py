@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+from mongoz.core.utils.documents import bson_type_order
+from mongoz.utils.enums import ExpressionOperator
+
+AND = ExpressionOperator.AND.value
+OR = ExpressionOperator.OR.value
+NOR = ExpressionOperator.NOR.value
+LOGICAL_OPERATORS = (AND, OR, NOR)
+
+# Single element lists of these operators are rewritten as equalities.
+EQUALITY_REWRITES = {
+    ExpressionOperator.IN.value: ExpressionOperator.EQUAL.value,
+    ExpressionOperator.NOT_IN.value: ExpressionOperator.NOT_EQUAL.value,
+}
+
+# For each range operator, the function picking the tightest of two bounds.
+RANGE_OPERATORS = {
+    ExpressionOperator.GREATER_THAN.value: max,
+    ExpressionOperator.GREATER_THAN_EQUAL.value: max,
+    ExpressionOperator.LESS_THAN.value: min,
+    ExpressionOperator.LESS_THAN_EQUAL.value: min,
+}
+
+# Operators that must always travel together inside the same clause.
+REGEX_OPERATORS = {ExpressionOperator.PATTERN.value, "$options"}
+
+
+def is_operator_dict(value: Any) -> bool:
+    """
+    Checks if the value is a dictionary of query operators, e.g. {"$gt": 1}.
+    """
+    return (
+        isinstance(value, dict)
+        and bool(value)
+        and all(isinstance(key, str) and key.startswith("$") for key in value)
+    )
+
+
+def flatten(operator: str, clauses: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Flattens nested logical operators of the same kind.
+
+    E.g.: {"$and": [{"$and": [a, b]}, c]} becomes [a, b, c] and the same
+    happens for nested $or. For $and, a clause with multiple keys is also split
+    into one clause per key as they are implicitly ANDed. Nested $nor are kept,
+    NOR(NOR(a, b), c) is not NOR(a, b, c).
+    """
+    flattened: List[Dict[str, Any]] = []
+
+    for clause in clauses:
+        if not isinstance(clause, dict):
+            flattened.append(clause)
+            continue
+
+        if operator == AND:
+            for key, value in clause.items():
+                if key == operator:
+                    flattened.extend(flatten(operator, value))
+                else:
+                    flattened.append({key: value})
+        elif operator == OR and len(clause) == 1 and next(iter(clause)) == operator:
+            flattened.extend(flatten(operator, clause[operator]))
+        else:
+            flattened.append(clause)
+    return flattened
+
+
+def dedupe(clauses: List[Any]) -> List[Any]:
+    """
+    Removes duplicate clauses keeping the order of the first occurrence.
+    """
+    unique: List[Any] = []
+    for clause in clauses:
+        if clause not in unique:
+            unique.append(clause)
+    return unique
+
+
+def simplify_operators(operators: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rewrites single element $in/$nin into the cheaper $eq/$ne equivalents.
+
+    Regular expressions are left untouched as `$in` matches them as patterns
+    while `$eq` would match them literally.
+    """
+    if not any(operator in EQUALITY_REWRITES for operator in operators):
+        return operators
+
+    simplified: Dict[str, Any] = {}
+    for operator, value in operators.items():
+        if (
+            operator in EQUALITY_REWRITES
+            and isinstance(value, (list, tuple))
+            and len(value) == 1
+            and not isinstance(value[0], re.Pattern)
+        ):
+            operator = EQUALITY_REWRITES[operator]
+            value = value[0]
+
+        if operator in simplified and simplified[operator] != value:
+            # The same operator twice can only be kept as separated clauses.
+            return operators
+        simplified[operator] = value
+    return simplified
+
+
+def tighten(operator: str, current: Any, value: Any) -> Tuple[bool, Any]:
+    """
+    Merges two bounds of the same range operator into the tightest one.
+
+    Returns a tuple with a boolean indicating if the values could be merged and
+    the merged value. Only the bounds of the same BSON type are merged, the
+    booleans are not numbers for MongoDB, e.g. {"$gt": True} and {"$gt": 2}
+    are both kept.
+    """
+    if bson_type_order(current) != bson_type_order(value):
+        return False, current
+
+    if current == value:
+        return True, current
+
+    # Python does not compare the documents and the arrays like MongoDB.
+    if operator not in RANGE_OPERATORS or isinstance(current, (dict, list, tuple)):
+        return False, current
+
+    try:
+        return True, RANGE_OPERATORS[operator](current, value)
+    except TypeError:
+        # Values of different types do not compare in python the same way
+        # they do in MongoDB, so we leave them for the database to handle.
+        return False, current
+
+
+def merge_field(
+    query: Dict[str, Any], conflicts: List[Dict[str, Any]], key: str, value: Any
+) -> None:
+    """
+    Merges the predicates of a field into the query.
+
+    Everything that cannot be safely merged into the existing predicates of the
+    same field is added to the conflicts, which are later ANDed with the query.
+    """
+    if not is_operator_dict(value):
+        if key not in query:
+            query[key] = value
+        elif query[key] != value:
+            conflicts.append({key: value})
+        return
+
+    operators = simplify_operators(value)
+
+    if key not in query:
+        query[key] = dict(operators)
+        return
+
+    existing = query[key]
+    if not is_operator_dict(existing):
+        conflicts.append({key: operators})
+        return
+
+    merged = dict(existing)
+    if REGEX_OPERATORS.intersection(operators) and REGEX_OPERATORS.intersection(merged):
+        if {k: v for k, v in operators.items() if k in REGEX_OPERATORS} != {
+            k: v for k, v in merged.items() if k in REGEX_OPERATORS
+        }:
+            conflicts.append({key: operators})
+            return
+
+    for operator, operator_value in operators.items():
+        if operator not in merged:
+            merged[operator] = operator_value
+            continue
+
+        is_merged, merged_value = tighten(operator, merged[operator], operator_value)
+        if not is_merged:
+            conflicts.append({key: operators})
+            return
+        merged[operator] = merged_value
+
+    query[key] = merged
+
+
+def normalize(query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalizes a compiled query into a smaller and canonical form.
+
+    1. Nested `$and`/`$or` operators are flattened.
+    2. Range predicates on the same field are merged (keeping the tightest bound).
+    3. Single element `$in`/`$nin` become `$eq`/`$ne`.
+    4. Duplicated clauses are removed.
+    5. Fields are sorted so that equivalent queries produce the same document,
+       which helps the MongoDB plan cache and any query based cache.
+    """
+    if not query:
+        return {}
+    return merge(flatten(AND, [query]))
+
+
+def merge(clauses: List[Dict[str, Any]], is_normalized: bool = False) -> Dict[str, Any]:
+    """
+    Merges a flat list of ANDed clauses into a normalized query.
+
+    When `is_normalized` is set, the clauses of the logical operators are
+    considered already normalized and are not walked again.
+    """
+    fields: Dict[str, Any] = {}
+    conflicts: List[Dict[str, Any]] = []
+    logical: List[Dict[str, Any]] = []
+
+    pending = deque(clauses)
+    while pending:
+        clause = pending.popleft()
+        for key, value in clause.items():
+            if key not in LOGICAL_OPERATORS:
+                merge_field(fields, conflicts, key, value)
+                continue
+
+            items = flatten(key, value)
+            if not is_normalized:
+                items = [normalize(item) for item in items]
+            items = dedupe(items)
+
+            if key == OR and not all(items):
+                # An empty clause matches everything and so does the whole $or.
+                continue
+
+            if key == OR and len(items) == 1:
+                # A single $or is the same as the clause itself.
+                pending.extendleft(reversed(flatten(AND, items)))
+            elif items and {key: items} not in logical:
+                logical.append({key: items})
+
+    normalized: Dict[str, Any] = {key: fields[key] for key in sorted(fields)}
+
+    and_clauses = dedupe(conflicts)
+    for clause in logical:
+        ((key, value),) = clause.items()
+        if key in normalized:
+            and_clauses.append(clause)
+        else:
+            normalized[key] = value
+
+    if and_clauses:
+        normalized[AND] = and_clauses
+    return normalized
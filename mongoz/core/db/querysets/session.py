@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union, cast
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from mongoz.core.connection.transactions import get_client_session
+from mongoz.core.db.querysets.cache import query_cache
+from mongoz.exceptions import BulkWriteError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mongoz import Document
+
+IdentityKey = Tuple[str, Any]
+
+_current_session: ContextVar[Union["Session", None]] = ContextVar(
+    "mongoz_session", default=None
+)
+
+
+def get_session() -> Union["Session", None]:
+    """
+    Returns the session of the current context, if any.
+    """
+    return _current_session.get()
+
+
+def get_collection(
+    document: Union["Document", Type["Document"]],
+    collection: Union[AsyncIOMotorCollection, None] = None,
+) -> AsyncIOMotorCollection:
+    if collection is not None:
+        return collection
+    return document.meta.collection._collection  # type: ignore
+
+
+def get_full_name(collection: AsyncIOMotorCollection) -> str:
+    """
+    Returns the `database.collection` name, telling apart the same collection
+    used in different databases.
+    """
+    return cast(str, collection.full_name)
+
+
+class Session:
+    """
+    Unit of work keeping an identity map of the documents loaded in a scope.
+
+    Inside the session, a document with the same `_id` read from the same
+    collection is hydrated only once and every query returns that same
+    instance. The documents changed inside the scope are written in one bulk
+    write per collection when the session exits.
+
+    Usage:
+
+        async with Session():
+            movie = await Movie.objects.get(name="Downfall")
+            same = await Movie.get_document_by_id(movie.id)  # No query.
+
+            movie.year = 2004
+        # The changes are flushed here.
+    """
+
+    def __init__(self, autoflush: bool = True) -> None:
+        self.autoflush = autoflush
+        self._identity_map: Dict[IdentityKey, "Document"] = {}
+        self._collections: Dict[str, AsyncIOMotorCollection] = {}
+        self._token: Union[Token, None] = None
+
+    def get(
+        self, collection: AsyncIOMotorCollection, id: Any
+    ) -> Union["Document", None]:
+        """
+        Returns the document with the given id loaded from the collection.
+        """
+        return self._identity_map.get((get_full_name(collection), id))
+
+    def add(
+        self,
+        instance: "Document",
+        collection: Union[AsyncIOMotorCollection, None] = None,
+    ) -> "Document":
+        """
+        Adds the document to the identity map. Its changes are the ones since
+        it was loaded or last written.
+        """
+        collection = get_collection(instance, collection)
+        key = (get_full_name(collection), instance.id)
+
+        self._identity_map[key] = instance
+        self._collections[key[0]] = collection
+        return instance
+
+    def discard(
+        self,
+        instance: "Document",
+        collection: Union[AsyncIOMotorCollection, None] = None,
+    ) -> None:
+        """
+        Removes the document from the identity map.
+        """
+        collection = get_collection(instance, collection)
+        key = (get_full_name(collection), instance.id)
+
+        self._identity_map.pop(key, None)
+
+    def expire(self, collection: AsyncIOMotorCollection) -> None:
+        """
+        Removes all the documents of the collection from the identity map,
+        for instance after a bulk update, so they are loaded again.
+        """
+        full_name = get_full_name(collection)
+        for key in [key for key in self._identity_map if key[0] == full_name]:
+            self._identity_map.pop(key)
+
+    def changes(self) -> Dict[IdentityKey, Dict[str, Any]]:
+        """
+        Returns the changed values of every dirty document of the session.
+        """
+        changes: Dict[IdentityKey, Dict[str, Any]] = {}
+
+        for key, instance in self._identity_map.items():
+            changed = instance.get_changes()
+            if changed:
+                changes[key] = changed
+        return changes
+
+    @property
+    def dirty(self) -> List["Document"]:
+        """
+        The documents changed since they were loaded.
+        """
+        return [self._identity_map[key] for key in self.changes()]
+
+    async def flush(self) -> int:
+        """
+        Writes the changes of the dirty documents, using one unordered bulk
+        write per collection.
+
+        The documents with a `version_field` are written one by one, checked
+        and incremented like `save()` does, raising a `StaleDocumentError`
+        for the ones changed since they were loaded once the others are
+        written.
+
+        Returns the number of modified documents.
+        """
+        from mongoz.core.db.querysets.bulk import (
+            execute_versioned_writes,
+            stale_error,
+            versioned_update,
+        )
+
+        requests: Dict[str, List[UpdateOne]] = {}
+        versioned: Dict[str, List[Tuple["Document", Tuple[Dict[str, Any], Dict[str, Any]]]]] = {}
+
+        changes = self.changes()
+        for key, values in changes.items():
+            instance = self._identity_map[key]
+            if instance.meta.version_field is None:
+                requests.setdefault(key[0], []).append(
+                    UpdateOne({"_id": instance.id}, {"$set": values})
+                )
+            else:
+                versioned.setdefault(key[0], []).append(
+                    (instance, versioned_update(instance, values))
+                )
+
+        modified = 0
+        written: List["Document"] = []
+        stale: List["Document"] = []
+        for collection_name in {**requests, **versioned}:
+            collection = self._collections[collection_name]
+            operations = requests.get(collection_name)
+            if operations:
+                bulk_result = await collection.bulk_write(
+                    operations, ordered=False, session=get_client_session()
+                )
+                query_cache.invalidate(collection.name)
+                if bulk_result.acknowledged:
+                    modified += bulk_result.modified_count
+
+            updates = versioned.get(collection_name)
+            if updates:
+                instances = [instance for instance, _ in updates]
+                result, stale_instances = await execute_versioned_writes(
+                    collection, instances, [update for _, update in updates]
+                )
+                query_cache.invalidate(collection.name)
+                if result.errors:
+                    raise BulkWriteError(
+                        result=result, detail=f"{len(result.errors)} operations failed."
+                    )
+                modified += result.modified_count
+                written.extend(
+                    instance
+                    for instance in instances
+                    if not any(instance is document for document in stale_instances)
+                )
+                stale.extend(stale_instances)
+
+        for key in changes:
+            instance = self._identity_map[key]
+            if instance.meta.version_field is None:
+                instance.take_snapshot()
+        for instance in written:
+            instance.take_snapshot()
+        if stale:
+            raise stale_error(stale)
+        return modified
+
+    def clear(self) -> None:
+        """
+        Removes all the documents from the session without writing them.
+        """
+        self._identity_map.clear()
+        self._collections.clear()
+
+    def __contains__(self, instance: "Document") -> bool:
+        return any(document is instance for document in self._identity_map.values())
+
+    def __len__(self) -> int:
+        return len(self._identity_map)
+
+    async def __aenter__(self) -> "Session":
+        self._token = _current_session.set(self)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        try:
+            if exc_type is None and self.autoflush:
+                await self.flush()
+        finally:
+            _current_session.reset(self._token)
+            self._token = None
+            self.clear()
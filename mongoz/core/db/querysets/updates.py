@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Type
+
+from bson.decimal128 import Decimal128
+
+from mongoz.core.db.querysets.bulk import ID_KEYS, validate_values
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mongoz import Document
+
+
+class UpdateOperator:
+    """
+    Base of the update operators, applied by the server to the stored value
+    of a field instead of replacing it.
+
+    E.g.: await Movie.objects.filter(name="Downfall").update(views=Inc(1))
+    """
+
+    operator: ClassVar[str]
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def compile(self, document: Type["Document"], name: str) -> Any:
+        """
+        Returns the value of the operator for the field, validated by the
+        type of the field.
+        """
+        return validate_values(document, {name: self.value})[name]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value!r})"
+
+
+class Inc(UpdateOperator):
+    """
+    Increments a number field by the value, which can be negative.
+    """
+
+    operator = "$inc"
+
+    def compile(self, document: Type["Document"], name: str) -> Any:
+        value = super().compile(document, name)
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal, Decimal128)):
+            raise ValueError(f"Inc can only be used with number fields, not {name}.")
+        return value
+
+
+class Min(UpdateOperator):
+    """
+    Sets the field to the value when it is lower than the stored one.
+    """
+
+    operator = "$min"
+
+
+class Max(UpdateOperator):
+    """
+    Sets the field to the value when it is greater than the stored one.
+    """
+
+    operator = "$max"
+
+
+class ArrayOperator(UpdateOperator):
+    """
+    Base of the operators of the array fields, validating each value as an
+    item of the array.
+    """
+
+    def __init__(self, *values: Any) -> None:
+        super().__init__(list(values))
+
+    def compile(self, document: Type["Document"], name: str) -> Any:
+        values: List[Any] = validate_values(document, {name: self.value})[name]
+        if len(values) == 1:
+            return values[0]
+        return {"$each": values}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(repr(value) for value in self.value)})"
+
+
+class Push(ArrayOperator):
+    """
+    Appends the values to an array field.
+    """
+
+    operator = "$push"
+
+
+class AddToSet(ArrayOperator):
+    """
+    Appends the values not yet in an array field.
+    """
+
+    operator = "$addToSet"
+
+
+class Pull(ArrayOperator):
+    """
+    Removes all the occurrences of the values from an array field.
+    """
+
+    operator = "$pull"
+
+    def compile(self, document: Type["Document"], name: str) -> Any:
+        values: List[Any] = validate_values(document, {name: self.value})[name]
+        if len(values) == 1:
+            return values[0]
+        return {"$in": values}
+
+
+def compile_update(
+    document: Type["Document"], values: Dict[str, Any], strict: bool = True
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compiles the values of an update into an update document, with the
+    plain values in `$set` and each update operator in its own clause.
+
+    The names that are not fields of the document raise a ValueError or,
+    when not `strict`, are ignored.
+    """
+    update: Dict[str, Dict[str, Any]] = {}
+
+    plain = {
+        name: value for name, value in values.items() if not isinstance(value, UpdateOperator)
+    }
+    validated = validate_values(document, plain, strict=strict)
+    if validated:
+        update["$set"] = validated
+
+    for name, value in values.items():
+        if not isinstance(value, UpdateOperator):
+            continue
+        if name in ID_KEYS or name not in document.model_fields:
+            if strict:
+                raise ValueError(f"Invalid field {name} for class {document.__name__}")
+            continue
+        update.setdefault(value.operator, {})[name] = value.compile(document, name)
+    return update
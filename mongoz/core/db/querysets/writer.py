@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Tuple, Type, Union
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from mongoz.core.connection.transactions import _current_transaction
+from mongoz.core.db.querysets.bulk import insert_models
+from mongoz.core.db.querysets.cache import query_cache
+from mongoz.core.db.querysets.session import _current_session
+from mongoz.exceptions import BulkWriteError, MongozException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mongoz import Document
+
+# The number of batches buffered by default before submit() waits for the
+# writes to catch up.
+BUFFERED_BATCHES = 10
+
+
+class BufferedWriter:
+    """
+    Write buffer coalescing the inserts of many concurrent tasks into
+    unordered `insert_many` batches, written by a background task.
+
+    A batch is written once it has `max_batch` models or `max_delay_ms`
+    after its first model, whichever comes first. When `max_pending` models
+    are waiting, `submit()` waits for room, slowing down the producers.
+
+    Usage:
+
+        async with Event.buffered_writer(max_batch=1000, max_delay_ms=50) as writer:
+            id = await writer.insert(Event(name="click"))
+        # The buffered models are written here.
+    """
+
+    def __init__(
+        self,
+        document: Type["Document"],
+        collection: AsyncIOMotorCollection,
+        max_batch: int = 1000,
+        max_delay_ms: float = 50,
+        max_pending: Union[int, None] = None,
+    ) -> None:
+        if max_batch < 1:
+            raise MongozException(detail="max_batch must be greater than 0.")
+        if max_delay_ms < 0:
+            raise MongozException(detail="max_delay_ms can't be negative.")
+
+        self.document = document
+        self.collection = collection
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.max_pending = max_pending or max_batch * BUFFERED_BATCHES
+        self.closed = False
+        self._queue: Union[asyncio.Queue, None] = None
+        self._task: Union[asyncio.Task, None] = None
+        self._getter: Union[asyncio.Future, None] = None
+        self._flushing = 0
+
+    async def submit(self, model: "Document") -> asyncio.Future:
+        """
+        Buffers the model, waiting while the buffer is full, and returns the
+        future of its id, resolved once the model is inserted.
+        """
+        if self.closed:
+            raise MongozException(detail="The writer is closed.")
+        if not isinstance(model, self.document):
+            raise TypeError(f"All models must be of type {self.document.__name__}")
+
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = asyncio.ensure_future(self._run())
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((model, future))
+        return future
+
+    async def insert(self, model: "Document") -> Any:
+        """
+        Buffers the model and returns its id once it is inserted.
+        """
+        return await (await self.submit(model))
+
+    async def flush(self) -> None:
+        """
+        Writes the models buffered so far without waiting for `max_delay_ms`
+        and waits until they are written.
+        """
+        if self._queue is None:
+            return
+
+        self._flushing += 1
+        try:
+            await self._queue.join()
+        finally:
+            self._flushing -= 1
+
+    async def close(self) -> None:
+        """
+        Flushes the buffer and stops the background task. The models
+        submitted after closing are refused.
+        """
+        self.closed = True
+        await self.flush()
+
+        for pending in (self._getter, self._task):
+            if pending is not None:
+                pending.cancel()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._queue = self._task = self._getter = None
+
+    async def __aenter__(self) -> "BufferedWriter":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _get(self, timeout: Union[float, None] = None) -> Any:
+        """
+        Returns the next buffered model, or None after `timeout` seconds.
+
+        The pending get is kept between the calls, so no model is lost when
+        the timeout expires.
+        """
+        assert self._queue is not None
+        if self._getter is None:
+            if not self._queue.empty():
+                return self._queue.get_nowait()
+            self._getter = asyncio.ensure_future(self._queue.get())
+
+        done, _ = await asyncio.wait({self._getter}, timeout=timeout)
+        if not done:
+            return None
+        item = self._getter.result()
+        self._getter = None
+        return item
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        # The task outlives the transaction and the session it may be started
+        # in, the batches are never part of them.
+        _current_transaction.set(None)
+        _current_session.set(None)
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._get()]
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch:
+                timeout = 0.0 if self._flushing else max(deadline - loop.time(), 0)
+                item = await self._get(timeout)
+                if item is None:
+                    break
+                batch.append(item)
+
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: List[Tuple["Document", asyncio.Future]]) -> None:
+        """
+        Inserts a batch, resolving the future of each model with its id or
+        with the error of its insert.
+        """
+        try:
+            result = await insert_models(
+                self.collection, self.document, [model for model, _ in batch], ordered=False
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            query_cache.invalidate(self.document.meta.collection.name)  # type: ignore
+
+        errors = {error["index"]: error for error in result.errors}
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(
+                    BulkWriteError(result=result, detail=errors[index].get("errmsg", ""))
+                )
+            else:
+                future.set_result(result.inserted_ids[index])
@@ -1,13 +1,34 @@
-from .handlers import post_delete, post_save, post_update, pre_delete, pre_save, pre_update
-from .signal import Broadcaster, Signal
+from .handlers import (
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_update,
+    post_delete,
+    post_save,
+    post_update,
+    pre_bulk_create,
+    pre_bulk_delete,
+    pre_bulk_update,
+    pre_delete,
+    pre_save,
+    pre_update,
+)
+from .signal import Broadcaster, Signal, SignalQueue, signal_queue
 
 __all__ = [
     "Broadcaster",
     "Signal",
+    "SignalQueue",
+    "post_bulk_create",
+    "post_bulk_delete",
+    "post_bulk_update",
     "post_delete",
     "post_save",
     "post_update",
+    "pre_bulk_create",
+    "pre_bulk_delete",
+    "pre_bulk_update",
     "pre_delete",
     "pre_save",
     "pre_update",
+    "signal_queue",
 ]
@@ -12,10 +12,13 @@ class Send:
     """
 
     def consumer(
-        signal: str, senders: Union[Type["Document"], List[Type["Document"]]]
+        signal: str,
+        senders: Union[Type["Document"], List[Type["Document"]]],
+        background: bool = False,
     ) -> Callable:
         """
-        Connects the function to all the senders.
+        Connects the function to all the senders, as a background receiver
+        with `background`.
         """
 
         def wrapper(func: Callable) -> Callable:
@@ -23,49 +26,115 @@ class Send:
 
             for sender in _senders:
                 signals = getattr(sender.meta.signals, signal)
-                signals.connect(func)
+                signals.connect(func, background=background)
             return func
 
         return wrapper
 
 
-def pre_save(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def pre_save(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to pre_save.
     """
-    return Send.consumer(signal="pre_save", senders=senders)
+    return Send.consumer(signal="pre_save", senders=senders, background=background)
 
 
-def pre_update(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def pre_update(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to pre_update.
     """
-    return Send.consumer(signal="pre_update", senders=senders)
+    return Send.consumer(signal="pre_update", senders=senders, background=background)
 
 
-def pre_delete(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def pre_delete(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to pre_delete.
     """
-    return Send.consumer(signal="pre_delete", senders=senders)
+    return Send.consumer(signal="pre_delete", senders=senders, background=background)
 
 
-def post_save(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def pre_bulk_create(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to pre_bulk_create.
+    """
+    return Send.consumer(signal="pre_bulk_create", senders=senders, background=background)
+
+
+def pre_bulk_update(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to pre_bulk_update.
+    """
+    return Send.consumer(signal="pre_bulk_update", senders=senders, background=background)
+
+
+def pre_bulk_delete(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to pre_bulk_delete.
+    """
+    return Send.consumer(signal="pre_bulk_delete", senders=senders, background=background)
+
+
+def post_save(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to post_save.
     """
-    return Send.consumer(signal="post_save", senders=senders)
+    return Send.consumer(signal="post_save", senders=senders, background=background)
 
 
-def post_update(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def post_update(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to post_update.
     """
-    return Send.consumer(signal="post_update", senders=senders)
+    return Send.consumer(signal="post_update", senders=senders, background=background)
 
 
-def post_delete(senders: Union[Type["Document"], List[Type["Document"]]]) -> Callable:
+def post_delete(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
     """
     Connects all the senders to post_delete.
     """
-    return Send.consumer(signal="post_delete", senders=senders)
+    return Send.consumer(signal="post_delete", senders=senders, background=background)
+
+
+def post_bulk_create(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to post_bulk_create.
+    """
+    return Send.consumer(signal="post_bulk_create", senders=senders, background=background)
+
+
+def post_bulk_update(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to post_bulk_update.
+    """
+    return Send.consumer(signal="post_bulk_update", senders=senders, background=background)
+
+
+def post_bulk_delete(
+    senders: Union[Type["Document"], List[Type["Document"]]], background: bool = False
+) -> Callable:
+    """
+    Connects all the senders to post_bulk_delete.
+    """
+    return Send.consumer(signal="post_bulk_delete", senders=senders, background=background)
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple, Type, Union
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Tuple, Type, Union
 
+from mongoz import settings
 from mongoz.exceptions import SignalError
 from mongoz.utils.inspect import func_accepts_kwargs
 
 if TYPE_CHECKING:
     from mongoz import Document
 
+logger = logging.getLogger(__name__)
 
-def make_id(target: Any) -> Union[int, Tuple[int, int]]:
+ReceiverKey = Union[int, Tuple[int, int]]
+
+
+def make_id(target: Any) -> ReceiverKey:
     """
     Creates an id for a function.
     """
@@ -28,11 +34,15 @@ class Signal:
         """
         Creates a new signal.
         """
-        self.receivers: Dict[Union[int, Tuple[int, int]], Callable] = {}
+        self.receivers: Dict[ReceiverKey, Callable] = {}
+        self.background: Set[ReceiverKey] = set()
 
-    def connect(self, receiver: Callable) -> None:
+    def connect(self, receiver: Callable, background: bool = False) -> None:
         """
         Connects a given receiver to the the signal.
+
+        A `background` receiver is not awaited by `send()`, its calls are
+        queued in the `signal_queue` and run by its tasks.
         """
         if not callable(receiver):
             raise SignalError("The signals should be callables")
@@ -43,6 +53,8 @@ class Signal:
         key = make_id(receiver)
         if key not in self.receivers:
             self.receivers[key] = receiver
+            if background:
+                self.background.add(key)
 
     def disconnect(self, receiver: Callable) -> bool:
         """
@@ -50,14 +62,113 @@ class Signal:
         """
         key = make_id(receiver)
         func: Union[Callable, None] = self.receivers.pop(key, None)
+        self.background.discard(key)
         return True if func is not None else False
 
     async def send(self, sender: Type["Document"], **kwargs: Any) -> None:
         """
         Sends the notification to all the receivers.
+
+        The background receivers are queued, waiting only when the queue is
+        full, and the others are awaited.
+        """
+        if not self.receivers:
+            return
+
+        receivers = []
+        for key, func in list(self.receivers.items()):
+            if key in self.background:
+                await signal_queue.put(func, sender, kwargs)
+            else:
+                receivers.append(func(sender=sender, **kwargs))
+
+        if len(receivers) == 1:
+            await receivers[0]
+        elif receivers:
+            await asyncio.gather(*receivers)
+
+
+class SignalQueue:
+    """
+    Bounded queue of the calls of the background receivers, run by up to
+    `signal_workers` tasks.
+
+    The errors of a receiver are logged without reaching the sender or the
+    other receivers, and a call running longer than `signal_timeout` seconds
+    is cancelled.
+
+    The queued calls are lost when the event loop stops, so the applications
+    drain the queue on shutdown:
+
+        await signal_queue.close()
+    """
+
+    def __init__(self) -> None:
+        self._queue: Union[asyncio.Queue, None] = None
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def put(self, receiver: Callable, sender: Type["Document"], kwargs: Any) -> None:
+        """
+        Queues a call of the receiver, waiting while the queue is full.
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # The queue and the tasks of a previous event loop can't be used.
+            self._queue = asyncio.Queue(maxsize=settings.signal_queue_maxsize)
+            self._loop = loop
+            self._workers = []
+
+        await self._queue.put((receiver, sender, kwargs))
+        if len(self._workers) < settings.signal_workers:
+            self._workers.append(asyncio.ensure_future(self._run()))
+
+    async def drain(self) -> None:
+        """
+        Waits until all the queued calls have run.
+        """
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """
+        Drains the queue and stops its tasks.
         """
-        receivers = [func(sender=sender, **kwargs) for func in self.receivers.values()]
-        await asyncio.gather(*receivers)
+        await self.drain()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue = self._loop = None
+        self._workers = []
+
+    async def _run(self) -> None:
+        from mongoz.core.connection.transactions import _current_transaction
+        from mongoz.core.db.querysets.session import _current_session
+
+        # The tasks outlive the transaction and the session they may be
+        # started in, the receivers are never part of them.
+        _current_transaction.set(None)
+        _current_session.set(None)
+
+        queue = self._queue
+        assert queue is not None
+        while True:
+            receiver, sender, kwargs = await queue.get()
+            try:
+                await asyncio.wait_for(
+                    receiver(sender=sender, **kwargs), timeout=settings.signal_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Signal receiver %r timed out after %ss.", receiver, settings.signal_timeout
+                )
+            except Exception:
+                logger.exception("Signal receiver %r failed.", receiver)
+            finally:
+                queue.task_done()
+
+
+signal_queue = SignalQueue()
 
 
 class Broadcaster(dict):
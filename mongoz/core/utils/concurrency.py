@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncGenerator, AsyncIterable, Sequence, Union
+
+
+async def merge_async_iterables(
+    iterables: Sequence[AsyncIterable[Any]],
+    concurrency: Union[int, None] = None,
+    maxsize: int = 0,
+) -> AsyncGenerator[Any, None]:
+    """
+    Consumes the async iterables concurrently, at most `concurrency` at a
+    time, yielding the items in the order they arrive.
+
+    The first exception raised by an iterable is raised by the generator and
+    the remaining iterables are cancelled, as it happens when the consumer
+    stops early.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    semaphore = asyncio.Semaphore(concurrency or len(iterables) or 1)
+    done = object()
+
+    async def consume(iterable: AsyncIterable[Any]) -> None:
+        try:
+            async with semaphore:
+                async for item in iterable:
+                    await queue.put((item, None))
+        except Exception as e:
+            await queue.put((None, e))
+        await queue.put((done, None))
+
+    tasks = [asyncio.ensure_future(consume(iterable)) for iterable in iterables]
+    try:
+        pending = len(tasks)
+        while pending:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is done:
+                pending -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
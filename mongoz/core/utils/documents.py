@@ -1,8 +1,28 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Type, Union
-
-from pydantic import ConfigDict
+import datetime
+import decimal
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import bson
+from bson.decimal128 import Decimal128
+from pydantic import BaseModel, ConfigDict
 
 import mongoz
 
@@ -77,3 +97,143 @@ def generify_model_fields(
         edgy_setattr(field, "metadata", [])
         fields[name] = field
     return fields
+
+
+def to_object_id(value: Any) -> Any:
+    """
+    Converts the hex strings stored in an ObjectId field.
+    """
+    if isinstance(value, str):
+        return bson.ObjectId(value)
+    return value
+
+
+def to_decimal(value: Any) -> Any:
+    """
+    Converts the numbers stored in a Decimal field, keeping the Decimal128
+    values as the validation does.
+    """
+    if isinstance(value, (decimal.Decimal, Decimal128)):
+        return value
+    return decimal.Decimal(str(value))
+
+
+def to_date(value: Any) -> Any:
+    """
+    Converts the datetimes stored in a Date field, BSON has no date type.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+def get_converter(annotation: Any) -> Union[Callable[[Any], Any], None]:
+    """
+    Returns the conversion of the stored values of a field for a trusted
+    read, or None when they are used as they are.
+    """
+    types = get_args(annotation) if get_origin(annotation) is Union else (annotation,)
+    types = tuple(type_ for type_ in types if type_ is not type(None))
+
+    if any(isinstance(type_, type) and issubclass(type_, decimal.Decimal) for type_ in types):
+        return to_decimal
+    if any(isinstance(type_, type) and issubclass(type_, bson.ObjectId) for type_ in types):
+        return to_object_id
+    if len(types) != 1:
+        return None
+
+    annotation = types[0]
+    if isinstance(annotation, type) and issubclass(annotation, datetime.date):
+        if issubclass(annotation, datetime.datetime):
+            return None
+        return to_date
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        enum = annotation
+        return lambda value: value if isinstance(value, enum) else enum(value)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: construct_model(annotation, value) if isinstance(value, dict) else value
+
+    if get_origin(annotation) not in (list, List) or not get_args(annotation):
+        return None
+    convert = get_converter(get_args(annotation)[0])
+    if convert is None:
+        return None
+    return lambda values: [convert(value) if value is not None else value for value in values]
+
+
+@lru_cache(maxsize=None)
+def get_converters(model: Type[BaseModel]) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Returns the conversions of the fields of the model for a trusted read.
+    """
+    converters = {}
+    for name, field in model.model_fields.items():
+        converter = get_converter(field.annotation)
+        if converter is not None:
+            converters[name] = converter
+    return converters
+
+
+def construct_model(model: Type[Any], values: Dict[str, Any]) -> Any:
+    """
+    Builds the model from stored values without validating them, only
+    converting the ObjectId, Decimal, date and Enum values that are not
+    stored with their type and building the embedded documents.
+    """
+    # The get_<field>_display methods are otherwise added by the __init__.
+    getattr(model, "get_field_display", lambda: None)()
+
+    converters = get_converters(model)
+    if converters:
+        values = dict(values)
+        for name, convert in converters.items():
+            value = values.get(name)
+            if value is not None:
+                values[name] = convert(value)
+    return model.model_construct(**values)
+
+
+def bson_type_order(value: Any) -> int:
+    """
+    Returns the position of the BSON type of a value in the order MongoDB
+    uses to sort the values of different types.
+    """
+    if value is None:
+        return 1
+    if isinstance(value, bool):
+        return 9
+    if isinstance(value, (int, float, decimal.Decimal, Decimal128)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, (dict, BaseModel)):
+        return 4
+    if isinstance(value, (list, tuple)):
+        return 5
+    if isinstance(value, bytes):
+        return 6
+    if isinstance(value, bson.ObjectId):
+        return 7
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return 10
+    if isinstance(value, bson.Timestamp):
+        return 11
+    if isinstance(value, (re.Pattern, bson.Regex)):
+        return 12
+    if isinstance(value, bson.MaxKey):
+        return 13
+    if isinstance(value, bson.MinKey):
+        return 0
+    return 14
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Copies the dictionaries and the lists of a stored value, sharing the
+    immutable values.
+    """
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    return value
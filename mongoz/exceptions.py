@@ -49,3 +49,21 @@ class OperatorInvalid(MongozException): ...
 
 
 class IndexError(MongozException): ...
+
+
+class StaleDocumentError(MongozException):
+    """
+    Raised when saving a document with a `version_field` that was changed
+    by someone else since it was loaded.
+    """
+
+
+class BulkWriteError(MongozException):
+    """
+    Raised when some operations of a bulk write fail, with the aggregated
+    result of the bulk write, including the errors, in `result`.
+    """
+
+    def __init__(self, *args: typing.Any, result: typing.Any = None, detail: str = ""):
+        self.result = result
+        super().__init__(*args, detail=detail)
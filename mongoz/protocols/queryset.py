@@ -17,7 +17,7 @@ class QuerySetProtocol(Protocol):
 
     async def count(self) -> int: ...
 
-    async def delete(self) -> int: ...
+    async def delete(self) -> Union[int, None]: ...
 
     async def first(self) -> Union[T, None]: ...
 
@@ -47,4 +47,4 @@ class QuerySetProtocol(Protocol):
 
     def sort(self, key: Any, direction: Union["Order", None] = None) -> "QuerySet[T]": ...
 
-    async def update_many(self, **kwargs: Any) -> List[T]: ...
+    async def update_many(self, returning: str = "count", **kwargs: Any) -> Any: ...
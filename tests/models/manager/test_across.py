@@ -0,0 +1,126 @@
+from functools import cmp_to_key
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+from bson.decimal128 import Decimal128
+
+import mongoz
+from mongoz import Document, Order
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+tenants = ["test_tenant_one", "test_tenant_two", "test_tenant_three"]
+
+
+class Invoice(Document):
+    number: int = mongoz.Integer()
+    total: float = mongoz.Double()
+    paid: bool = mongoz.Boolean(default=False)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    for index, tenant in enumerate(tenants):
+        await Invoice.objects.using(tenant).delete()
+        for number in range(3):
+            await Invoice.objects.using(tenant).create(
+                number=number, total=index * 10 + number, paid=number == 0
+            )
+    yield
+    for tenant in tenants:
+        await client.drop_database(tenant)
+
+
+async def test_across_in_database_order() -> None:
+    invoices = await Invoice.objects.across(tenants, concurrency=2)
+
+    assert len(invoices) == 9
+    assert [invoice.source_database for invoice in invoices] == [
+        tenant for tenant in tenants for _ in range(3)
+    ]
+
+
+async def test_across_merged_by_sort() -> None:
+    invoices = await Invoice.objects.across(tenants).sort("total", Order.DESCENDING)
+    assert [invoice.total for invoice in invoices] == [22, 21, 20, 12, 11, 10, 2, 1, 0]
+
+    invoices = (
+        await Invoice.objects.across(tenants)
+        .sort("number", Order.ASCENDING)
+        .sort("total", Order.DESCENDING)
+    )
+    assert [(invoice.number, invoice.source_database) for invoice in invoices[:3]] == [
+        (0, "test_tenant_three"),
+        (0, "test_tenant_two"),
+        (0, "test_tenant_one"),
+    ]
+
+
+async def test_across_with_filter_skip_and_limit() -> None:
+    invoices = (
+        await Invoice.objects.filter(paid=False)
+        .across(tenants)
+        .sort("total", Order.ASCENDING)
+        .skip(1)
+        .limit(3)
+    )
+    assert [invoice.total for invoice in invoices] == [2, 11, 12]
+
+    invoice = await Invoice.objects.across(tenants).sort("total", Order.DESCENDING).first()
+    assert invoice.total == 22
+    assert invoice.source_database == "test_tenant_three"
+
+
+async def test_across_streaming() -> None:
+    invoices = [invoice async for invoice in Invoice.objects.filter(paid=True).across(tenants)]
+
+    assert len(invoices) == 3
+    assert {invoice.source_database for invoice in invoices} == set(tenants)
+
+
+async def test_source_database_not_saved() -> None:
+    invoice = await Invoice.objects.across(tenants[:1]).get(number=1)
+    assert invoice.source_database == "test_tenant_one"
+    assert "source_database" not in invoice.model_dump()
+    assert "_source_database" not in invoice.model_dump()
+
+
+async def test_across_count() -> None:
+    assert await Invoice.objects.across(tenants).count() == 9
+    assert await Invoice.objects.filter(paid=True).across(tenants).count() == 3
+    assert await Invoice.objects.across(tenants, concurrency=1).count() == 9
+
+
+async def test_across_merge_mixed_types() -> None:
+    manager = Invoice.objects.across(tenants).sort("total", Order.ASCENDING)
+    values = ["a", True, 2, None, Decimal128("3"), 1.5, {"a": 1}]
+
+    documents = sorted(
+        ({"total": value} for value in values), key=cmp_to_key(manager._compare_documents)
+    )
+
+    assert [document["total"] for document in documents] == [
+        None,
+        1.5,
+        2,
+        Decimal128("3"),
+        "a",
+        {"a": 1},
+        True,
+    ]
+
+
+async def test_across_writes_not_allowed() -> None:
+    with pytest.raises(MongozException):
+        await Invoice.objects.across(tenants).delete()
+
+    with pytest.raises(MongozException):
+        await Invoice.objects.across(tenants).update_many(paid=True)
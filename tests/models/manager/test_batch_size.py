@@ -0,0 +1,63 @@
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Order
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        batch_size = 2
+
+
+class Actor(Document):
+    name: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    yield
+    await Movie.objects.delete()
+
+
+async def test_meta_batch_size() -> None:
+    assert Movie.meta.batch_size == 2
+    assert Actor.meta.batch_size is None
+
+
+async def test_model_batch_size() -> None:
+    for year in range(2000, 2005):
+        await Movie.objects.create(name=f"Movie {year}", year=year)
+
+    movies = await Movie.objects.sort("year", Order.ASCENDING)
+    assert [movie.year for movie in movies] == list(range(2000, 2005))
+
+    manager = Movie.objects.batch_size(3)
+    assert manager._batch_size == 3
+    assert Movie.objects._batch_size is None
+
+    movies = await manager.filter(year__gte=2001).sort("year", Order.ASCENDING)
+    assert [movie.year for movie in movies] == list(range(2001, 2005))
+
+    movies = await Movie.objects.batch_size(0).cache().all()
+    assert len(movies) == 5
+
+    years = [movie.year async for movie in Movie.objects.batch_size(1)]
+    assert sorted(years) == list(range(2000, 2005))
@@ -0,0 +1,81 @@
+from typing import AsyncGenerator, List, Union
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document
+from mongoz.core.db.querysets import bulk
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Event(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Event.objects.delete()
+    await Event.objects.create_many(
+        [Event(name=f"event-{index}", year=1990 + index) for index in range(25)]
+    )
+    yield
+    await Event.objects.delete()
+
+
+async def test_delete_in_batches() -> None:
+    deleted: List[Union[int, None]] = []
+
+    assert await Event.objects.delete(batch_size=10, progress=deleted.append) == 25
+
+    assert deleted == [10, 20, 25]
+    assert await Event.objects.count() == 0
+
+
+async def test_delete_in_batches_with_filter() -> None:
+    deleted: List[Union[int, None]] = []
+
+    async def progress(count: int) -> None:
+        deleted.append(count)
+
+    count = await Event.objects.filter(year__lt=2010).delete(
+        batch_size=5, pause_ms=1, progress=progress
+    )
+
+    assert count == 20
+    assert deleted == [5, 10, 15, 20]
+    assert await Event.objects.count() == 5
+    assert await Event.objects.filter(year__lt=2010).count() == 0
+
+
+async def test_delete_in_batches_waits_for_replication(monkeypatch: pytest.MonkeyPatch) -> None:
+    lags = [2.0, 0.5, 0.0, 0.0]
+
+    async def replication_lag(collection: object) -> float:
+        return lags.pop(0)
+
+    monkeypatch.setattr(bulk, "replication_lag", replication_lag)
+    monkeypatch.setattr(bulk, "REPLICATION_LAG_INTERVAL", 0)
+
+    assert await Event.objects.delete(batch_size=10, max_lag_ms=1000) == 25
+    # Two probes after the first batch and one after the second.
+    assert lags == [0.0]
+
+
+async def test_delete_in_batches_errors() -> None:
+    with pytest.raises(MongozException):
+        await Event.objects.delete(pause_ms=100)
+
+    with pytest.raises(MongozException):
+        await Event.objects.delete(batch_size=0)
+
+    assert await Event.objects.count() == 25
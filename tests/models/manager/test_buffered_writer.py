@@ -0,0 +1,143 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import BulkWriteError, Document, Index, Session
+from mongoz.core.db.querysets import bulk
+from mongoz.core.db.querysets import writer as writer_module
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Event(Document):
+    name: str = mongoz.String()
+    sequence: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        indexes = [Index("sequence", unique=True)]
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Event.drop_indexes(force=True)
+    await Event.objects.delete()
+    await Event.create_indexes()
+    yield
+    await Event.drop_indexes(force=True)
+    await Event.objects.delete()
+
+
+async def test_buffered_writer_coalesces_inserts(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches = []
+
+    async def insert_models(collection, document, models, **kwargs):  # type: ignore
+        batches.append(len(models))
+        return await bulk.insert_models(collection, document, models, **kwargs)
+
+    monkeypatch.setattr(writer_module, "insert_models", insert_models)
+    writer = Event.buffered_writer(max_batch=10, max_delay_ms=20)
+
+    events = [Event(name="click", sequence=index) for index in range(25)]
+    async with writer:
+        ids = await asyncio.gather(*[writer.insert(event) for event in events])
+
+    assert batches == [10, 10, 5]
+    assert ids == [event.id for event in events]
+    assert await Event.objects.count() == 25
+    assert await Event.objects.get(sequence=3) == events[3]
+
+
+async def test_buffered_writer_flushes_on_close() -> None:
+    writer = Event.buffered_writer(max_batch=100, max_delay_ms=10_000)
+
+    futures = [await writer.submit(Event(name="click", sequence=index)) for index in range(3)]
+    assert not any(future.done() for future in futures)
+
+    await writer.close()
+
+    assert [future.result() for future in futures] == [
+        event.id for event in await Event.objects.sort("sequence").all()
+    ]
+
+    with pytest.raises(MongozException):
+        await writer.submit(Event(name="click", sequence=4))
+
+
+async def test_buffered_writer_flush() -> None:
+    async with Event.buffered_writer(max_delay_ms=10_000) as writer:
+        future = await writer.submit(Event(name="click", sequence=1))
+        await writer.flush()
+
+        assert future.done()
+        assert await Event.objects.count() == 1
+
+
+async def test_buffered_writer_submit_inside_session() -> None:
+    writer = Event.buffered_writer(max_delay_ms=10_000)
+
+    async with Session() as session:
+        event = Event(name="click", sequence=1)
+        future = await writer.submit(event)
+        await writer.flush()
+
+        assert await future == event.id
+        assert event not in session
+
+    # The writer is still usable once the session is closed.
+    future = await writer.submit(Event(name="click", sequence=2))
+    await writer.close()
+
+    assert await future is not None
+    assert await Event.objects.count() == 2
+
+
+async def test_buffered_writer_backpressure() -> None:
+    async with Event.buffered_writer(max_batch=2, max_pending=2, max_delay_ms=10_000) as writer:
+        await writer.submit(Event(name="click", sequence=1))
+        await writer.submit(Event(name="click", sequence=2))
+
+        # The buffer is full until the batch is written.
+        blocked = asyncio.ensure_future(writer.submit(Event(name="click", sequence=3)))
+        await asyncio.sleep(0)
+        await writer.flush()
+        await blocked
+
+    assert await Event.objects.count() == 3
+
+
+async def test_buffered_writer_errors() -> None:
+    await Event.objects.create(name="click", sequence=1)
+
+    async with Event.buffered_writer() as writer:
+        failed = await writer.submit(Event(name="click", sequence=1))
+        inserted = await writer.submit(Event(name="click", sequence=2))
+
+        with pytest.raises(BulkWriteError):
+            await failed
+        assert await inserted is not None
+
+    assert await Event.objects.count() == 2
+
+
+async def test_buffered_writer_type() -> None:
+    class Other(Document):
+        name: str = mongoz.String()
+
+        class Meta:
+            registry = client
+            database = "test_db"
+
+    async with Event.buffered_writer() as writer:
+        with pytest.raises(TypeError):
+            await writer.submit(Other(name="click"))  # type: ignore
+
+    with pytest.raises(MongozException):
+        Event.buffered_writer(max_batch=0)
@@ -4,7 +4,8 @@ import pydantic
 import pytest
 
 import mongoz
-from mongoz import Document, Index, IndexType, ObjectId, Order
+from mongoz import Document, Index, IndexType, ObjectId, Order, UpdateResult
+from mongoz.exceptions import MongozException
 from tests.conftest import client
 
 pytestmark = pytest.mark.anyio
@@ -43,14 +44,16 @@ async def test_model_bulk_update_many() -> None:
     await Movie.objects.create(name="Boyhood", year=2004)
     await Movie.objects.create(name="Boyhood-2", year=2011)
 
-    movies = await Movie.objects.filter(year=2004).update_many(year=2010)
-    assert movies[0].year == 2010
+    result = await Movie.objects.filter(year=2004).update_many(year=2010)
+    assert isinstance(result, UpdateResult)
+    assert result.matched_count == 1
+    assert result.modified_count == 1
 
     movies = await Movie.objects.all()
     assert movies[0].year == 2010
 
     movies = await Movie.objects.filter(name="Boyhood-2").update_many(
-        year=2010
+        year=2010, returning="documents"
     )
     assert len(movies) == 1
     assert movies[0].year == 2010
@@ -59,7 +62,7 @@ async def test_model_bulk_update_many() -> None:
     assert len(movies) == 2
 
     movies = await Movie.objects.filter(name="Boyhood-2").update_many(
-        year=2014, name="Boyhood 2"
+        year=2014, name="Boyhood 2", returning="documents"
     )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
@@ -69,13 +72,37 @@ async def test_model_bulk_update_many() -> None:
             year="test"
         )
 
-    movies = await Movie.objects.filter(name="Boyhood 2").update_many(
+    result = await Movie.objects.filter(name="Boyhood 2").update_many(
         test=2021
     )
+    assert result.matched_count == 0
+
+    movies = await Movie.objects.filter(name="Boyhood 2").update_many(
+        test=2021, returning="documents"
+    )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
 
 
+async def test_model_update_many_returning() -> None:
+    boyhood = await Movie.objects.create(name="Boyhood", year=2004)
+    downfall = await Movie.objects.create(name="Downfall", year=2004)
+    await Movie.objects.create(name="Barbie", year=2023)
+
+    ids = await Movie.objects.filter(year=2004).update_many(year=2010, returning="ids")
+    assert sorted(ids) == sorted([boyhood.id, downfall.id])
+
+    # Only the updated documents are returned, not every match of the new values.
+    await Movie.objects.create(name="Oppenheimer", year=2023)
+    movies = await Movie.objects.filter(name="Barbie").update_many(
+        year=2023, returning="documents"
+    )
+    assert [movie.name for movie in movies] == ["Barbie"]
+
+    with pytest.raises(MongozException):
+        await Movie.objects.update_many(year=2010, returning="rows")
+
+
 async def test_model_bulk_update() -> None:
     await Movie.objects.create(name="Boyhood", year=2004)
     await Movie.objects.create(name="Boyhood-2", year=2011)
@@ -144,3 +171,35 @@ async def test_model_bulk_update_function() -> None:
     )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
+
+
+async def test_model_bulk_update_documents() -> None:
+    movies = await Movie.objects.create_many(
+        [Movie(name=f"Movie {index}", year=2000 + index) for index in range(5)]
+    )
+
+    for movie in movies:
+        movie.year += 10
+        movie.tags = ["changed"]
+
+    result = await Movie.objects.bulk_update(movies, fields=["year"], chunk_size=2)
+    assert result.matched_count == 5
+    assert result.modified_count == 5
+
+    movies = await Movie.objects.sort("year")
+    assert [movie.year for movie in movies] == [2010, 2011, 2012, 2013, 2014]
+    # Only the given fields are written.
+    assert all(movie.tags is None for movie in movies)
+
+
+async def test_model_bulk_update_documents_invalid() -> None:
+    movie = await Movie.objects.create(name="Downfall", year=2004)
+
+    with pytest.raises(ValueError):
+        await Movie.objects.bulk_update([movie], fields=["director"])
+
+    with pytest.raises(ValueError):
+        await Movie.objects.bulk_update([Movie(name="Boyhood", year=2010)], fields=["year"])
+
+    with pytest.raises(MongozException):
+        await Movie.objects.bulk_update([movie])
@@ -0,0 +1,150 @@
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import BulkWriteError, Delete, Document, Inc, Index, Insert, Update, Upsert
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+    watched: bool = mongoz.Boolean(default=False)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        indexes = [Index("name", unique=True)]
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    await Movie.create_indexes()
+    yield
+    await Movie.objects.delete()
+
+
+async def test_bulk_write() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+    await Movie.objects.create(name="Metropolis", year=1927)
+
+    boyhood = Movie(name="Boyhood", year=2014)
+    result = await Movie.objects.bulk_write(
+        [
+            Insert(boyhood),
+            Update({"name": "Downfall"}, year=2004, tags=["war"]),
+            Upsert(Movie.name == "Barbie", year=2023),
+            Delete(Movie.year < 2000),
+        ]
+    )
+
+    assert result.inserted_count == 1
+    assert result.matched_count == 1
+    assert result.modified_count == 1
+    assert result.upserted_count == 1
+    assert list(result.upserted_ids) == [2]
+    assert result.deleted_count == 1
+    assert result.errors == []
+
+    assert boyhood.id is not None
+    movies = await Movie.objects.sort("name")
+    assert [(movie.name, movie.year) for movie in movies] == [
+        ("Barbie", 2023),
+        ("Boyhood", 2014),
+        ("Downfall", 2004),
+    ]
+    assert movies[2].tags == ["war"]
+
+
+async def test_bulk_write_chunks() -> None:
+    movies = [Movie(name=f"Movie {index}", year=2000) for index in range(25)]
+
+    result = await Movie.objects.bulk_write(
+        [Insert(movie) for movie in movies]
+        + [Update([Movie.year == 2000], many=True, year=2001)],
+        chunk_size=10,
+    )
+
+    assert result.inserted_count == 25
+    assert result.modified_count == 25
+    assert all(movie.id is not None for movie in movies)
+    assert await Movie.objects.filter(year=2001).count() == 25
+
+
+async def test_bulk_write_validates_values() -> None:
+    with pytest.raises(ValueError):
+        await Movie.objects.bulk_write([Update({"name": "Downfall"}, year="not a year")])
+
+    with pytest.raises(ValueError):
+        await Movie.objects.bulk_write([Update({"name": "Downfall"}, director="Hirschbiegel")])
+
+    with pytest.raises(TypeError):
+        await Movie.objects.bulk_write([Insert("Downfall")])
+
+
+async def test_bulk_write_ordered_errors() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    with pytest.raises(BulkWriteError) as raised:
+        await Movie.objects.bulk_write(
+            [
+                Insert(Movie(name="Boyhood", year=2014)),
+                Insert(Movie(name="Downfall", year=2004)),
+                Insert(Movie(name="Barbie", year=2023)),
+            ]
+        )
+
+    result = raised.value.result
+    assert result.inserted_count == 1
+    assert [error["index"] for error in result.errors] == [1]
+    assert await Movie.objects.count() == 2
+
+
+async def test_bulk_write_unordered_errors() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+    barbie = Movie(name="Barbie", year=2023)
+
+    with pytest.raises(BulkWriteError) as raised:
+        await Movie.objects.bulk_write(
+            [
+                Insert(Movie(name="Boyhood", year=2014)),
+                Insert(Movie(name="Downfall", year=2004)),
+                Insert(barbie),
+            ],
+            ordered=False,
+            chunk_size=2,
+        )
+
+    result = raised.value.result
+    assert result.inserted_count == 2
+    assert [error["index"] for error in result.errors] == [1]
+    assert barbie.id is not None
+    assert await Movie.objects.count() == 3
+
+
+async def test_bulk_write_upsert_inserts_whole_document() -> None:
+    await Movie.objects.bulk_write([Upsert({"name": "Barbie"}, year=2023)])
+    await Movie.objects.update_or_create(name="Oppenheimer", defaults={"year": 2023})
+
+    rows = await Movie.meta.collection._collection.find({}, {"_id": 0}).sort("name").to_list(None)
+    assert rows == [
+        {"name": "Barbie", "year": 2023, "tags": None, "watched": False},
+        {"name": "Oppenheimer", "year": 2023, "tags": None, "watched": False},
+    ]
+
+
+async def test_bulk_write_upsert_invalid_document() -> None:
+    # Without a year, only an existing document can be updated.
+    result = await Movie.objects.bulk_write([Upsert({"name": "Boyhood"}, year=Inc(1))])
+    assert result.upserted_count == 0
+    assert await Movie.objects.count() == 0
+
+    with pytest.raises(pydantic.ValidationError):
+        await Movie.objects.bulk_write([Upsert({"name": "Boyhood"})])
@@ -0,0 +1,173 @@
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, QueryCache, query_cache
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Country(Document):
+    name: str = mongoz.String()
+    code: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    query_cache.clear()
+    await Country.objects.delete()
+    yield
+    await Country.objects.delete()
+    query_cache.clear()
+
+
+async def test_cache_hit_and_miss() -> None:
+    await Country.objects.create(name="Portugal", code="PT")
+
+    countries = await Country.objects.cache(ttl=60).filter(code="PT")
+    assert len(countries) == 1
+    assert query_cache.info()["misses"] == 1
+
+    countries = await Country.objects.cache(ttl=60).filter(code="PT")
+    assert len(countries) == 1
+    assert countries[0].name == "Portugal"
+    assert query_cache.info()["hits"] == 1
+
+
+async def test_cache_returns_new_instances() -> None:
+    await Country.objects.create(name="Portugal", code="PT")
+
+    first = await Country.objects.cache().get(code="PT")
+    first.name = "Changed"
+
+    second = await Country.objects.cache().get(code="PT")
+    assert second.name == "Portugal"
+    assert first is not second
+
+
+async def test_not_cached_without_cache() -> None:
+    await Country.objects.create(name="Portugal", code="PT")
+
+    await Country.objects.filter(code="PT")
+    await Country.objects.filter(code="PT")
+
+    assert len(query_cache) == 0
+
+
+async def test_cache_invalidated_on_save_and_delete() -> None:
+    country = await Country.objects.create(name="Portugal", code="PT")
+    await Country.objects.cache().filter(code="PT")
+    assert len(query_cache) == 1
+
+    country.name = "Portugal (PT)"
+    await country.save()
+    assert len(query_cache) == 0
+
+    countries = await Country.objects.cache().filter(code="PT")
+    assert countries[0].name == "Portugal (PT)"
+
+    await country.delete()
+    countries = await Country.objects.cache().filter(code="PT")
+    assert countries == []
+
+
+async def test_cache_invalidated_on_create() -> None:
+    await Country.objects.cache().all()
+
+    await Country.objects.create(name="Portugal", code="PT")
+    countries = await Country.objects.cache().all()
+    assert len(countries) == 1
+
+
+async def test_cache_invalidated_on_update_many_and_delete() -> None:
+    await Country.objects.create(name="Portugal", code="PT")
+    await Country.objects.cache().filter(code="PT")
+
+    await Country.objects.filter(code="PT").update_many(name="Portugal (PT)")
+    countries = await Country.objects.cache().filter(code="PT")
+    assert countries[0].name == "Portugal (PT)"
+
+    await Country.objects.filter(code="PT").delete()
+    countries = await Country.objects.cache().filter(code="PT")
+    assert countries == []
+
+
+def test_lru_eviction() -> None:
+    cache = QueryCache(maxsize=2)
+
+    cache.set("first", "countries", [1])
+    cache.set("second", "countries", [2])
+    assert cache.get("first") == [1]
+
+    cache.set("third", "countries", [3])
+    assert cache.get("second") is None
+    assert cache.get("first") == [1]
+    assert cache.get("third") == [3]
+    assert cache.info() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
+
+
+def test_ttl_expiration() -> None:
+    cache = QueryCache()
+
+    cache.set("first", "countries", [1], ttl=0)
+    assert cache.get("first") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_collection() -> None:
+    cache = QueryCache()
+
+    cache.set("first", "countries", [1])
+    cache.set("second", "plans", [2])
+    cache.invalidate("countries")
+
+    assert cache.get("first") is None
+    assert cache.get("second") == [2]
+
+
+def test_stale_generation_is_not_stored() -> None:
+    cache = QueryCache()
+
+    generation = cache.generation("countries")
+    cache.invalidate("countries")
+    cache.set("first", "countries", [1], generation=generation)
+
+    assert cache.get("first") is None
+
+
+def test_stale_generation_after_invalidating_everything() -> None:
+    cache = QueryCache()
+
+    generation = cache.generation("countries")
+    cache.invalidate()
+    cache.set("first", "countries", [1], generation=generation)
+
+    assert cache.get("first") is None
+
+
+async def test_cache_watches_the_document_once_enabled() -> None:
+    class Plan(Document):
+        name: str = mongoz.String()
+
+        class Meta:
+            registry = client
+            database = "test_db"
+
+    plan = await Plan.objects.create(name="Free")
+    Plan.objects.cache()
+
+    # A query read before the write must not store its rows.
+    generation = query_cache.generation(Plan.meta.collection.name)
+    plan.name = "Pro"
+    await plan.save()
+
+    assert query_cache.generation(Plan.meta.collection.name) > generation
+    await Plan.objects.delete()
@@ -7,7 +7,9 @@ import pydantic
 import pytest
 
 import mongoz
-from mongoz import Document, Index, IndexType, ObjectId, Order
+from mongoz import BulkWriteError, BulkWriteResult, Document, Index, IndexType, ObjectId, Order
+from mongoz.core.db.querysets.bulk import chunk_models
+from mongoz.core.signals import pre_bulk_create
 from tests.conftest import client
 
 pytestmark = pytest.mark.anyio
@@ -144,3 +146,111 @@ async def test_model_bulk_create() -> None:
         book = Book(name="The Book", year=1972)
         movie = Movie(name="Inception", year=2010)
         await Movie.objects.bulk_create([book, movie])  # type: ignore
+
+
+async def test_model_create_many_iterable() -> None:
+    movies = (Movie(name=f"Movie {index}", year=2000 + index) for index in range(25))
+
+    result = await Movie.objects.create_many(
+        movies, chunk_size=10, ordered=False, concurrency=2
+    )
+
+    assert isinstance(result, BulkWriteResult)
+    assert result.inserted_count == 25
+    assert sorted(result.inserted_ids) == list(range(25))
+    assert await Movie.objects.count() == 25
+
+
+async def test_model_create_many_async_iterable() -> None:
+    async def read_movies() -> AsyncGenerator[Movie, None]:
+        for index in range(5):
+            yield Movie(name=f"Movie {index}", year=2000 + index)
+
+    result = await Movie.objects.create_many(read_movies(), chunk_size=2)
+
+    movie = await Movie.objects.get(name="Movie 4")
+    assert result.inserted_ids[4] == movie.id
+
+
+async def test_model_create_many_partial_failure() -> None:
+    movies = [
+        Movie(name="Downfall", year=2004),
+        Movie(name="Downfall", year=2005),
+        Movie(name="Boyhood", year=2014),
+        Movie(name="Boyhood", year=2015),
+        Movie(name="Barbie", year=2023),
+    ]
+
+    with pytest.raises(BulkWriteError) as raised:
+        await Movie.objects.create_many(movies, chunk_size=2, ordered=False, concurrency=3)
+
+    result = raised.value.result
+    assert [error["index"] for error in result.errors] == [1, 3]
+    assert sorted(result.inserted_ids) == [0, 2, 4]
+    assert movies[1].id is None
+    assert movies[4].id == result.inserted_ids[4]
+    assert await Movie.objects.count() == 3
+
+
+async def test_model_create_many_ordered_stops_at_error() -> None:
+    movies = [Movie(name="Downfall", year=2004) for _ in range(2)]
+    movies.extend(Movie(name=f"Movie {index}", year=2000) for index in range(3))
+
+    with pytest.raises(BulkWriteError) as raised:
+        await Movie.objects.create_many(movies, chunk_size=2)
+
+    assert [error["index"] for error in raised.value.result.errors] == [1]
+    assert await Movie.objects.count() == 1
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_model_create_many_stops_at_exception(
+    monkeypatch: pytest.MonkeyPatch, ordered: bool
+) -> None:
+    collection = Movie.objects._collection
+    insert_many = collection.insert_many
+    calls: List[int] = []
+
+    async def fail_once(documents, **kwargs):  # type: ignore
+        calls.append(len(documents))
+        if len(calls) == 1:
+            raise ConnectionError("connection lost")
+        return await insert_many(documents, **kwargs)
+
+    monkeypatch.setattr(collection, "insert_many", fail_once)
+    movies = [Movie(name=f"Movie {index}", year=2000) for index in range(6)]
+
+    with pytest.raises(ConnectionError):
+        await Movie.objects.create_many(movies, chunk_size=2, ordered=ordered)
+
+    assert calls == [2]
+    assert await Movie.objects.count() == 0
+
+
+async def test_model_create_many_stops_at_receiver_exception() -> None:
+    chunks: List[int] = []
+
+    @pre_bulk_create(Movie)
+    async def fail(sender, instances, **kwargs):
+        chunks.append(len(instances))
+        raise ValueError("receiver failed")
+
+    movies = [Movie(name=f"Movie {index}", year=2000) for index in range(6)]
+    try:
+        with pytest.raises(ValueError):
+            await Movie.objects.create_many(movies, chunk_size=2, ordered=False, concurrency=1)
+    finally:
+        Movie.meta.signals.pre_bulk_create.disconnect(fail)
+
+    assert chunks == [2]
+    assert await Movie.objects.count() == 0
+
+
+async def test_chunk_models_split_by_count() -> None:
+    movies = [Movie(name="x" * 100, year=2000) for _ in range(10)]
+
+    chunks = [chunk async for chunk, _ in chunk_models(Movie, movies, chunk_size=4)]
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+    chunks = [chunk async for chunk, _ in chunk_models(Movie, movies, chunk_size=5)]
+    assert [len(chunk) for chunk in chunks] == [5, 5]
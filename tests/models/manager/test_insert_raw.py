@@ -0,0 +1,104 @@
+from typing import Any, AsyncGenerator, Dict, Iterator, List
+
+import bson
+import pydantic
+import pytest
+from bson.raw_bson import RawBSONDocument
+
+import mongoz
+from mongoz import BulkWriteError, BulkWriteResult, Document, Index
+from mongoz.core.db.querysets.bulk import chunk_documents
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        indexes = [Index("name", unique=True)]
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.drop_indexes(force=True)
+    await Movie.objects.delete()
+    await Movie.create_indexes()
+    yield
+    await Movie.drop_indexes(force=True)
+    await Movie.objects.delete()
+
+
+def read_rows(count: int) -> Iterator[Dict[str, Any]]:
+    for index in range(count):
+        yield {"name": f"Movie {index}", "year": 2000 + index}
+
+
+async def test_insert_raw() -> None:
+    result = await Movie.objects.insert_raw(read_rows(5), chunk_size=2)
+
+    assert isinstance(result, BulkWriteResult)
+    assert result.inserted_count == 5
+    assert sorted(result.inserted_ids) == [0, 1, 2, 3, 4]
+
+    movies = await Movie.objects.sort("year").all()
+    assert [movie.name for movie in movies] == [f"Movie {index}" for index in range(5)]
+    assert [movie.id for movie in movies] == [result.inserted_ids[index] for index in range(5)]
+
+
+async def test_insert_raw_async_iterable() -> None:
+    async def rows() -> AsyncGenerator[Dict[str, Any], None]:
+        for row in read_rows(3):
+            yield row
+
+    result = await Movie.objects.insert_raw(rows(), ordered=False, concurrency=2)
+
+    assert result.inserted_count == 3
+    assert await Movie.objects.count() == 3
+
+
+async def test_insert_raw_bson_documents() -> None:
+    rows = [
+        RawBSONDocument(bson.encode({"_id": bson.ObjectId(), **row})) for row in read_rows(2)
+    ]
+
+    result = await Movie.objects.insert_raw(rows)
+
+    assert result.inserted_ids == {0: rows[0]["_id"], 1: rows[1]["_id"]}
+    assert (await Movie.objects.get(id=rows[1]["_id"])).year == 2001
+
+
+async def test_insert_raw_check_fields() -> None:
+    rows = [{"name": "Downfall", "year": 2004}, {"name": "Barbie", "released": 2023}]
+
+    with pytest.raises(ValueError):
+        await Movie.objects.insert_raw(rows, check_fields=True)
+
+    # Without the check, the documents are written as they are.
+    await Movie.objects.insert_raw(rows)
+    assert await Movie.objects._collection.count_documents({"released": 2023}) == 1
+
+
+async def test_insert_raw_errors() -> None:
+    rows = [{"name": "Downfall"}, {"name": "Downfall"}, {"name": "Barbie"}]
+
+    with pytest.raises(BulkWriteError) as raised:
+        await Movie.objects.insert_raw(rows, ordered=False)
+
+    result = raised.value.result
+    assert [error["index"] for error in result.errors] == [1]
+    assert sorted(result.inserted_ids) == [0, 2]
+
+
+async def test_chunk_documents() -> None:
+    chunks: List[List[Any]] = [
+        chunk async for chunk, _ in chunk_documents(Movie, read_rows(5), chunk_size=2)
+    ]
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all("_id" in row for chunk in chunks for row in chunk)
@@ -0,0 +1,88 @@
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    await Movie.objects.create_many(
+        [Movie(name=f"Movie {index}", year=2000 + index % 10) for index in range(250)]
+    )
+    yield
+    await Movie.objects.delete()
+
+
+async def test_parallel_iter() -> None:
+    movies = [movie async for movie in Movie.objects.parallel_iter(partitions=4)]
+
+    assert len(movies) == 250
+    assert len({movie.id for movie in movies}) == 250
+    assert all(isinstance(movie, Movie) for movie in movies)
+
+
+async def test_parallel_iter_with_filter() -> None:
+    manager = Movie.objects.filter(year__gte=2005).only("year")
+    movies = [movie async for movie in manager.parallel_iter(partitions=3)]
+
+    assert len(movies) == 125
+    assert all(movie.year >= 2005 for movie in movies)
+
+
+async def test_parallel_iter_batches() -> None:
+    batches = [
+        batch
+        async for batch in Movie.objects.batch_size(50).parallel_iter(partitions=2, batches=True)
+    ]
+
+    assert all(0 < len(batch) <= 50 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 250
+
+
+async def test_partition_boundaries() -> None:
+    boundaries = await Movie.objects._partition_boundaries(4)
+
+    assert 0 < len(boundaries) <= 3
+    assert boundaries == sorted(boundaries)
+    assert await Movie.objects._partition_boundaries(1) == []
+
+    # The filter is applied inside the ranges, not to the sample.
+    assert len(await Movie.objects.filter(year=1990)._partition_boundaries(4)) > 0
+
+    await Movie.objects.delete()
+    assert await Movie.objects._partition_boundaries(4) == []
+
+
+async def test_parallel_iter_empty() -> None:
+    movies = [movie async for movie in Movie.objects.filter(year=1990).parallel_iter()]
+    assert movies == []
+
+
+async def test_parallel_iter_stop_early() -> None:
+    async for movie in Movie.objects.parallel_iter(partitions=4):
+        assert movie.id is not None
+        break
+
+
+async def test_parallel_iter_limit() -> None:
+    with pytest.raises(MongozException):
+        async for _ in Movie.objects.limit(10).parallel_iter():
+            ...
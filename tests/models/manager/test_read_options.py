@@ -0,0 +1,109 @@
+import asyncio
+import gc
+import weakref
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+
+import mongoz
+from mongoz import Document, Registry
+from mongoz.core.connection.collections import with_options
+from mongoz.exceptions import MongozException
+from tests.conftest import client, database_uri
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        read_preference = "secondaryPreferred"
+        read_concern = "local"
+
+
+class Actor(Document):
+    name: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    yield
+    await Movie.objects.delete()
+
+
+async def test_meta_read_options() -> None:
+    assert Movie.meta.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert Movie.meta.read_concern == ReadConcern("local")
+
+    collection = Movie.objects._collection
+    assert collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert collection.read_concern == ReadConcern("local")
+    assert Actor.objects._collection is Actor.meta.collection._collection
+
+
+async def test_read_options_per_query() -> None:
+    manager = Actor.objects.read_preference("nearest").read_concern("local")
+
+    assert manager._collection.read_preference == ReadPreference.NEAREST
+    assert manager._collection.read_concern == ReadConcern("local")
+    assert Actor.objects._collection.read_preference == ReadPreference.PRIMARY
+
+    manager = Movie.objects.read_preference(ReadPreference.NEAREST)
+    assert manager._collection.read_preference == ReadPreference.NEAREST
+    assert manager._collection.read_concern == ReadConcern("local")
+
+
+async def test_handles_are_cached() -> None:
+    first = Actor.objects.read_preference("secondary_preferred")
+    second = Actor.objects.read_preference("secondaryPreferred")
+
+    assert first._collection is second._collection
+    assert Movie.objects._collection is Movie.objects._collection
+    assert Movie.objects.using("test_db")._collection is Movie.objects._collection
+
+
+async def test_handles_are_released_with_the_client() -> None:
+    registry = Registry(database_uri, event_loop=asyncio.get_running_loop)
+    handle = with_options(registry._client["test_db"]["actors"], read_concern=ReadConcern("local"))
+
+    assert (
+        with_options(registry._client["test_db"]["actors"], read_concern=ReadConcern("local"))
+        is handle
+    )
+    assert (
+        with_options(client._client["test_db"]["actors"], read_concern=ReadConcern("local"))
+        is not handle
+    )
+
+    released = weakref.ref(handle)
+    del registry, handle
+    gc.collect()
+    assert released() is None
+
+
+async def test_invalid_read_preference() -> None:
+    with pytest.raises(MongozException):
+        Actor.objects.read_preference("fastest")
+
+
+async def test_queries_with_read_options() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    movies = await Movie.objects.read_preference("nearest").filter(name="Downfall")
+    assert len(movies) == 1
+
+    movies = await Movie.query(Movie.year == 2004).read_concern("local").all()
+    assert len(movies) == 1
@@ -0,0 +1,204 @@
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Session, get_session
+from mongoz.exceptions import StaleDocumentError
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+class Account(Document):
+    name: str = mongoz.String()
+    balance: int = mongoz.Integer(default=0)
+    version: int = mongoz.Integer(default=0)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        version_field = "version"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    await Account.objects.delete()
+    yield
+    await Movie.objects.delete()
+    await Account.objects.delete()
+
+
+async def test_same_instance_inside_session() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    async with Session() as session:
+        assert get_session() is session
+
+        movie = await Movie.objects.get(name="Downfall")
+        same = await Movie.query(Movie.year == 2004).get()
+        movies = await Movie.objects.all()
+
+        assert movie is same
+        assert movies[0] is movie
+        assert movie in session
+
+    assert get_session() is None
+
+
+async def test_different_instances_outside_session() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    movie = await Movie.objects.get(name="Downfall")
+    same = await Movie.objects.get(name="Downfall")
+
+    assert movie is not same
+
+
+async def test_get_document_by_id_uses_identity_map() -> None:
+    created = await Movie.objects.create(name="Downfall", year=2004)
+
+    async with Session():
+        movie = await Movie.objects.get(name="Downfall")
+
+        await Movie.objects.filter(name="Downfall").delete()
+        # Deleting expires the identity map, the document is gone.
+        with pytest.raises(mongoz.DocumentNotFound):
+            await Movie.get_document_by_id(created.id)
+
+    async with Session():
+        movie = await Movie.objects.create(name="Boyhood", year=2010)
+        assert await Movie.get_document_by_id(str(movie.id)) is movie
+
+
+async def test_dirty_documents_flushed_on_exit() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+    await Movie.objects.create(name="Boyhood", year=2010)
+
+    async with Session() as session:
+        downfall = await Movie.objects.get(name="Downfall")
+        await Movie.objects.get(name="Boyhood")
+
+        downfall.year = 2004
+        downfall.tags = ["war"]
+
+        assert session.dirty == [downfall]
+        assert session.changes() == {
+            (downfall.meta.collection._collection.full_name, downfall.id): {
+                "year": 2004,
+                "tags": ["war"],
+            }
+        }
+
+    movie = await Movie.objects.get(name="Downfall")
+    assert movie.year == 2004
+    assert movie.tags == ["war"]
+
+
+async def test_not_flushed_on_error() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+
+    with pytest.raises(ValueError):
+        async with Session():
+            movie = await Movie.objects.get(name="Downfall")
+            movie.year = 2004
+            raise ValueError()
+
+    movie = await Movie.objects.get(name="Downfall")
+    assert movie.year == 2003
+
+
+async def test_saved_documents_are_not_dirty() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+
+    async with Session() as session:
+        movie = await Movie.objects.get(name="Downfall")
+        movie.year = 2004
+        await movie.save()
+
+        assert session.dirty == []
+        assert await session.flush() == 0
+
+
+async def test_update_many_expires_documents() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+
+    async with Session():
+        movie = await Movie.objects.get(name="Downfall")
+        await Movie.objects.filter(name="Downfall").update_many(year=2004)
+
+        updated = await Movie.objects.get(name="Downfall")
+        assert updated is not movie
+        assert updated.year == 2004
+
+
+async def test_bulk_update_refreshes_snapshots() -> None:
+    await Movie.objects.create(name="Downfall", year=2003)
+
+    async with Session() as session:
+        movie = await Movie.objects.get(name="Downfall")
+        movie.year = 2004
+        movie.tags = ["war"]
+
+        await Movie.objects.bulk_update([movie], fields=["year"])
+
+        assert session.changes() == {
+            (movie.meta.collection._collection.full_name, movie.id): {"tags": ["war"]}
+        }
+
+
+async def test_flush_increments_version() -> None:
+    await Account.objects.create(name="Mongoz")
+
+    async with Session() as session:
+        account = await Account.objects.get()
+        account.balance = 10
+
+        assert await session.flush() == 1
+        assert account.version == 1
+        assert session.dirty == []
+
+    account = await Account.objects.get()
+    assert account.balance == 10
+    assert account.version == 1
+
+
+async def test_concurrent_save_inside_session_raises_stale_document() -> None:
+    await Account.objects.create(name="Mongoz")
+    await Account.objects.create(name="Edgy")
+
+    with pytest.raises(StaleDocumentError):
+        async with Session():
+            mongoz_account = await Account.objects.get(name="Mongoz")
+            edgy = await Account.objects.get(name="Edgy")
+
+            # Saved by another process since it was loaded, with the same
+            # change.
+            await Account.meta.collection._collection.update_one(
+                {"name": "Mongoz"}, {"$set": {"balance": 10}, "$inc": {"version": 1}}
+            )
+
+            mongoz_account.balance = 10
+            edgy.balance = 20
+
+    # The other documents are still written.
+    assert mongoz_account.version == 0
+    assert edgy.version == 1
+    accounts = {account.name: account for account in await Account.objects.all()}
+    assert accounts["Mongoz"].balance == 10
+    assert accounts["Mongoz"].version == 1
+    assert accounts["Edgy"].balance == 20
+    assert accounts["Edgy"].version == 1
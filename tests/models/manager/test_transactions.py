@@ -0,0 +1,140 @@
+from typing import AsyncGenerator, List
+
+import pydantic
+import pytest
+from pymongo.errors import OperationFailure
+
+import mongoz
+from mongoz import Document, Inc, get_transaction
+from mongoz.core.connection.transactions import get_client_session
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Account(Document):
+    name: str = mongoz.String()
+    balance: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+async def is_replica_set() -> bool:
+    try:
+        hello = await client._client.admin.command("hello")
+    except Exception:
+        return False
+    return "setName" in hello
+
+
+@pytest.fixture()
+async def replica_set() -> None:
+    # Transactions need a replica set, e.g. a local single node one started
+    # with `mongod --replSet rs0`.
+    if not await is_replica_set():
+        pytest.skip("Transactions require a replica set.")
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Account.objects.delete()
+    yield
+    await Account.objects.delete()
+
+
+async def test_transaction_binds_the_session() -> None:
+    assert get_transaction() is None
+
+    async with client.transaction() as transaction:
+        assert get_transaction() is transaction
+        assert get_client_session() is transaction.session
+
+        with pytest.raises(MongozException):
+            async with client.transaction():
+                ...
+
+        with pytest.raises(MongozException):
+            async for _ in Account.objects.parallel_iter(partitions=2):
+                ...
+
+    assert get_transaction() is None
+    assert get_client_session() is None
+
+
+async def test_with_transaction_retries_transient_errors() -> None:
+    calls: List[int] = []
+
+    async def transfer() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise OperationFailure(
+                "Write conflict", code=112, details={"errorLabels": ["TransientTransactionError"]}
+            )
+        return "done"
+
+    assert await client.with_transaction(transfer) == "done"
+    assert len(calls) == 3
+
+
+async def test_with_transaction_does_not_retry_other_errors() -> None:
+    calls: List[int] = []
+
+    async def transfer() -> None:
+        calls.append(1)
+        raise OperationFailure("Unauthorized", code=13)
+
+    with pytest.raises(OperationFailure):
+        await client.with_transaction(transfer)
+    assert len(calls) == 1
+
+
+async def test_transaction_commits(replica_set: None) -> None:
+    alice = await Account(name="Alice", balance=100).create()
+    bob = await Account(name="Bob", balance=0).create()
+
+    async with client.transaction():
+        await Account.objects.filter(name="Alice").update_many(balance=Inc(-10))
+        await Account.objects.filter(name="Bob").update_many(balance=Inc(10))
+
+        # The reads of the transaction see its writes.
+        assert (await Account.objects.get(name="Bob")).balance == 10
+
+    assert (await Account.objects.get(id=alice.id)).balance == 90
+    assert (await Account.objects.get(id=bob.id)).balance == 10
+
+
+async def test_transaction_aborts_on_error(replica_set: None) -> None:
+    alice = await Account(name="Alice", balance=100).create()
+
+    with pytest.raises(ValueError):
+        async with client.transaction():
+            alice.balance = 0
+            await alice.save()
+            await Account(name="Bob", balance=100).create()
+            await Account.objects.filter(name="Alice").delete()
+            raise ValueError("Insufficient funds")
+
+    accounts = await Account.objects.all()
+    assert [(account.name, account.balance) for account in accounts] == [("Alice", 100)]
+
+
+async def test_transaction_abort(replica_set: None) -> None:
+    async with client.transaction() as transaction:
+        await Account.objects.create_many([Account(name="Alice", balance=100)])
+        await transaction.abort()
+
+    assert await Account.objects.count() == 0
+
+
+async def test_with_transaction(replica_set: None) -> None:
+    async def open_accounts() -> int:
+        await Account(name="Alice", balance=100).create()
+        await Account(name="Bob", balance=100).create()
+        return await Account.objects.count()
+
+    assert await client.with_transaction(open_accounts, write_concern="majority") == 2
+    assert await Account.objects.count() == 2
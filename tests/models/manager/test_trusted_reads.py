@@ -0,0 +1,168 @@
+import datetime
+import decimal
+from enum import Enum
+from typing import AsyncGenerator, List
+
+import bson
+import pydantic
+import pytest
+from bson.decimal128 import Decimal128
+
+import mongoz
+from mongoz import Document, EmbeddedDocument, Session
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Format(str, Enum):
+    FILM = "film"
+    SERIES = "series"
+
+
+class Award(EmbeddedDocument):
+    name: str = mongoz.String()
+    value: decimal.Decimal = mongoz.Decimal(max_digits=5, decimal_places=2, null=True)
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    rating: decimal.Decimal = mongoz.Decimal(max_digits=5, decimal_places=2, null=True)
+    tags: List[str] = mongoz.Array(str, null=True)
+    award: Award = mongoz.Embed(Award, null=True)
+    awards: List[Award] = mongoz.Array(Award, null=True)
+    director: bson.ObjectId = mongoz.ObjectId(null=True)
+    genre: str = mongoz.String(choices=(("drama", "Drama"), ("comedy", "Comedy")), null=True)
+    released: datetime.date = mongoz.Date(null=True)
+    formats: List[Format] = mongoz.Array(Format, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+class Book(Document):
+    name: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        trusted_reads = True
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    await Book.objects.delete()
+    yield
+    await Movie.objects.delete()
+    await Book.objects.delete()
+
+
+async def create_movie() -> Movie:
+    return await Movie.objects.create(
+        name="Downfall",
+        year=2004,
+        rating=decimal.Decimal("8.2"),
+        tags=["war", "history"],
+        award=Award(name="Bafta", value=decimal.Decimal("1.5")),
+        awards=[Award(name="Oscar")],
+        director=bson.ObjectId(),
+        genre="drama",
+        formats=[Format.FILM],
+    )
+
+
+async def test_trusted_reads_match_validated_reads() -> None:
+    await create_movie()
+
+    validated = await Movie.objects.get()
+    trusted = (await Movie.objects.trusted_reads().all())[0]
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert isinstance(trusted.award, Award)
+    assert isinstance(trusted.awards[0], Award)
+    assert isinstance(trusted.rating, Decimal128)
+    assert trusted.formats == [Format.FILM]
+    assert isinstance(trusted.formats[0], Format)
+    assert trusted.get_genre_display() == "Drama"
+    assert trusted.get_changes() == {}
+
+
+async def test_trusted_reads_coerce_stored_values() -> None:
+    director = bson.ObjectId()
+    await Movie.meta.collection._collection.insert_one(
+        {
+            "name": "Barbie",
+            "year": 2023,
+            "rating": 7,
+            "director": str(director),
+            "released": datetime.datetime(2023, 7, 21),
+            "formats": ["film"],
+        }
+    )
+
+    movie = await Movie.objects.trusted_reads().get()
+
+    assert movie.director == director
+    assert movie.rating == decimal.Decimal("7")
+    assert movie.released == datetime.date(2023, 7, 21)
+    assert movie.formats == [Format.FILM]
+    assert isinstance(movie.formats[0], Format)
+    assert movie.award is None
+    assert movie.tags is None
+
+
+async def test_trusted_reads_save_only_the_changes() -> None:
+    await create_movie()
+    movie = (await Movie.objects.trusted_reads().all())[0]
+
+    movie.tags.append("drama")
+    movie.year = 2005
+    assert movie.get_changes() == {"tags": ["war", "history", "drama"], "year": 2005}
+
+    await movie.save()
+    movie = await Movie.objects.get()
+    assert movie.year == 2005
+    assert movie.tags == ["war", "history", "drama"]
+
+
+async def test_trusted_reads_meta() -> None:
+    await Book.meta.collection._collection.insert_one({"name": 1})
+
+    books = await Book.objects.all()
+    assert [book.name for book in books] == [1]
+
+    with pytest.raises(pydantic.ValidationError):
+        await Book.objects.trusted_reads(False).all()
+
+
+async def test_trusted_reads_query() -> None:
+    await create_movie()
+
+    movies = await Movie.query().trusted_reads().all()
+
+    assert [movie.name for movie in movies] == ["Downfall"]
+    assert isinstance(movies[0].award, Award)
+
+
+async def test_trusted_reads_iteration() -> None:
+    await create_movie()
+
+    movies = [movie async for movie in Movie.objects.trusted_reads()]
+    assert isinstance(movies[0].rating, Decimal128)
+    assert movies[0].get_changes() == {}
+
+    movies = [movie async for movie in Movie.query().trusted_reads()]
+    assert isinstance(movies[0].rating, Decimal128)
+
+
+async def test_iteration_uses_session() -> None:
+    await create_movie()
+
+    async with Session():
+        movie = await Movie.objects.get()
+        assert [item async for item in Movie.objects][0] is movie
+        assert [item async for item in Movie.query()][0] is movie
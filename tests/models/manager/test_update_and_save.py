@@ -5,6 +5,7 @@ import pytest
 
 import mongoz
 from mongoz import Document, Index, IndexType, ObjectId, Order
+from mongoz.core.db.querysets.bulk import get_partial_model
 from tests.conftest import client
 
 pytestmark = pytest.mark.anyio
@@ -54,3 +55,107 @@ async def test_model_update_save() -> None:
 
     movie = await Movie.objects.get()
     assert movie.year == 2004
+
+
+async def test_model_get_changes() -> None:
+    await Movie(name="Downfall", year=2002).create()
+
+    movie = await Movie.objects.get()
+    assert movie.get_changes() == {}
+
+    movie.year = 2004
+    movie.tags = ["war"]
+    assert movie.get_changes() == {"year": 2004, "tags": ["war"]}
+
+    movie.tags.append("history")
+    assert movie.get_changes() == {"year": 2004, "tags": ["war", "history"]}
+
+    await movie.save()
+    assert movie.get_changes() == {}
+
+
+async def test_model_read_snapshot_does_not_dump(monkeypatch: pytest.MonkeyPatch) -> None:
+    await Movie(name="Downfall", year=2002, tags=["war"]).create()
+
+    def take_snapshot(self, fields=None):  # type: ignore
+        raise AssertionError("The rows read are not dumped again.")
+
+    monkeypatch.setattr(Movie, "take_snapshot", take_snapshot)
+    movie = await Movie.objects.get()
+    monkeypatch.undo()
+
+    assert movie.get_changes() == {}
+    movie.tags.append("history")
+    assert movie.get_changes() == {"tags": ["war", "history"]}
+
+
+async def test_model_save_only_changed_fields() -> None:
+    await Movie(name="Downfall", year=2002).create()
+
+    movie = await Movie.objects.get()
+    # Changed by someone else after the document was loaded.
+    await Movie.objects.filter(name="Downfall").update_many(tags=["war"])
+
+    movie.year = 2004
+    await movie.save()
+
+    movie = await Movie.objects.get()
+    assert movie.year == 2004
+    assert movie.tags == ["war"]
+
+
+async def test_model_save_without_changes() -> None:
+    await Movie(name="Downfall", year=2002).create()
+
+    movie = await Movie.objects.get()
+    await Movie.objects.filter(name="Downfall").update_many(year=2004)
+
+    # Nothing changed, nothing is written.
+    await movie.save()
+
+    movie = await Movie.objects.get()
+    assert movie.year == 2004
+
+
+async def test_model_update_only_changed_fields() -> None:
+    await Movie(name="Downfall", year=2002).create()
+
+    movie = await Movie.objects.get()
+    await Movie.objects.filter(name="Downfall").update_many(tags=["war"])
+
+    await movie.update(year=2004)
+
+    movie = await Movie.objects.get()
+    assert movie.year == 2004
+    assert movie.tags == ["war"]
+
+
+async def test_partial_models_are_cached() -> None:
+    assert get_partial_model(Movie, ["year", "name"]) is get_partial_model(
+        Movie, ["name", "year"]
+    )
+    assert get_partial_model(Movie, ["year"]) is not get_partial_model(Movie, ["name"])
+
+
+async def test_model_update_inherited_fields() -> None:
+    class BaseMovie(Document):
+        name: str = mongoz.String()
+
+        class Meta:
+            abstract = True
+            registry = client
+            database = "test_db"
+
+    class Film(BaseMovie):
+        year: int = mongoz.Integer()
+
+    await Film.objects.delete()
+    film = await Film.objects.create(name="Downfall", year=2002)
+
+    await film.update(name="Der Untergang")
+    await Film.objects.filter(year=2002).update_many(name="Downfall", year=2004)
+
+    film = await Film.objects.get()
+    assert film.name == "Downfall"
+    assert film.year == 2004
+    await Film.objects.delete()
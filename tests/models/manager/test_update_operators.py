@@ -0,0 +1,116 @@
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import AddToSet, Document, Inc, Max, Min, Pull, Push, Update
+from mongoz.core.db.querysets.updates import compile_update
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    views: int = mongoz.Integer(default=0)
+    rating: float = mongoz.Double(default=0.0)
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    yield
+    await Movie.objects.delete()
+
+
+def test_compile_update() -> None:
+    update = compile_update(
+        Movie,
+        {
+            "year": 2004,
+            "views": Inc(1),
+            "rating": Max(7.5),
+            "tags": Push("war", "history"),
+        },
+    )
+    assert update == {
+        "$set": {"year": 2004},
+        "$inc": {"views": 1},
+        "$max": {"rating": 7.5},
+        "$push": {"tags": {"$each": ["war", "history"]}},
+    }
+
+    assert compile_update(Movie, {"tags": Pull("war", "drama")}) == {
+        "$pull": {"tags": {"$in": ["war", "drama"]}}
+    }
+
+
+def test_compile_update_validates_the_fields() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        compile_update(Movie, {"views": Inc("one")})
+
+    with pytest.raises(pydantic.ValidationError):
+        compile_update(Movie, {"tags": Push(["war"])})
+
+    with pytest.raises(ValueError):
+        compile_update(Movie, {"name": Inc(1)})
+
+    with pytest.raises(ValueError):
+        compile_update(Movie, {"director": Inc(1)})
+
+
+async def test_update_many_with_operators() -> None:
+    await Movie.objects.create(name="Downfall", year=2004, tags=["war"])
+    await Movie.objects.create(name="Boyhood", year=2014)
+
+    result = await Movie.objects.update_many(views=Inc(2))
+    assert result.modified_count == 2
+
+    movies = await Movie.objects.filter(name="Downfall").update(
+        views=Inc(1), tags=AddToSet("war", "history"), rating=Max(8.0)
+    )
+    assert movies[0].views == 3
+    assert movies[0].tags == ["war", "history"]
+    assert movies[0].rating == 8.0
+
+    await Movie.objects.filter(name="Downfall").update_many(rating=Max(7.0), year=Min(2000))
+    movie = await Movie.objects.get(name="Downfall")
+    assert movie.rating == 8.0
+    assert movie.year == 2000
+
+    boyhood = await Movie.objects.get(name="Boyhood")
+    assert boyhood.views == 2
+
+
+async def test_document_update_with_operators() -> None:
+    movie = await Movie.objects.create(name="Downfall", year=2004, tags=["war", "drama"])
+    # Changed by someone else after the document was loaded.
+    await Movie.objects.filter(name="Downfall").update_many(views=Inc(10))
+
+    movie.year = 2005
+    await movie.update(views=Inc(1), tags=Pull("drama"))
+
+    assert movie.views == 11
+    assert movie.tags == ["war"]
+    assert movie.get_changes() == {}
+
+    movie = await Movie.objects.get(name="Downfall")
+    assert movie.year == 2005
+    assert movie.views == 11
+
+
+async def test_bulk_write_with_operators() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    await Movie.objects.bulk_write([Update({"name": "Downfall"}, views=Inc(5))])
+
+    movie = await Movie.objects.get(name="Downfall")
+    assert movie.views == 5
@@ -0,0 +1,101 @@
+from typing import Any, AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+from pydantic import ValidationError
+from pymongo.errors import DuplicateKeyError
+
+import mongoz
+from mongoz import Document, Index
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        indexes = [Index("name", unique=True)]
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.drop_indexes(force=True)
+    await Movie.objects.delete()
+    await Movie.create_indexes()
+    yield
+    await Movie.drop_indexes(force=True)
+    await Movie.objects.delete()
+
+
+async def test_update_or_create() -> None:
+    movie = await Movie.objects.update_or_create(name="Barbie", defaults={"year": 2022})
+    assert movie.name == "Barbie"
+    assert movie.year == 2022
+    assert movie.tags is None
+
+    same = await Movie.objects.update_or_create(
+        name="Barbie", defaults={"year": 2023, "tags": ["comedy"]}
+    )
+    assert same.id == movie.id
+    assert same.year == 2023
+    assert same.tags == ["comedy"]
+
+    assert await Movie.objects.count() == 1
+
+
+async def test_update_or_create_missing_fields() -> None:
+    await Movie.objects.create(name="Barbie", year=2023)
+
+    # The year is required to create the document but not to update it.
+    movie = await Movie.objects.update_or_create(name="Barbie", defaults={"tags": ["comedy"]})
+    assert movie.year == 2023
+    assert movie.tags == ["comedy"]
+
+    with pytest.raises(ValidationError):
+        await Movie.objects.update_or_create(name="Oppenheimer", defaults={"tags": ["drama"]})
+
+    with pytest.raises(ValidationError):
+        await Movie.objects.update_or_create(name="Barbie", defaults={"year": "year 2023"})
+
+    with pytest.raises(ValueError):
+        await Movie.objects.update_or_create(name="Barbie", defaults={"director": "Gerwig"})
+
+
+async def test_upsert() -> None:
+    movie = await Movie.objects.filter(name="Barbie").upsert(year=2022)
+    assert movie.year == 2022
+
+    movie = await Movie.objects.filter(name="Barbie").upsert(year=2023)
+    assert movie.year == 2023
+
+    movies = await Movie.objects.all()
+    assert len(movies) == 1
+    assert movies[0].year == 2023
+
+
+async def test_update_or_create_retries_duplicate_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    collection = Movie.meta.collection._collection
+    find_one_and_update = collection.find_one_and_update
+    calls = []
+
+    async def racing_find_one_and_update(*args: Any, **kwargs: Any) -> Any:
+        calls.append(kwargs)
+        if len(calls) == 1:
+            # Another upsert creates the document first.
+            await Movie.objects.create(name="Barbie", year=2022)
+            raise DuplicateKeyError("E11000 duplicate key error")
+        return await find_one_and_update(*args, **kwargs)
+
+    monkeypatch.setattr(collection, "find_one_and_update", racing_find_one_and_update)
+
+    movie = await Movie.objects.update_or_create(name="Barbie", defaults={"year": 2023})
+    assert len(calls) == 2
+    assert movie.year == 2023
+    assert await Movie.objects.count() == 1
@@ -0,0 +1,166 @@
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Inc
+from mongoz.exceptions import ImproperlyConfigured, StaleDocumentError
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Account(Document):
+    name: str = mongoz.String()
+    balance: int = mongoz.Integer(default=0)
+    version: int = mongoz.Integer(default=0)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        version_field = "version"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Account.objects.delete()
+    yield
+    await Account.objects.delete()
+
+
+async def test_save_increments_version() -> None:
+    account = await Account.objects.create(name="Mongoz")
+    assert account.version == 0
+
+    account.balance = 10
+    await account.save()
+    assert account.version == 1
+
+    # Nothing changed, nothing is written.
+    await account.save()
+    assert account.version == 1
+
+    account = await Account.objects.get()
+    assert account.balance == 10
+    assert account.version == 1
+
+
+async def test_concurrent_save_raises_stale_document() -> None:
+    await Account.objects.create(name="Mongoz")
+
+    first = await Account.objects.get()
+    second = await Account.objects.get()
+
+    first.balance = 10
+    await first.save()
+
+    second.balance = 20
+    with pytest.raises(StaleDocumentError):
+        await second.save()
+
+    account = await Account.objects.get()
+    assert account.balance == 10
+    assert account.version == 1
+
+
+async def test_update_checks_version() -> None:
+    await Account.objects.create(name="Mongoz")
+
+    first = await Account.objects.get()
+    second = await Account.objects.get()
+
+    await first.update(balance=Inc(5))
+    assert first.balance == 5
+    assert first.version == 1
+
+    await first.update(name="Mongoz 2")
+    assert first.version == 2
+
+    with pytest.raises(StaleDocumentError):
+        await second.update(balance=Inc(5))
+
+    with pytest.raises(StaleDocumentError):
+        await second.update(name="Mongoz 3")
+
+    account = await Account.objects.get()
+    assert account.name == "Mongoz 2"
+    assert account.balance == 5
+    assert account.version == 2
+
+
+async def test_save_null_version() -> None:
+    await Account.meta.collection._collection.insert_one({"name": "Mongoz", "version": None})
+
+    account = await Account.objects.get()
+    account.balance = 10
+    await account.save()
+    assert account.version == 1
+
+    account = await Account.objects.get()
+    assert account.balance == 10
+    assert account.version == 1
+
+
+async def test_version_field_must_be_an_integer() -> None:
+    with pytest.raises(ImproperlyConfigured):
+
+        class Payment(Document):
+            amount: int = mongoz.Integer()
+            version: str = mongoz.String()
+
+            class Meta:
+                registry = client
+                database = "test_db"
+                version_field = "version"
+
+
+async def test_version_field_must_exist() -> None:
+    with pytest.raises(ImproperlyConfigured):
+
+        class Payment(Document):
+            amount: int = mongoz.Integer()
+
+            class Meta:
+                registry = client
+                database = "test_db"
+                version_field = "version"
+
+
+async def test_bulk_update_checks_version() -> None:
+    await Account.objects.create(name="Mongoz")
+    await Account.objects.create(name="Edgy")
+
+    accounts = await Account.objects.sort("name").all()
+    stale = await Account.objects.get(name="Mongoz")
+    stale.balance = 5
+    await stale.save()
+
+    for account in accounts:
+        account.balance = 10
+    with pytest.raises(StaleDocumentError):
+        await Account.objects.bulk_update(accounts, fields=["balance"])
+
+    edgy, mongoz_account = accounts
+    assert edgy.version == 1
+    assert edgy.get_changes() == {}
+    assert mongoz_account.version == 0
+
+    accounts = await Account.objects.sort("name").all()
+    assert [(account.balance, account.version) for account in accounts] == [(10, 1), (5, 1)]
+
+
+async def test_queryset_bulk_update_checks_version() -> None:
+    await Account.objects.create(name="Mongoz")
+
+    account = await Account.objects.get()
+    account.balance = 10
+    await Account.query().bulk_update([account], fields=["balance"])
+    assert account.version == 1
+
+    # Another writer made the same change, the update is still stale.
+    account.version = 0
+    account.take_snapshot(["version"])
+    with pytest.raises(StaleDocumentError):
+        await Account.query().bulk_update([account], fields=["balance"])
@@ -0,0 +1,159 @@
+from typing import AsyncGenerator
+
+import pydantic
+import pytest
+from pymongo.write_concern import WriteConcern
+
+import mongoz
+from mongoz import Document, UpdateResult
+from mongoz.core.connection.collections import to_write_concern, with_options
+from mongoz.exceptions import MongozException
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+class AuditLog(Document):
+    action: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        write_concern = {"w": 1, "j": False}
+
+
+class Click(Document):
+    name: str = mongoz.String()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        write_concern = 0
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    await AuditLog.objects.delete()
+    yield
+    await Movie.objects.delete()
+    await AuditLog.objects.delete()
+
+
+def test_to_write_concern() -> None:
+    assert to_write_concern(None) is None
+    assert to_write_concern(0) == WriteConcern(w=0)
+    assert to_write_concern("majority") == WriteConcern(w="majority")
+    assert to_write_concern({"w": 1, "j": True}) == WriteConcern(w=1, j=True)
+
+    write_concern = WriteConcern(w=1)
+    assert to_write_concern(write_concern) is write_concern
+
+    with pytest.raises(MongozException):
+        to_write_concern(True)
+
+
+def test_with_options_caches_the_write_concern_handles() -> None:
+    collection = Movie.meta.collection._collection
+
+    handle = with_options(collection, write_concern=WriteConcern(w=0))
+
+    assert handle.write_concern == WriteConcern(w=0)
+    assert handle is with_options(collection, write_concern=WriteConcern(w=0))
+    assert with_options(collection) is collection
+
+
+def test_meta_write_concern() -> None:
+    assert AuditLog.meta.write_concern == WriteConcern(w=1, j=False)
+    assert AuditLog.objects._collection.write_concern == WriteConcern(w=1, j=False)
+    assert AuditLog.query()._collection.write_concern == WriteConcern(w=1, j=False)
+    assert Movie.meta.write_concern is None
+
+
+async def test_document_write_concern() -> None:
+    movie = await Movie(name="Downfall", year=2004).create(write_concern=1)
+
+    movie.year = 2005
+    await movie.save(write_concern="majority")
+    await movie.update(name="Der Untergang", write_concern=WriteConcern(w=1))
+
+    stored = await Movie.objects.get(id=movie.id)
+    assert stored.name == "Der Untergang"
+    assert stored.year == 2005
+
+    assert await movie.delete(write_concern=1) == 1
+    assert await Movie.objects.count() == 0
+
+
+async def test_manager_write_concern() -> None:
+    await Movie.objects.create_many(
+        [Movie(name="Downfall", year=2004), Movie(name="Barbie", year=2023)], write_concern=1
+    )
+
+    result = await Movie.objects.filter(year=2004).update_many(year=2005, write_concern=1)
+    assert result.matched_count == 1
+    assert result.acknowledged
+
+    assert await Movie.objects.delete(write_concern=1) == 2
+
+
+async def test_unacknowledged_writes() -> None:
+    # The unacknowledged writes may be applied later, hence only touching
+    # documents no other test uses.
+    movie = await Movie(name="Unacknowledged", year=2004).create(write_concern=0)
+    assert movie.id is not None
+    manager = Movie.objects.filter(name="Unacknowledged")
+
+    result = await manager.update_many(year=2005, write_concern=0)
+    assert isinstance(result, UpdateResult)
+    assert not result.acknowledged
+    assert result.matched_count is None
+
+    with pytest.raises(MongozException):
+        await manager.update_many(returning="ids", year=2005, write_concern=0)
+
+    assert await movie.delete(write_concern=0) is None
+    assert await manager.delete(write_concern=0) is None
+
+
+async def test_queryset_unacknowledged_writes() -> None:
+    # The unacknowledged writes may be applied later, hence only touching
+    # documents no other test uses.
+    queryset = Click.query(Click.name == "Unacknowledged")
+
+    result = await queryset.update_many(name="Unacknowledged")
+    assert isinstance(result, UpdateResult)
+    assert not result.acknowledged
+    assert result.matched_count is None
+    assert result.modified_count is None
+
+    with pytest.raises(MongozException):
+        await Click.query().update_many(returning="documents", name="Unacknowledged")
+
+    assert await queryset.delete() is None
+
+
+async def test_queryset_update_many_write_concern() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+
+    result = await Movie.query(Movie.year == 2004).update_many(year=2005, write_concern=1)
+    assert result.matched_count == 1
+    assert result.acknowledged
+
+    result = await Movie.query(Movie.name == "Unacknowledged").update_many(
+        year=2005, write_concern=0
+    )
+    assert not result.acknowledged
+
+    with pytest.raises(MongozException):
+        await Movie.query().update_many(returning="ids", year=2005, write_concern=0)
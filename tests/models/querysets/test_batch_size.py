@@ -0,0 +1,48 @@
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Order
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+        batch_size = 2
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.query().delete()
+    yield
+    await Movie.query().delete()
+
+
+async def test_model_batch_size() -> None:
+    for year in range(2000, 2005):
+        await Movie(name=f"Movie {year}", year=year).create()
+
+    movies = await Movie.query().sort(Movie.year, Order.ASCENDING).all()
+    assert [movie.year for movie in movies] == list(range(2000, 2005))
+
+    movies = (
+        await Movie.query(Movie.year >= 2001)
+        .batch_size(3)
+        .sort(Movie.year, Order.ASCENDING)
+        .all()
+    )
+    assert [movie.year for movie in movies] == list(range(2001, 2005))
+
+    years = [movie.year async for movie in Movie.query().batch_size(1)]
+    assert sorted(years) == list(range(2000, 2005))
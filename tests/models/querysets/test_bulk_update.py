@@ -43,14 +43,15 @@ async def test_model_bulk_update_many() -> None:
     await Movie(name="Boyhood", year=2004).create()
     await Movie(name="Boyhood-2", year=2011).create()
 
-    movies = await Movie.query({Movie.year: 2004}).update_many(year=2010)
-    assert movies[0].year == 2010
+    result = await Movie.query({Movie.year: 2004}).update_many(year=2010)
+    assert result.matched_count == 1
+    assert result.modified_count == 1
 
     movies = await Movie.query().all()
     assert movies[0].year == 2010
 
     movies = await Movie.query({Movie.name: "Boyhood-2"}).update_many(
-        year=2010
+        year=2010, returning="documents"
     )
     assert len(movies) == 1
     assert movies[0].year == 2010
@@ -59,7 +60,7 @@ async def test_model_bulk_update_many() -> None:
     assert len(movies) == 2
 
     movies = await Movie.query({Movie.name: "Boyhood-2"}).update_many(
-        year=2014, name="Boyhood 2"
+        year=2014, name="Boyhood 2", returning="documents"
     )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
@@ -70,11 +71,16 @@ async def test_model_bulk_update_many() -> None:
         )
 
     movies = await Movie.query({Movie.name: "Boyhood 2"}).update_many(
-        test=2021
+        test=2021, returning="documents"
     )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
 
+    ids = await Movie.query({Movie.name: "Boyhood 2"}).update_many(
+        year=2015, returning="ids"
+    )
+    assert ids == [movies[0].id]
+
 
 async def test_model_bulk_update() -> None:
     await Movie(name="Boyhood", year=2004).create()
@@ -144,3 +150,22 @@ async def test_model_bulk_update_function() -> None:
     )
     assert movies[0].year == 2014
     assert movies[0].name == "Boyhood 2"
+
+
+async def test_model_bulk_update_documents() -> None:
+    movies = await Movie.objects.create_many(
+        [Movie(name=f"Movie {index}", year=2000 + index) for index in range(5)]
+    )
+
+    for movie in movies:
+        movie.year += 10
+        movie.tags = ["changed"]
+
+    result = await Movie.query().bulk_update(movies, fields=["year"], chunk_size=2)
+    assert result.matched_count == 5
+    assert result.modified_count == 5
+
+    movies = await Movie.query().sort(Movie.year, Order.ASCENDING).all()
+    assert [movie.year for movie in movies] == [2010, 2011, 2012, 2013, 2014]
+    # Only the given fields are written.
+    assert all(movie.tags is None for movie in movies)
@@ -0,0 +1,131 @@
+import asyncio
+from typing import AsyncGenerator, List
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, settings
+from mongoz.core.signals import Signal, post_save, pre_delete, signal_queue
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class User(Document):
+    name: str = mongoz.String(max_length=100)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await User.objects.delete()
+    yield
+    await signal_queue.close()
+    for signal in User.meta.signals.values():
+        signal.receivers.clear()
+        signal.background.clear()
+    await User.objects.delete()
+
+
+async def test_send_without_receivers() -> None:
+    signal = Signal()
+
+    await signal.send(sender=User, instance=None)
+
+    assert signal.receivers == {}
+
+
+async def test_background_receiver_does_not_block_send() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    names: List[str] = []
+
+    @post_save(User, background=True)
+    async def notify(sender, instance, **kwargs):
+        started.set()
+        await release.wait()
+        names.append(instance.name)
+
+    await User.objects.create(name="Mongoz")
+    await asyncio.wait_for(started.wait(), timeout=1)
+    assert names == []
+
+    release.set()
+    await signal_queue.drain()
+    assert names == ["Mongoz"]
+
+
+async def test_background_receiver_errors_are_isolated(caplog: pytest.LogCaptureFixture) -> None:
+    names: List[str] = []
+
+    @post_save(User, background=True)
+    async def fail(sender, instance, **kwargs):
+        raise ValueError("receiver failed")
+
+    @post_save(User)
+    async def notify(sender, instance, **kwargs):
+        names.append(instance.name)
+
+    user = await User.objects.create(name="Mongoz")
+    await signal_queue.drain()
+
+    assert user.id is not None
+    assert names == ["Mongoz"]
+    assert "failed" in caplog.text
+
+
+async def test_background_receiver_timeout(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(settings, "signal_timeout", 0.01)
+    names: List[str] = []
+
+    @pre_delete(User, background=True)
+    async def slow(sender, instance, **kwargs):
+        await asyncio.sleep(1)
+        names.append(instance.name)
+
+    user = await User.objects.create(name="Mongoz")
+    await user.delete()
+    await signal_queue.drain()
+
+    assert names == []
+    assert "timed out" in caplog.text
+
+
+async def test_background_queue_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "signal_queue_maxsize", 2)
+    monkeypatch.setattr(settings, "signal_workers", 1)
+    release = asyncio.Event()
+    names: List[str] = []
+
+    @post_save(User, background=True)
+    async def notify(sender, instance, **kwargs):
+        await release.wait()
+        names.append(instance.name)
+
+    users = [User(name=f"user-{index}") for index in range(4)]
+    for user in users[:3]:
+        await user.create()
+
+    create = asyncio.ensure_future(users[3].create())
+    await asyncio.sleep(0.01)
+    assert not create.done()
+
+    release.set()
+    await create
+    await signal_queue.close()
+    assert names == [user.name for user in users]
+
+
+async def test_disconnect_background_receiver() -> None:
+    async def notify(sender, **kwargs): ...
+
+    User.meta.signals.post_save.connect(notify, background=True)
+    assert User.meta.signals.post_save.disconnect(notify)
+    assert User.meta.signals.post_save.background == set()
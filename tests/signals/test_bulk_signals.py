@@ -0,0 +1,164 @@
+from typing import Any, AsyncGenerator, List, Tuple
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Inc
+from mongoz.core.db.querysets.core import manager as manager_module
+from mongoz.core.signals import (
+    post_bulk_create,
+    post_bulk_delete,
+    post_bulk_update,
+    pre_bulk_create,
+    pre_bulk_delete,
+    pre_bulk_update,
+)
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Event(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Event.objects.delete()
+    yield
+    for name in ("create", "update", "delete"):
+        for signal in (f"pre_bulk_{name}", f"post_bulk_{name}"):
+            getattr(Event.meta.signals, signal).receivers.clear()
+    await Event.objects.delete()
+
+
+def events(count: int) -> List[Event]:
+    return [Event(name=f"event-{index}", year=1990 + index) for index in range(count)]
+
+
+async def test_bulk_create_signals() -> None:
+    calls: List[Tuple[str, List[Any]]] = []
+
+    @pre_bulk_create(Event)
+    async def before(sender, instances, **kwargs):
+        assert sender is Event
+        calls.append(("pre", [instance.id for instance in instances]))
+
+    @post_bulk_create(Event)
+    async def after(sender, instances, **kwargs):
+        calls.append(("post", [instance.id for instance in instances]))
+
+    created = await Event.objects.create_many(events(25), chunk_size=10)
+
+    assert [(name, len(ids)) for name, ids in calls] == [
+        ("pre", 10),
+        ("post", 10),
+        ("pre", 10),
+        ("post", 10),
+        ("pre", 5),
+        ("post", 5),
+    ]
+    assert all(id is None for name, ids in calls if name == "pre" for id in ids)
+    assert [id for name, ids in calls if name == "post" for id in ids] == [
+        event.id for event in created
+    ]
+
+
+async def test_bulk_update_signals() -> None:
+    await Event.objects.create_many(events(25))
+    calls: List[Tuple[str, List[Any], Any]] = []
+
+    @pre_bulk_update(Event)
+    async def before(sender, ids, update, **kwargs):
+        calls.append(("pre", ids, update))
+
+    @post_bulk_update(Event)
+    async def after(sender, ids, update, **kwargs):
+        years = {event.year for event in await Event.objects.filter(id__in=ids)}
+        calls.append(("post", ids, years))
+
+    result = await Event.objects.filter(year__lt=2010).update_many(year=Inc(100))
+
+    assert result.matched_count == 20
+    assert result.modified_count == 20
+    assert [name for name, _, _ in calls] == ["pre", "post"]
+    assert calls[0][1] == calls[1][1]
+    assert len(calls[0][1]) == 20
+    assert calls[0][2] == {"$inc": {"year": 100}}
+    assert calls[1][2] == set(range(2090, 2110))
+
+
+async def test_bulk_update_signals_with_ids() -> None:
+    await Event.objects.create_many(events(25))
+    batches: List[List[Any]] = []
+
+    @post_bulk_update(Event)
+    async def after(sender, ids, **kwargs):
+        batches.append(ids)
+
+    ids = await Event.objects.update_many(returning="ids", name="renamed")
+
+    assert batches == [ids]
+    assert await Event.objects.filter(name="renamed").count() == 25
+
+
+async def test_bulk_delete_signals(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(manager_module, "BULK_CHUNK_SIZE", 10)
+    created = await Event.objects.create_many(events(25))
+    calls: List[Tuple[str, List[Any]]] = []
+
+    @pre_bulk_delete(Event)
+    async def before(sender, ids, **kwargs):
+        calls.append(("pre", ids))
+
+    @post_bulk_delete(Event)
+    async def after(sender, ids, **kwargs):
+        assert await Event.objects.filter(id__in=ids).count() == 0
+        calls.append(("post", ids))
+
+    assert await Event.objects.delete() == 25
+
+    assert [(name, len(ids)) for name, ids in calls] == [
+        ("pre", 10),
+        ("post", 10),
+        ("pre", 10),
+        ("post", 10),
+        ("pre", 5),
+        ("post", 5),
+    ]
+    assert [id for name, ids in calls if name == "post" for id in ids] == sorted(
+        event.id for event in created
+    )
+
+
+async def test_bulk_delete_signals_with_batch_size() -> None:
+    await Event.objects.create_many(events(25))
+    batches: List[int] = []
+
+    @post_bulk_delete(Event)
+    async def after(sender, ids, **kwargs):
+        batches.append(len(ids))
+
+    assert await Event.objects.filter(year__lt=2010).delete(batch_size=8) == 20
+    assert batches == [8, 8, 4]
+
+
+async def test_no_bulk_signals_without_receivers() -> None:
+    calls: List[str] = []
+
+    @pre_bulk_create(Event)
+    async def before(sender, instances, **kwargs):
+        calls.append("create")
+
+    await Event.objects.create_many(events(5))
+    await Event.objects.update_many(name="renamed")
+    await Event.objects.delete()
+
+    assert calls == ["create"]
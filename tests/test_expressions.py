@@ -0,0 +1,74 @@
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Expression, Q
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Award(mongoz.EmbeddedDocument):
+    name: str = mongoz.String()
+
+
+def test_compile_is_cached() -> None:
+    expression = Q.gte("year", 2000)
+
+    compiled = expression.compile()
+    assert compiled == {"year": {"$gte": 2000}}
+    assert expression.compile() is compiled
+
+
+def test_reassigning_drops_the_cache() -> None:
+    expression = Q.gte("year", 2000)
+    compiled = expression.compile()
+
+    expression.value = 2010
+    assert expression.compile() is not compiled
+    assert expression.compile() == {"year": {"$gte": 2010}}
+
+
+def test_compile_many_does_not_mutate_cached_fragments() -> None:
+    first = Q.gte("year", 2000)
+    second = Q.gte("year", 2010)
+
+    assert Expression.compile_many([first, second]) == {"year": {"$gte": 2010}}
+    assert first.compile() == {"year": {"$gte": 2000}}
+    assert second.compile() == {"year": {"$gte": 2010}}
+
+
+def test_nested_expressions_are_compiled_once() -> None:
+    inner = Q.or_(Q.eq("name", "Downfall"), Q.eq("year", 2004))
+    outer = Q.and_(inner, Q.gt("year", 2000))
+
+    assert outer.compile() == {
+        "$and": [
+            {"$or": [{"name": {"$eq": "Downfall"}}, {"year": {"$eq": 2004}}]},
+            {"year": {"$gt": 2000}},
+        ]
+    }
+    # The compiled clauses of the inner expression are reused by the outer one.
+    assert outer.compile()["$and"][0]["$or"][0] is inner.compile()["$or"][0]
+    assert Expression.compile_many([outer]) == {
+        "year": {"$gt": 2000},
+        "$or": [{"name": {"$eq": "Downfall"}}, {"year": {"$eq": 2004}}],
+    }
+
+
+def test_embedded_values_are_dumped() -> None:
+    award = Award(name="Oscar")
+
+    assert Q.eq("award", award).compile() == {"award": {"$eq": {"name": "Oscar"}}}
+    assert Q.in_("awards", [award, award]).compile() == {
+        "awards": {"$in": [{"name": "Oscar"}, {"name": "Oscar"}]}
+    }
+    assert Q.eq("name", "Oscar").compile() == {"name": {"$eq": "Oscar"}}
+
+
+def test_compile_many_with_many_clauses() -> None:
+    expressions = [Q.gte(f"field_{index}", index) for index in range(25)]
+
+    query = Expression.compile_many(expressions)
+    assert len(query) == 25
+    assert query == Expression.compile_many(expressions)
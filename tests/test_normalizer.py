@@ -0,0 +1,166 @@
+from datetime import date, datetime
+from typing import AsyncGenerator, List, Optional
+
+import pydantic
+import pytest
+
+import mongoz
+from mongoz import Document, Expression, Q
+from mongoz.core.db.querysets.normalizer import normalize
+from tests.conftest import client
+
+pytestmark = pytest.mark.anyio
+pydantic_version = pydantic.__version__[:3]
+
+
+class Movie(Document):
+    name: str = mongoz.String()
+    year: int = mongoz.Integer()
+    released_at: Optional[datetime] = mongoz.DateTime(null=True)
+    tags: Optional[List[str]] = mongoz.Array(str, null=True)
+
+    class Meta:
+        registry = client
+        database = "test_db"
+
+
+@pytest.fixture(scope="function", autouse=True)
+async def prepare_database() -> AsyncGenerator:
+    await Movie.objects.delete()
+    yield
+    await Movie.objects.delete()
+
+
+def test_merge_ranges_on_same_field() -> None:
+    query = Expression.compile_many(
+        [Movie.year > 2000, Movie.year > 2005, Movie.year <= 2010, Movie.year <= 2020]
+    )
+    assert query == {"year": {"$gt": 2005, "$lte": 2010}}
+
+
+def test_date_lookup_is_a_single_range() -> None:
+    manager = Movie.objects.filter(released_at__date=date(2023, 1, 1))
+    query = Expression.compile_many(manager._filter)
+
+    assert query == {
+        "released_at": {
+            "$gte": datetime(2023, 1, 1),
+            "$lt": datetime(2023, 1, 2),
+        }
+    }
+
+
+def test_flatten_nested_and_or() -> None:
+    query = Expression.compile_many(
+        [
+            Q.and_(Q.and_(Movie.name == "Downfall", Movie.year > 2000), Movie.year > 2003),
+            Q.or_(Q.or_(Movie.year == 2004, Movie.year == 2005), Movie.name == "Boyhood"),
+        ]
+    )
+
+    assert query == {
+        "name": {"$eq": "Downfall"},
+        "year": {"$gt": 2003},
+        "$or": [
+            {"year": {"$eq": 2004}},
+            {"year": {"$eq": 2005}},
+            {"name": {"$eq": "Boyhood"}},
+        ],
+    }
+
+
+def test_single_in_becomes_eq() -> None:
+    assert Expression.compile_many([Q.in_(Movie.year, [2004])]) == {"year": {"$eq": 2004}}
+    assert Expression.compile_many([Q.not_in(Movie.year, [2004])]) == {"year": {"$ne": 2004}}
+    assert Expression.compile_many([Q.in_(Movie.year, [2004, 2005])]) == {
+        "year": {"$in": [2004, 2005]}
+    }
+
+
+def test_remove_duplicates() -> None:
+    manager = Movie.objects.filter(name="Downfall").filter(name="Downfall", year=2004)
+    query = Expression.compile_many(manager._filter)
+
+    assert query == {"name": {"$eq": "Downfall"}, "year": {"$eq": 2004}}
+
+
+def test_conflicting_values_are_anded() -> None:
+    query = Expression.compile_many([Movie.name == "Downfall", Movie.name == "Boyhood"])
+
+    assert query == {
+        "name": {"$eq": "Downfall"},
+        "$and": [{"name": {"$eq": "Boyhood"}}],
+    }
+
+
+def test_multiple_or_are_anded() -> None:
+    query = Expression.compile_many(
+        [
+            Q.or_(Movie.name == "Downfall", Movie.year == 2004),
+            Q.or_(Movie.name == "Boyhood", Movie.year == 2010),
+        ]
+    )
+
+    assert query == {
+        "$or": [{"name": {"$eq": "Downfall"}}, {"year": {"$eq": 2004}}],
+        "$and": [{"$or": [{"name": {"$eq": "Boyhood"}}, {"year": {"$eq": 2010}}]}],
+    }
+
+
+def test_canonical_order() -> None:
+    first = Expression.compile_many([Movie.year == 2004, Movie.name == "Downfall"])
+    second = Expression.compile_many([Movie.name == "Downfall", Movie.year == 2004])
+
+    assert list(first) == list(second) == ["name", "year"]
+
+
+def test_normalize_raw_query() -> None:
+    query = normalize(
+        {"$and": [{"$and": [{"year": {"$gte": 1990}}]}, {"year": {"$gte": 2000, "$lt": 2010}}]}
+    )
+    assert query == {"year": {"$gte": 2000, "$lt": 2010}}
+    assert normalize({}) == {}
+    assert Expression.compile_many(
+        Expression.unpack({"$or": [{"name": "Downfall"}, {"$or": [{"year": {"$gt": 2005}}]}]})
+    ) == {"$or": [{"name": "Downfall"}, {"year": {"$gt": 2005}}]}
+    assert normalize({"$or": [{}, {"year": 2004}]}) == {}
+
+
+def test_bounds_of_different_types_are_kept() -> None:
+    query = normalize({"a": {"$gt": True}, "$and": [{"a": {"$gt": 2}}]})
+    assert query == {"a": {"$gt": True}, "$and": [{"a": {"$gt": 2}}]}
+
+    query = normalize({"a": {"$eq": 1}, "$and": [{"a": {"$eq": True}}]})
+    assert query == {"a": {"$eq": 1}, "$and": [{"a": {"$eq": True}}]}
+
+    query = normalize({"a": {"$lt": "b"}, "$and": [{"a": {"$lt": 2}}]})
+    assert query == {"a": {"$lt": "b"}, "$and": [{"a": {"$lt": 2}}]}
+
+    assert normalize({"a": {"$gt": 1}, "$and": [{"a": {"$gt": 2.5}}]}) == {"a": {"$gt": 2.5}}
+
+
+def test_nested_nor_is_not_flattened() -> None:
+    query = {"$nor": [{"$nor": [{"a": 1}, {"b": 2}]}, {"c": 3}]}
+
+    assert normalize(query) == query
+
+
+async def test_normalized_queries_results() -> None:
+    await Movie.objects.create(name="Downfall", year=2004)
+    await Movie.objects.create(name="Boyhood", year=2010)
+    await Movie.objects.create(name="The Two Towers", year=2002)
+
+    movies = await Movie.objects.filter(year__gt=2000).filter(year__gt=2003).filter(year__lt=2011)
+    assert len(movies) == 2
+
+    movies = await Movie.objects.filter(year__in=[2004])
+    assert len(movies) == 1
+    assert movies[0].name == "Downfall"
+
+    movies = await Movie.query(
+        Q.or_(Q.or_(Movie.year == 2002, Movie.year == 2004), Movie.name == "Boyhood")
+    ).all()
+    assert len(movies) == 3
+
+    count = await Movie.objects.filter(name="Downfall").filter(name="Boyhood").count()
+    assert count == 0